@@ -4,16 +4,20 @@ echo  E/R Fan Control System - Dashboard Launcher
 echo ================================================
 echo.
 
-echo [1/3] Killing all Python processes...
+echo [1/4] Killing all Python processes...
 taskkill /F /IM python.exe >nul 2>&1
 timeout /t 2 /nobreak >nul
 echo      Done!
 
-echo [2/3] Clearing Python cache...
+echo [2/4] Clearing Python cache...
 python -Bc "import pathlib; import shutil; [shutil.rmtree(p) for p in pathlib.Path('.').rglob('__pycache__')]" 2>nul
 echo      Done!
 
-echo [3/3] Starting dashboard...
+echo [3/4] Installing src package (pip install -e .)...
+pip show ess-ai-system >nul 2>&1 || pip install -e . >nul
+echo      Done!
+
+echo [4/4] Starting dashboard...
 echo.
 echo ================================================
 echo  Dashboard starting on http://localhost:8501
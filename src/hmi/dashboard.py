@@ -3,19 +3,19 @@ Streamlit 기반 HMI 대시보드
 실시간 모니터링 및 제어 인터페이스
 """
 
+import time
 import streamlit as st
+import streamlit.components.v1 as components
 from streamlit_autorefresh import st_autorefresh
-import time
+from collections import Counter, deque
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Dict, List, Optional
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from src.hmi.hmi_state_manager import (
     HMIStateManager,
@@ -23,6 +23,12 @@ from src.hmi.hmi_state_manager import (
     AlarmPriority,
     ForceMode60HzState
 )
+from src.hmi.dashboard_common import (
+    SIDEBAR_CLOCK_HTML,
+    SIDEBAR_CLOCK_HEIGHT,
+    TEMP_TREND_TRACES,
+    build_temperature_trend_fig
+)
 from src.gps.gps_processor import GPSData, SeaRegion, Season, NavigationState
 from src.diagnostics.vfd_monitor import DanfossStatusBits, VFDStatus
 from src.diagnostics.vfd_predictive_diagnosis import VFDPredictiveDiagnosis
@@ -31,6 +37,710 @@ from src.simulation.scenarios import SimulationScenarios, ScenarioType
 from src.control.integrated_controller import IntegratedController
 
 
+# 그룹별 AI 제어 기본 주파수 (Hz)
+_AI_FREQUENCY = {
+    "SW_PUMPS": 48.4,
+    "FW_PUMPS": 48.4,
+    "ER_FANS": 47.3
+}
+
+# 제어 그룹 키 → 표시 이름 (제어 패널/주파수 비교 테이블 순서)
+_CONTROL_GROUPS = {
+    "SW_PUMPS": "SW 펌프",
+    "FW_PUMPS": "FW 펌프",
+    "ER_FANS": "E/R 팬"
+}
+
+# 실제 주파수 시뮬레이션 대상 장비 ID (펌프는 2대, 팬은 3대 운전 가정)
+_SIMULATED_RUNNING_IDS = {
+    group_key: tuple(f"{group_key}_{i}" for i in range(1, running + 1))
+    for group_key, running in (("SW_PUMPS", 2), ("FW_PUMPS", 2), ("ER_FANS", 3))
+}
+
+# 그룹별 마지막 (제어 모드, 목표 주파수) 세션 키
+_LAST_EXPECTED_KEYS = {group_key: f"_last_expected_{group_key}" for group_key in _CONTROL_GROUPS}
+
+# 알람 필터 라벨 → 우선순위
+_EMOJI_TO_PRIORITY = {
+    "🔴 CRITICAL": AlarmPriority.CRITICAL,
+    "🟡 WARNING": AlarmPriority.WARNING,
+    "🔵 INFO": AlarmPriority.INFO
+}
+
+# 알람 우선순위 → (아이콘, 배경색)
+_ALARM_STYLE = {
+    AlarmPriority.CRITICAL: ("🔴", "#ffcccc"),
+    AlarmPriority.WARNING: ("🟡", "#fff4cc"),
+    AlarmPriority.INFO: ("🔵", "#cce5ff")
+}
+
+# 전역 CSS (제어 패널 버튼, 시나리오 버튼, 탭 스타일)
+_GLOBAL_CSS = """
+<style>
+/* 제어 패널 버튼 고정 너비 */
+.stButton button {
+    width: 85px !important;
+    min-width: 85px !important;
+    max-width: 85px !important;
+}
+
+/* 60Hz 선택 버튼 - 회색 */
+button[kind="secondary"]:has(*:contains("◉ 60Hz")) {
+    background-color: #78909C !important;
+    color: white !important;
+    border-color: #78909C !important;
+}
+
+/* AI 선택 버튼 - 녹색 */
+button[kind="secondary"]:has(*:contains("◉ AI")) {
+    background-color: #66BB6A !important;
+    color: white !important;
+    border-color: #66BB6A !important;
+}
+
+/* 시나리오 선택 버튼 스타일 */
+button:has(*:contains("기본 제어 검증")),
+button:has(*:contains("고부하 제어 검증")),
+button:has(*:contains("냉각기 과열 보호 검증")),
+button:has(*:contains("압력 안전 제어 검증")) {
+    white-space: nowrap !important;
+    min-width: 120px !important;
+    width: auto !important;
+    max-width: none !important;
+    min-height: 45px !important;
+    height: auto !important;
+    padding: 0.5rem 1.5rem !important;
+    font-size: 1rem !important;
+}
+
+/* 탭 중복 렌더링 방지 */
+.stTabs [data-baseweb="tab-list"] {
+    gap: 8px;
+}
+
+.stTabs [data-baseweb="tab"] {
+    height: 50px;
+    white-space: pre-wrap;
+    background-color: transparent;
+}
+</style>
+"""
+
+# 알람 필터 Multiselect 스타일
+_ALARM_FILTER_CSS = """
+<style>
+/* Multiselect 선택된 항목 스타일 */
+.stMultiSelect span[data-baseweb="tag"] {
+    background-color: #E8EAF6 !important;
+    color: #3F51B5 !important;
+    border: 1px solid #C5CAE9 !important;
+}
+
+/* X 버튼 색상 */
+.stMultiSelect span[data-baseweb="tag"] button {
+    color: #5C6BC0 !important;
+}
+</style>
+"""
+
+# 이 개수 이상이면 알람을 카드 대신 테이블 하나로 표시
+_ALARM_TABLE_THRESHOLD = 10
+
+# VFD 상태 등급 → (아이콘, 표시 문구)
+_VFD_STYLE = {
+    VFDStatus.NORMAL: ("🟢", "정상"),
+    VFDStatus.CAUTION: ("🟡", "주의"),
+    VFDStatus.WARNING: ("🟠", "경고"),
+    VFDStatus.CRITICAL: ("🔴", "위험")
+}
+
+# VFD 상태 요약 열: (라벨, 상태 등급) - '전체 VFD' 열 다음에 이 순서로 표시
+_VFD_SUMMARY_GRADES = (
+    ("🟢 정상", VFDStatus.NORMAL),
+    ("🟡 주의", VFDStatus.CAUTION),
+    ("🟠 경고", VFDStatus.WARNING),
+    ("🔴 위험", VFDStatus.CRITICAL)
+)
+
+# VFD 예방진단 온도 추세 → 카드 아이콘 / 상세 표시 문구 (알 수 없는 값은 안정으로 표시)
+_TEMP_TREND_ICON = {
+    'rising': '↑',
+    'falling': '↓',
+    'stable': '→'
+}
+_TEMP_TREND_LABEL = {
+    'rising': '↑ 상승',
+    'falling': '↓ 하강',
+    'stable': '→ 안정'
+}
+
+# 상세 진단 Status Bits 표시: (속성명, 라벨, 반전 여부 - True면 비트가 꺼져 있어야 정상)
+_STATUS_BIT_ROWS = (
+    ("control_ready", "Control Ready", False),
+    ("drive_ready", "Drive Ready", False),
+    ("in_operation", "In Operation", False),
+    ("trip", "No Trip", True),
+    ("error", "No Error", True),
+    ("warning", "No Warning", True)
+)
+
+# GPS 해역 → (표시 함수, 라벨, 위도 범위 설명)
+_SEA_REGION_DISPLAY = {
+    SeaRegion.TROPICAL: (st.success, "🌴 열대 (Tropical)", "위도 ±23.5° 이내"),
+    SeaRegion.TEMPERATE: (st.info, "🌊 온대 (Temperate)", "위도 23.5° ~ 66.5°"),
+    SeaRegion.POLAR: (st.error, "❄️ 극지 (Polar)", "위도 66.5° 이상")
+}
+
+# GPS 계절 → 표시 문구
+_SEASON_LABEL = {
+    Season.SPRING: "🌸 봄",
+    Season.SUMMER: "☀️ 여름",
+    Season.AUTUMN: "🍂 가을",
+    Season.WINTER: "❄️ 겨울"
+}
+
+# VFD 그룹 표시 순서: (ID 접두어, 대수, 제목)
+_VFD_GROUPS = (
+    ("SW_PUMP", 3, "**SW 펌프 (132kW x 3대)**"),
+    ("FW_PUMP", 3, "**FW 펌프 (75kW x 3대)**"),
+    ("ER_FAN", 4, "**E/R 팬 (54.3kW x 4대)**")
+)
+
+# VFD 그룹별 ID (카드 열 순서)
+_VFD_GROUP_IDS = {
+    prefix: tuple(f"{prefix}_{i}" for i in range(1, count + 1))
+    for prefix, count, _ in _VFD_GROUPS
+}
+
+# VFD ID 접두어 → HMI 장비 그룹 키
+_VFD_PREFIX_TO_GROUP = {"SW_PUMP": "SW_PUMPS", "FW_PUMP": "FW_PUMPS", "ER_FAN": "ER_FANS"}
+
+# VFD 시뮬레이션 대상 (VFD ID → HMI 장비 그룹 키, _VFD_GROUPS 순서)
+_VFD_TO_GROUP = {
+    vfd_id: _VFD_PREFIX_TO_GROUP[prefix]
+    for prefix, vfd_ids in _VFD_GROUP_IDS.items()
+    for vfd_id in vfd_ids
+}
+_VFD_IDS = tuple(_VFD_TO_GROUP)
+
+# VFD 시뮬레이션 운전 여부 (각 그룹 1/2번, E/R 팬은 3번까지)
+_VFD_SIM_RUNNING = np.array([
+    vfd_id.endswith("1") or vfd_id.endswith("2") or (vfd_id.startswith("ER") and vfd_id.endswith("3"))
+    for vfd_id in _VFD_IDS
+])
+
+
+# 운전 시간 균등화 시뮬레이션 데이터
+_RUNTIME_DATA = [
+    {"장비": "SW-P1", "총 운전 시간": 1250, "금일 운전 시간": 18.5, "연속 운전 시간": 6.2, "정비 예정": "250시간 후"},
+    {"장비": "SW-P2", "총 운전 시간": 1180, "금일 운전 시간": 5.5, "연속 운전 시간": 0.0, "정비 예정": "320시간 후"},
+    {"장비": "SW-P3", "총 운전 시간": 1220, "금일 운전 시간": 0.0, "연속 운전 시간": 0.0, "정비 예정": "280시간 후"},
+    {"장비": "FW-P1", "총 운전 시간": 1270, "금일 운전 시간": 18.5, "연속 운전 시간": 6.2, "정비 예정": "230시간 후"},
+    {"장비": "FW-P2", "총 운전 시간": 1190, "금일 운전 시간": 5.5, "연속 운전 시간": 0.0, "정비 예정": "310시간 후"},
+    {"장비": "FW-P3", "총 운전 시간": 1230, "금일 운전 시간": 0.0, "연속 운전 시간": 0.0, "정비 예정": "270시간 후"},
+    {"장비": "ER-F1", "총 운전 시간": 1100, "금일 운전 시간": 5.2, "연속 운전 시간": 2.1, "정비 예정": "400시간 후"},
+    {"장비": "ER-F2", "총 운전 시간": 1050, "금일 운전 시간": 5.3, "연속 운전 시간": 2.1, "정비 예정": "450시간 후"},
+    {"장비": "ER-F3", "총 운전 시간": 1075, "금일 운전 시간": 5.1, "연속 운전 시간": 2.1, "정비 예정": "425시간 후"},
+    {"장비": "ER-F4", "총 운전 시간": 1080, "금일 운전 시간": 0.0, "연속 운전 시간": 0.0, "정비 예정": "420시간 후"},
+]
+_RUNTIME_TABLE = pa.Table.from_pylist(_RUNTIME_DATA)
+
+# 수동 개입 장비 목록
+_EQUIPMENT_IDS = [row["장비"] for row in _RUNTIME_DATA]
+
+# 시나리오 선택 라벨 → 시나리오 타입
+_SCENARIO_OPTIONS = {
+    "기본 제어 검증": ScenarioType.NORMAL_OPERATION,
+    "SW 펌프 제어 검증": ScenarioType.HIGH_LOAD,
+    "FW 펌프 제어 검증": ScenarioType.COOLING_FAILURE,
+    "압력 안전 제어 검증": ScenarioType.PRESSURE_DROP,
+    "E/R 온도 제어 검증": ScenarioType.ER_VENTILATION
+}
+_SCENARIO_LABELS = {stype: label for label, stype in _SCENARIO_OPTIONS.items()}
+_SCENARIO_OPTION_KEYS = list(_SCENARIO_OPTIONS)
+
+# 시나리오 설명 (탭 하단 expander)
+_SCENARIO_DESCRIPTIONS = {
+    "기본 제어 검증": {
+        "조건": "열대 해역, 75% 엔진 부하",
+        "예상 온도": "T5=33°C, T6=43°C (정상 범위)",
+        "예상 압력": "PX1=2.0 bar (정상)",
+        "AI 대응": "현재 상태 유지, 효율 최적화"
+    },
+    "고부하 제어 검증": {
+        "조건": "고속 항해, 95% 엔진 부하",
+        "예상 온도": "T5=35°C, T6=46°C (점진적 상승)",
+        "예상 압력": "PX1=2.0 bar",
+        "AI 대응": "펌프/팬 증속으로 냉각 강화"
+    },
+    "냉각기 과열 보호 검증": {
+        "조건": "냉각 성능 저하",
+        "예상 온도": "T5=40°C, T6=52°C (급격한 상승)",
+        "예상 압력": "PX1=2.0 bar",
+        "AI 대응": "최대 냉각, 알람 발생"
+    },
+    "압력 안전 제어 검증": {
+        "조건": "SW 펌프 압력 저하 (2분간 2.0→0.7bar)",
+        "예상 온도": "T5=33°C (낮음, 정상이면 감속 가능)",
+        "예상 압력": "PX1: 2.0 → 1.5 (1분) → 0.7 (2분)",
+        "AI 대응": "1.0bar 통과 후 주파수 감소 금지 (안전 제약)"
+    },
+    "E/R 온도 제어 검증": {
+        "조건": "기관실 환기 불량 (T6만 상승)",
+        "예상 온도": "T6: 43°C → 48°C (7분간 점진적 상승), 기타 온도 정상",
+        "예상 압력": "PX1=2.0 bar (정상)",
+        "AI 대응": "E/R 팬 주파수/대수 증가로 기관실 냉각"
+    }
+}
+
+# 설명 항목을 expander 하나당 markdown 한 번으로 렌더링하도록 미리 조합
+_SCENARIO_DESCRIPTION_MARKDOWN = {
+    name: "\n\n".join(f"**{key}**: {value}" for key, value in desc.items())
+    for name, desc in _SCENARIO_DESCRIPTIONS.items()
+}
+
+# 시나리오 타입 → 설명 제목 (_SCENARIO_OPTIONS와 같은 순서)
+_SCENARIO_DESCRIPTION_NAMES = dict(zip(_SCENARIO_OPTIONS.values(), _SCENARIO_DESCRIPTIONS))
+
+# 선택된 시나리오 타입 → 나머지 시나리오 설명 (markdown 한 번으로 렌더링)
+_SCENARIO_OTHER_DESCRIPTIONS_MARKDOWN = {
+    stype: "\n\n".join(
+        f"##### 📌 {name}\n\n{body}"
+        for name, body in _SCENARIO_DESCRIPTION_MARKDOWN.items()
+        if name != _SCENARIO_DESCRIPTION_NAMES[stype]
+    )
+    for stype in _SCENARIO_DESCRIPTION_NAMES
+}
+
+
+# 시나리오 강조 카드: 팔레트 → (배경, 그림자 색, 글자 색)
+_CARD_PALETTES = {
+    "blue": ("linear-gradient(135deg, #667eea 0%, #764ba2 100%)", "rgba(102,126,234,0.3)", "white"),
+    "pink": ("linear-gradient(135deg, #f093fb 0%, #f5576c 100%)", "rgba(240,147,251,0.3)", "white"),
+    "yellow": ("linear-gradient(135deg, #fa709a 0%, #fee140 100%)", "rgba(250,112,154,0.3)", "#333")
+}
+
+# 강조 카드 변화량 색상 (상승: 빨강, 하강: 초록, 변화 없음: 노랑)
+_BAD_COLOR, _GOOD_COLOR, _NEUTRAL_COLOR = '#ff6b6b', '#51cf66', '#ffd93d'
+
+# 부호(0, +1, -1) → 색상 (-1은 튜플 마지막 항목)
+_CHANGE_COLORS = (_NEUTRAL_COLOR, _BAD_COLOR, _GOOD_COLOR)
+
+
+def _change_color(change: float) -> str:
+    """주파수 변화량 부호에 따른 강조 카드 delta 색상"""
+    return _CHANGE_COLORS[(change > 0) - (change < 0)]
+
+
+def _emphasis_card_html(label: str, value: str, delta: str, delta_color: str,
+                        palette: str, sub_text: str = "") -> str:
+    """시나리오 강조 카드 HTML 생성"""
+    background, shadow, text_color = _CARD_PALETTES[palette]
+    sub_line = (
+        f"<p style='color: {text_color}; font-size: 20px; margin: 5px 0; font-weight: 600;'>{sub_text}</p>"
+        if sub_text else ""
+    )
+    return f"""
+<div style='background: {background}; padding: 20px; border-radius: 10px; text-align: center; box-shadow: 0 8px 16px {shadow};'>
+    <p style='color: {text_color}; font-size: 14px; margin: 0; font-weight: 600;'>⭐ {label}</p>
+    <p style='color: {text_color}; font-size: 36px; margin: 10px 0; font-weight: 700;'>{value}</p>
+    {sub_line}<p style='color: {delta_color}; font-size: 16px; margin: 0; font-weight: 600;'>{delta}</p>
+</div>
+"""
+
+
+# 제어기 입력 온도 센서
+_TEMP_KEYS = ('T1', 'T2', 'T3', 'T4', 'T5', 'T6', 'T7')
+
+# 시나리오 제어용 현재 주파수/대수 기본값 (읽기 전용, 사용 시 dict()로 복사)
+_DEFAULT_FREQS = MappingProxyType({
+    'sw_pump': 48.0,
+    'fw_pump': 48.0,
+    'er_fan': 48.0,
+    'er_fan_count': 3,  # E/R 팬 기본 3대
+    'time_at_max_freq': 0,  # 60Hz 유지 시간 (초)
+    'time_at_min_freq': 0   # 40Hz 유지 시간 (초)
+})
+
+# 시나리오 탭 센서 카드:
+# (센서, 라벨, 기준값, 값 형식, 편차 형식, 강조 시나리오, 상승이 위험한지, 강조 팔레트)
+_SCENARIO_SENSOR_CARDS = (
+    ("T5", "T5 (FW 출구)", 35.0, "{:.1f}°C", "{:+.1f}°C", ScenarioType.HIGH_LOAD, True, "blue"),
+    ("T4", "T4 (FW 입구)", 43.0, "{:.1f}°C", "{:+.1f}°C", ScenarioType.COOLING_FAILURE, True, "blue"),
+    ("T6", "T6 (E/R 온도)", 43.0, "{:.1f}°C", "{:+.1f}°C", ScenarioType.ER_VENTILATION, True, "blue"),
+    ("PX1", "PX1 (압력)", 2.0, "{:.2f} bar", "{:+.2f} bar", ScenarioType.PRESSURE_DROP, False, "pink")
+)
+
+# 센서 카드 기준값 / 악화 방향 부호 (+1: 높을수록 나쁨, -1: 낮을수록 나쁨)
+_SCENARIO_SENSOR_REFS = np.array([card[2] for card in _SCENARIO_SENSOR_CARDS])
+_SCENARIO_SENSOR_BAD_SIGNS = np.array([1.0 if card[6] else -1.0 for card in _SCENARIO_SENSOR_CARDS])
+
+
+def _build_savings_gauge(avg_savings: float) -> go.Figure:
+    """전체 평균 절감률 게이지 Figure 생성"""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=avg_savings,
+        title={'text': "전체 평균 절감률"},
+        delta={'reference': 50.0, 'suffix': '%'},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkgreen"},
+            'steps': [
+                {'range': [0, 30], 'color': "lightgray"},
+                {'range': [30, 50], 'color': "yellow"},
+                {'range': [50, 100], 'color': "lightgreen"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 46
+            }
+        }
+    ))
+
+    fig.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20))
+    return fig
+
+
+def _equipment_rows_markdown(title: str, prefix: str, total: int, running: int, freq: float) -> str:
+    """장비 운전 상태 목록 Markdown 생성 (운전 중: 1 ~ running, 나머지 대기)"""
+    rows = [
+        f"- {prefix}{i}: 🟢 운전 중 ({freq:.1f} Hz)" if i <= running
+        else f"- {prefix}{i}: ⚪ 대기 (0.0 Hz)"
+        for i in range(1, total + 1)
+    ]
+    return title + "\n\n" + "\n".join(rows)
+
+
+def _vfd_card_markdown(diagnostic, prediction) -> str:
+    """VFD 카드 Markdown 생성 (상태, 주파수, 모터 온도, 예방진단, 운전 시간을 한 블록으로)"""
+    status_emoji, status_text = _VFD_STYLE[diagnostic.status_grade]
+    lines = [
+        f"**{diagnostic.vfd_id.replace('_', ' ')}**",
+        f"{status_emoji} {status_text}",
+        f"주파수 **{diagnostic.current_frequency_hz:.1f} Hz**",
+        f"모터 온도 **{diagnostic.motor_temperature_c:.1f}°C**"
+    ]
+
+    # 예방진단 데이터
+    if prediction:
+        trend_icon = _TEMP_TREND_ICON.get(prediction.temp_trend, '→')
+        lines.append(
+            f"30분 후 예측 **{prediction.predicted_temp_30min:.1f}°C** "
+            f"({trend_icon} {prediction.temp_rise_rate:.2f}°C/min)"
+        )
+
+        # 이상 점수 / 수명 잔여율
+        anomaly_color = (
+            "🔴" if prediction.anomaly_score > 75 else
+            "🟠" if prediction.anomaly_score > 50 else
+            "🟡" if prediction.anomaly_score > 25 else "🟢"
+        )
+        lines.append(f":gray[{anomaly_color} 이상점수: {prediction.anomaly_score:.0f}/100]")
+        lines.append(f":gray[💚 수명: {prediction.remaining_life_percent:.0f}%]")
+
+    lines.append(f":gray[⏱ 운전: {diagnostic.cumulative_runtime_hours:.1f}h]")
+    return "  \n".join(lines)
+
+
+def _rule_category(rule: str) -> int:
+    """적용 규칙 분류 (0: 안전 S, 1: 최적화 R, 2: ML 예측, 3: 기타)"""
+    if rule.startswith('S'):
+        return 0
+    if rule.startswith('R'):
+        return 1
+    if rule == 'ML_PREDICTION':
+        return 2
+    return 3
+
+
+# 규칙 분류별 표시 형식 (Streamlit 색상 Markdown)
+_RULE_LINE_FMT = (
+    ":red[🚨 **{}**]",
+    ":blue[⚙️ {}]",
+    ":green[🤖 {}: ML 모델 예측 사용 (선제적 주파수 조정)]",
+    "• {}",
+)
+
+
+def _applied_rules_markdown(rules: List[str]) -> str:
+    """적용된 규칙 목록을 분류별(안전 → 최적화 → ML → 기타)로 묶은 Markdown 한 덩어리로 생성
+
+    같은 분류 안에서는 규칙이 적용된 순서를 유지한다.
+    """
+    return "\n\n".join(
+        _RULE_LINE_FMT[_rule_category(rule)].format(rule)
+        for rule in sorted(rules, key=_rule_category)
+    )
+
+
+# 에너지 절감 비교 그룹 라벨 (SW 펌프, FW 펌프, E/R 팬 순서)
+_ENERGY_GROUP_LABELS = ('SW 펌프', 'FW 펌프', 'E/R 팬')
+
+# 그룹별 정격 출력 (kW) 및 운전 대수 (라벨과 같은 순서)
+_RATED_KW = np.array([132.0, 75.0, 54.3])
+_RUNNING_COUNT = np.array([2, 2, 3])
+
+# 전력 표시 형식 (바 차트 라벨)
+_KW_FMT = "{:.1f} kW".format
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _compute_energy_savings(sw_freq: float, fw_freq: float, er_freq: float) -> Dict:
+    """
+    60Hz 고정 운전 대비 AI 제어 운전 전력/절감량 계산
+
+    세 그룹 주파수에 대한 순수 함수이므로 Streamlit 재실행 간 캐시됩니다.
+    """
+    freqs = np.array([sw_freq, fw_freq, er_freq])
+
+    # 전력 계산 (세제곱 법칙: P = 정격 × (f/60)³ × 대수), 60Hz에서는 (60/60)³ = 1
+    power_60hz = _RATED_KW * _RUNNING_COUNT
+    power_ai = _RATED_KW * (freqs / 60.0) ** 3 * _RUNNING_COUNT
+
+    # 절감량 / 절감률
+    saved = power_60hz - power_ai
+    ratio = saved / power_60hz * 100
+
+    total_60hz = float(power_60hz.sum())
+    total_ai = float(power_ai.sum())
+    total_saved = total_60hz - total_ai
+
+    # 열 단위 Arrow 테이블로 구성 (st.dataframe의 pandas → Arrow 변환 생략)
+    table = pa.table({
+        "그룹": _ENERGY_GROUP_LABELS,
+        "운전 대수": np.char.mod("%d대", _RUNNING_COUNT),
+        "AI 주파수": np.char.mod("%.1f Hz", freqs),
+        "60Hz 전력": np.char.mod("%.1f kW", power_60hz),
+        "AI 전력": np.char.mod("%.1f kW", power_ai),
+        "절감량": np.char.mod("%.1f kW", saved),
+        "절감률": np.char.mod("%.1f%%", ratio)
+    })
+
+    return {
+        "power_60hz": tuple(power_60hz.tolist()),
+        "power_ai": tuple(power_ai.tolist()),
+        "total_60hz": total_60hz,
+        "total_ai": total_ai,
+        "total_saved": total_saved,
+        "total_ratio": (total_saved / total_60hz) * 100,
+        "table": table
+    }
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_energy_bar_fig(groups: tuple, power_60hz: tuple, power_ai: tuple) -> go.Figure:
+    """그룹별 60Hz vs AI 소비 전력 바 차트 생성"""
+    fig = go.Figure()
+
+    # 60Hz 바
+    fig.add_trace(go.Bar(
+        name='60Hz 고정',
+        x=list(groups),
+        y=list(power_60hz),
+        marker_color='lightcoral',
+        text=list(map(_KW_FMT, power_60hz)),
+        textposition='auto',
+    ))
+
+    # AI 제어 바
+    fig.add_trace(go.Bar(
+        name='AI 제어',
+        x=list(groups),
+        y=list(power_ai),
+        marker_color='lightgreen',
+        text=list(map(_KW_FMT, power_ai)),
+        textposition='auto',
+    ))
+
+    fig.update_layout(
+        barmode='group',
+        height=400,
+        yaxis_title='소비 전력 (kW)',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
+        margin=dict(l=20, r=20, t=80, b=20)
+    )
+    return fig
+
+
+# 트렌드 이력 길이 (1초 샘플 기준: 온도 10분, 에너지 1시간)
+_SENSOR_HISTORY_LEN = 600
+_ENERGY_HISTORY_LEN = 3600
+
+# 에너지 절감률 추이 트레이스: (이력 키, 이름, 색상)
+_ENERGY_TREND_TRACES = (
+    ('sw_pumps', 'SW 펌프', 'blue'),
+    ('fw_pumps', 'FW 펌프', 'green'),
+    ('er_fans', 'E/R 팬', 'red')
+)
+
+
+def _build_energy_trend_fig() -> go.Figure:
+    """에너지 절감률 추이 Figure 뼈대 생성 (빈 트레이스 + 목표 범위 + 레이아웃, 세션당 한 번)"""
+    fig = go.Figure()
+
+    # 수백 점의 1초 샘플을 새로고침마다 다시 그리므로 SVG 대신 WebGL(Scattergl)로 렌더링
+    for _, name, color in _ENERGY_TREND_TRACES:
+        fig.add_trace(go.Scattergl(x=[], y=[], name=name, line=dict(color=color, width=2)))
+
+    # 목표 절감률 라인
+    fig.add_hrect(y0=46, y1=52, line_width=0, fillcolor="green", opacity=0.1,
+                 annotation_text="펌프 목표 범위", annotation_position="top left")
+    fig.add_hrect(y0=50, y1=58, line_width=0, fillcolor="red", opacity=0.1,
+                 annotation_text="팬 목표 범위", annotation_position="bottom left")
+
+    fig.update_layout(
+        height=400,
+        margin=dict(l=20, r=20, t=20, b=90),
+        xaxis_title="시간",
+        yaxis_title="절감률 (%)",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.35,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    return fig
+
+
+# 트렌드 트레이스당 브라우저로 보내는 최대 점 수 (초과 시 LTTB 다운샘플링, 온도 10분 600점 → 300점)
+_TREND_MAX_POINTS = 300
+
+
+def _lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """LTTB(Largest-Triangle-Three-Buckets) 다운샘플링으로 남길 샘플 인덱스 계산
+
+    1초 등간격 샘플이므로 x는 샘플 번호로 둔다. 첫/마지막 점은 항상 유지하고,
+    나머지 구간을 n_out - 2개 버킷으로 나눠 버킷마다 삼각형 면적이 가장 큰 점 하나를 고른다.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0  # 직전에 선택한 점
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 버킷 평균점 (마지막 버킷 다음은 마지막 점)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = (end + next_end - 1) / 2.0
+        avg_y = y[end:next_end].mean()
+
+        xs = np.arange(start, end)
+        areas = np.abs((a - avg_x) * (y[start:end] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    return indices
+
+
+def _get_trend_fig(state_key: str, builder, history: Dict, trace_keys: tuple, updated: bool) -> go.Figure:
+    """세션에 보관한 트렌드 Figure 반환
+
+    Figure 뼈대는 세션당 한 번만 만들고, 새 샘플이 추가된 경우에만 트레이스 데이터를 교체한다.
+    이력(deque)은 NumPy 배열로 한 번에 복사해 넘긴다 (Plotly가 배열을 바이너리로 직렬화).
+    _TREND_MAX_POINTS를 넘는 트레이스는 LTTB로 줄여서 넘긴다.
+    """
+    fig = st.session_state.get(state_key)
+    if fig is None:
+        fig = builder()
+        st.session_state[state_key] = fig
+        updated = True
+    if updated:
+        timestamps = np.array(history['timestamps'], dtype='datetime64[ms]')
+        with fig.batch_update():
+            for trace, key in zip(fig.data, trace_keys):
+                series = np.fromiter(history[key], dtype=np.float64, count=len(history[key]))
+                if len(series) > _TREND_MAX_POINTS:
+                    keep = _lttb_indices(series, _TREND_MAX_POINTS)
+                    trace.x = timestamps[keep]
+                    trace.y = series[keep]
+                else:
+                    trace.x = timestamps
+                    trace.y = series
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _build_weekly_trend_fig() -> go.Figure:
+    """주간 개선 추이 Figure 생성 (시뮬레이션 상수 데이터)"""
+    weeks = list(range(1, 9))
+    temp_accuracy = [72.0, 74.5, 76.2, 77.8, 79.1, 80.3, 81.4, 82.5]
+    energy_savings = [42.0, 44.5, 46.2, 47.5, 48.5, 49.0, 49.5, 49.8]
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=weeks,
+        y=temp_accuracy,
+        name='온도 예측 정확도 (%)',
+        line=dict(color='blue', width=3),
+        marker=dict(size=8)
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=weeks,
+        y=energy_savings,
+        name='에너지 절감률 (%)',
+        line=dict(color='green', width=3),
+        marker=dict(size=8),
+        yaxis='y2'
+    ))
+
+    fig.update_layout(
+        height=400,
+        margin=dict(l=20, r=20, t=20, b=90),
+        xaxis_title="주차",
+        yaxis_title="온도 예측 정확도 (%)",
+        yaxis2=dict(
+            title="에너지 절감률 (%)",
+            overlaying='y',
+            side='right'
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.35,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_position_map_fig(latitude: float, longitude: float, speed_knots: float) -> go.Figure:
+    """현재 위치 지도 Figure 생성"""
+    fig = go.Figure(go.Scattergeo(
+        lon=[longitude],
+        lat=[latitude],
+        text=[f"선속: {speed_knots:.1f} knots"],
+        mode='markers+text',
+        marker=dict(size=15, color='red', symbol='circle'),
+        textposition='top center'
+    ))
+
+    fig.update_layout(
+        title=f"위치: {latitude:.4f}°, {longitude:.4f}°",
+        geo=dict(
+            scope='asia',
+            projection_type='natural earth',
+            showland=True,
+            landcolor='rgb(243, 243, 243)',
+            coastlinecolor='rgb(204, 204, 204)',
+            center=dict(lat=latitude, lon=longitude),
+            projection_scale=3
+        ),
+        height=400
+    )
+    return fig
+
+
 class Dashboard:
     """Streamlit 대시보드"""
 
@@ -40,32 +750,40 @@ class Dashboard:
         if 'hmi_manager' not in st.session_state:
             st.session_state.hmi_manager = HMIStateManager()
 
+        # 최근 600개 (10분) / 3600개 (1시간)만 유지 - deque가 오래된 샘플을 자동으로 버림
         if 'sensor_history' not in st.session_state:
             st.session_state.sensor_history = {
-                'T4': [],
-                'T5': [],
-                'T6': [],
-                'timestamps': []
+                'T4': deque(maxlen=_SENSOR_HISTORY_LEN),
+                'T5': deque(maxlen=_SENSOR_HISTORY_LEN),
+                'T6': deque(maxlen=_SENSOR_HISTORY_LEN),
+                'timestamps': deque(maxlen=_SENSOR_HISTORY_LEN)
             }
 
         if 'energy_history' not in st.session_state:
             st.session_state.energy_history = {
-                'sw_pumps': [],
-                'fw_pumps': [],
-                'er_fans': [],
-                'timestamps': []
+                'sw_pumps': deque(maxlen=_ENERGY_HISTORY_LEN),
+                'fw_pumps': deque(maxlen=_ENERGY_HISTORY_LEN),
+                'er_fans': deque(maxlen=_ENERGY_HISTORY_LEN),
+                'timestamps': deque(maxlen=_ENERGY_HISTORY_LEN)
             }
 
+        # 기본 시뮬레이션 샘플 번호 (이력 길이가 상한에 도달해도 계속 증가)
+        if 'sensor_tick' not in st.session_state:
+            st.session_state.sensor_tick = 0
+        if 'energy_tick' not in st.session_state:
+            st.session_state.energy_tick = 0
+
         # GPS 시뮬레이션 데이터 초기화
         if 'gps_initialized' not in st.session_state:
+            now = datetime.now()
             # 시뮬레이션: 부산 출발 -> 싱가포르 항로
             gps_data = GPSData(
-                timestamp=datetime.now(),
+                timestamp=now,
                 latitude=35.1,  # 부산 근처
                 longitude=129.0,
                 speed_knots=15.5,
                 heading_degrees=225.0,
-                utc_time=datetime.now()
+                utc_time=now
             )
             st.session_state.hmi_manager.update_gps_data(gps_data)
             st.session_state.gps_initialized = True
@@ -110,8 +828,36 @@ class Dashboard:
         self.vfd_predictive: VFDPredictiveDiagnosis = st.session_state.vfd_predictive
         self.shared_data_writer: SharedDataWriter = st.session_state.shared_data_writer
 
+        # 이번 렌더링에서 계산한 VFD 예방진단 결과 (VFD 탭에서 재사용)
+        self.vfd_predictions: Dict = {}
+
+        # 이번 렌더링의 시나리오 센서 값 (_get_scenario_values에서 채움)
+        self._scenario_values: Optional[Dict[str, float]] = None
+
+    def _get_scenario_values(self) -> Dict[str, float]:
+        """이번 렌더링의 시나리오 센서 값 (렌더링당 한 번만 계산해 모든 영역에서 공유)"""
+        if self._scenario_values is None:
+            self._scenario_values = self.scenario_engine.get_current_values()
+        return self._scenario_values
+
+    def _init_session_once(self):
+        """current_frequencies 기본값 설정 및 구버전 세션 마이그레이션 (세션당 한 번)"""
+        if st.session_state.get('_freqs_migrated'):
+            return
+        if 'current_frequencies' not in st.session_state:
+            st.session_state.current_frequencies = dict(_DEFAULT_FREQS)
+        # 기존 세션에서 er_fan_count가 2대로 설정되어 있으면 3대로 강제 변경
+        elif st.session_state.current_frequencies.get('er_fan_count', 3) == 2:
+            st.session_state.current_frequencies['er_fan_count'] = 3
+        st.session_state['_freqs_migrated'] = True
+
     def run(self):
         """대시보드 실행"""
+        # 렌더링 기준 시각 (한 번의 렌더링 동안 공통 사용)
+        # 표시용은 datetime, 샘플 주기 판정은 단조 시계 사용 (시스템 시각 변경/날짜 경계 영향 없음)
+        self.render_time = datetime.now()
+        self.render_monotonic = time.monotonic()
+
         # 페이지 설정
         st.set_page_config(
             page_title="ESS AI 제어 시스템 - HMI Dashboard",
@@ -121,66 +867,21 @@ class Dashboard:
         )
 
         # 전역 CSS 스타일
-        st.markdown("""
-            <style>
-            /* 제어 패널 버튼 고정 너비 */
-            .stButton button {
-                width: 85px !important;
-                min-width: 85px !important;
-                max-width: 85px !important;
-            }
-
-            /* 60Hz 선택 버튼 - 회색 */
-            button[kind="secondary"]:has(*:contains("◉ 60Hz")) {
-                background-color: #78909C !important;
-                color: white !important;
-                border-color: #78909C !important;
-            }
-
-            /* AI 선택 버튼 - 녹색 */
-            button[kind="secondary"]:has(*:contains("◉ AI")) {
-                background-color: #66BB6A !important;
-                color: white !important;
-                border-color: #66BB6A !important;
-            }
-
-            /* 시나리오 선택 버튼 스타일 */
-            button:has(*:contains("기본 제어 검증")),
-            button:has(*:contains("고부하 제어 검증")),
-            button:has(*:contains("냉각기 과열 보호 검증")),
-            button:has(*:contains("압력 안전 제어 검증")) {
-                white-space: nowrap !important;
-                min-width: 120px !important;
-                width: auto !important;
-                max-width: none !important;
-                min-height: 45px !important;
-                height: auto !important;
-                padding: 0.5rem 1.5rem !important;
-                font-size: 1rem !important;
-            }
-
-            /* 탭 중복 렌더링 방지 */
-            .stTabs [data-baseweb="tab-list"] {
-                gap: 8px;
-            }
-
-            .stTabs [data-baseweb="tab"] {
-                height: 50px;
-                white-space: pre-wrap;
-                background-color: transparent;
-            }
-            </style>
-        """, unsafe_allow_html=True)
+        # Streamlit은 재실행 시 다시 그리지 않은 요소를 제거하므로 매 실행마다 출력
+        st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
 
         # 제목
         st.title("⚡ ESS Rule-based AI 제어 시스템 - HMI Dashboard")
         st.caption("HMM 16K급 선박 - NVIDIA Jetson Xavier NX 기반 | Rule-based AI + ML 최적화")
 
+        # 현재 주파수/대수 기본값 (제어 계산 탭보다 먼저 세션당 한 번)
+        self._init_session_once()
+
         # 사이드바
         self._render_sidebar()
 
 
-        # 탭 생성
+        # 탭 생성 (선택된 탭을 추적해 .open으로 조회 가능하도록 on_change="rerun")
         tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
             "📊 메인 대시보드",
             "🎛️ 제어 패널",
@@ -190,28 +891,35 @@ class Dashboard:
             "🗺️ GPS & 환경",
             "🔧 VFD 진단",
             "🎬 시나리오 테스트"
-        ])
+        ], key="main_tabs", on_change="rerun")
 
+        # 제어 계산/주파수 갱신을 수행하는 탭은 선택 여부와 무관하게 매번 실행
         with tab1:
             self._render_main_dashboard()
 
         with tab2:
             self._render_control_panel()
 
-        with tab3:
-            self._render_performance_monitoring()
+        # 표시 전용 탭은 선택된 경우에만 렌더링
+        if tab3.open:
+            with tab3:
+                self._render_performance_monitoring()
 
-        with tab4:
-            self._render_alarm_management()
+        if tab4.open:
+            with tab4:
+                self._render_alarm_management()
 
-        with tab5:
-            self._render_learning_progress()
+        if tab5.open:
+            with tab5:
+                self._render_learning_progress()
 
-        with tab6:
-            self._render_gps_environment()
+        if tab6.open:
+            with tab6:
+                self._render_gps_environment()
 
-        with tab7:
-            self._render_vfd_diagnostics()
+        if tab7.open:
+            with tab7:
+                self._render_vfd_diagnostics()
 
         with tab8:
             self._render_scenario_testing()
@@ -223,8 +931,9 @@ class Dashboard:
         """사이드바 렌더링"""
         st.sidebar.header("시스템 상태")
 
-        # 현재 시간
-        st.sidebar.metric("현재 시간", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        # 현재 시간 (브라우저 측 시계 - 전체 화면 재실행과 무관하게 1초마다 갱신)
+        with st.sidebar:
+            components.html(SIDEBAR_CLOCK_HTML, height=SIDEBAR_CLOCK_HEIGHT)
 
         # 긴급 정지 버튼
         st.sidebar.markdown("---")
@@ -238,14 +947,16 @@ class Dashboard:
         st.sidebar.markdown("---")
         st.sidebar.subheader("📊 알람 현황")
 
-        active_alarms = self.hmi_manager.get_active_alarms()
-        critical_alarms = [a for a in active_alarms if a.priority == AlarmPriority.CRITICAL]
-        warning_alarms = [a for a in active_alarms if a.priority == AlarmPriority.WARNING]
-        info_alarms = [a for a in active_alarms if a.priority == AlarmPriority.INFO]
+        # 미확인 알람의 우선순위별 개수 (HMI 관리자가 알람 추가/확인 시 갱신하는 카운터)
+        active_count = self.hmi_manager.get_active_alarm_count
+
+        st.sidebar.metric("🔴 CRITICAL 알람", active_count(AlarmPriority.CRITICAL))
+        st.sidebar.metric("🟡 WARNING 알람", active_count(AlarmPriority.WARNING))
+        st.sidebar.metric("🔵 INFO 이벤트", active_count(AlarmPriority.INFO))
 
-        st.sidebar.metric("🔴 CRITICAL 알람", len(critical_alarms))
-        st.sidebar.metric("🟡 WARNING 알람", len(warning_alarms))
-        st.sidebar.metric("🔵 INFO 이벤트", len(info_alarms))
+        # 디버그 표시 (시나리오 탭의 제어 입력/출력/타이머 정보)
+        st.sidebar.markdown("---")
+        st.sidebar.checkbox("🔍 디버그 모드", key="debug_mode")
 
     def _render_main_dashboard(self):
         """메인 대시보드 렌더링"""
@@ -257,7 +968,7 @@ class Dashboard:
 
         # 데이터 소스 선택: 시나리오 모드면 시나리오 엔진, 아니면 고정값
         if st.session_state.use_scenario_data:
-            values = self.scenario_engine.get_current_values()
+            values = self._get_scenario_values()
             T4 = values['T4']
             T5 = values['T5']
             T6 = values['T6']
@@ -274,25 +985,11 @@ class Dashboard:
                 'T5': T5, 'T6': T6, 'T7': T7
             }
             pressure = PX1
-            
-            # 온도 시퀀스 업데이트 (예측 제어용)
-            self.integrated_controller.update_temperature_sequence(
-                temperatures, engine_load
-            )
-            
+
+            # 온도 시퀀스 버퍼는 compute_control() 내부에서 갱신됨
+
             # 제어 결정 계산
-            # current_frequencies 준비
-            # 시나리오 테스트에서 이미 사용 중인 current_frequencies 재사용
-            if 'current_frequencies' not in st.session_state:
-                st.session_state.current_frequencies = {
-                    'sw_pump': self.hmi_manager.groups["SW_PUMPS"].target_frequency,
-                    'fw_pump': self.hmi_manager.groups["FW_PUMPS"].target_frequency,
-                    'er_fan': self.hmi_manager.groups["ER_FANS"].target_frequency,
-                    'er_fan_count': 3,  # 기본 3대
-                    'time_at_max_freq': 0,
-                    'time_at_min_freq': 0
-                }
-            
+            # current_frequencies는 run()에서 세션당 한 번 준비 (시나리오 테스트와 공유)
             current_frequencies = st.session_state.current_frequencies
             
             control_decision = self.integrated_controller.compute_control(
@@ -302,10 +999,15 @@ class Dashboard:
                 current_frequencies=current_frequencies
             )
             
-            # HMI 매니저의 목표 주파수 업데이트
-            self.hmi_manager.update_target_frequency("SW_PUMPS", control_decision.sw_pump_freq)
-            self.hmi_manager.update_target_frequency("FW_PUMPS", control_decision.fw_pump_freq)
-            self.hmi_manager.update_target_frequency("ER_FANS", control_decision.er_fan_freq)
+            # HMI 매니저의 목표 주파수 업데이트 (AI 제어 그룹만, 60Hz 고정 그룹은 60Hz 유지)
+            ai_targets = {
+                "SW_PUMPS": control_decision.sw_pump_freq,
+                "FW_PUMPS": control_decision.fw_pump_freq,
+                "ER_FANS": control_decision.er_fan_freq
+            }
+            for group_key, frequency in ai_targets.items():
+                if self.hmi_manager.groups[group_key].control_mode == ControlMode.AI_CONTROL:
+                    self.hmi_manager.update_target_frequency(group_key, frequency)
             
             # 제어 결정을 세션에 저장 (다른 화면에서 사용)
             st.session_state.last_control_decision = control_decision
@@ -381,82 +1083,34 @@ class Dashboard:
         """온도 트렌드 그래프"""
         # 현재 온도 값 가져오기 (시나리오 데이터 또는 기본 시뮬레이션)
         if st.session_state.use_scenario_data:
-            values = self.scenario_engine.get_current_values()
+            values = self._get_scenario_values()
             current_T4 = values['T4']
             current_T5 = values['T5']
             current_T6 = values['T6']
         else:
-            # 기본 시뮬레이션 데이터
-            current_T4 = 38.0 + (len(st.session_state.sensor_history['T4']) % 10) * 0.15
-            current_T5 = 35.0 + (len(st.session_state.sensor_history['T5']) % 10) * 0.1
-            current_T6 = 43.0 + (len(st.session_state.sensor_history['T6']) % 10) * 0.1
+            # 기본 시뮬레이션 데이터 (샘플 번호 기준 10단계 반복 패턴)
+            step = st.session_state.sensor_tick % 10
+            current_T4 = 38.0 + step * 0.15
+            current_T5 = 35.0 + step * 0.1
+            current_T6 = 43.0 + step * 0.1
         
         # 데이터 추가
-        now = datetime.now()
-        if len(st.session_state.sensor_history['timestamps']) == 0 or \
-           (now - st.session_state.sensor_history['timestamps'][-1]).seconds >= 1:
-
-            st.session_state.sensor_history['T4'].append(current_T4)
-            st.session_state.sensor_history['T5'].append(current_T5)
-            st.session_state.sensor_history['T6'].append(current_T6)
-            st.session_state.sensor_history['timestamps'].append(now)
-
-            # 최근 600개만 유지 (10분)
-            if len(st.session_state.sensor_history['timestamps']) > 600:
-                st.session_state.sensor_history['T4'] = st.session_state.sensor_history['T4'][-600:]
-                st.session_state.sensor_history['T5'] = st.session_state.sensor_history['T5'][-600:]
-                st.session_state.sensor_history['T6'] = st.session_state.sensor_history['T6'][-600:]
-                st.session_state.sensor_history['timestamps'] = st.session_state.sensor_history['timestamps'][-600:]
-
-        # 그래프 생성
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatter(
-            x=st.session_state.sensor_history['timestamps'],
-            y=st.session_state.sensor_history['T4'],
-            name='T4 (FW 입구)',
-            line=dict(color='green', width=2)
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=st.session_state.sensor_history['timestamps'],
-            y=st.session_state.sensor_history['T5'],
-            name='T5 (FW 출구)',
-            line=dict(color='blue', width=2)
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=st.session_state.sensor_history['timestamps'],
-            y=st.session_state.sensor_history['T6'],
-            name='T6 (E/R 온도)',
-            line=dict(color='red', width=2)
-        ))
-
-        # 목표 온도 라인 (라벨 위치 조정하여 그래프와 겹치지 않게)
-        fig.add_hline(y=35.0, line_dash="dash", line_color="blue",
-                     annotation_text="T5 목표 (35°C)",
-                     annotation_position="right")
-        fig.add_hline(y=43.0, line_dash="dash", line_color="red",
-                     annotation_text="T6 목표 (43°C)",
-                     annotation_position="right")
-        fig.add_hline(y=48.0, line_dash="dash", line_color="orange",
-                     annotation_text="T4 한계 (48°C)",
-                     annotation_position="right")
-
-        fig.update_layout(
-            height=350,
-            margin=dict(l=20, r=120, t=50, b=90),
-            xaxis_title="시간",
-            yaxis_title="온도 (°C)",
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.45,
-                xanchor="center",
-                x=0.5
-            )
+        history = st.session_state.sensor_history
+        now = self.render_time
+        updated = self.render_monotonic - st.session_state.get('_last_sensor_sample_m', 0.0) >= 1.0
+        if updated:
+            st.session_state['_last_sensor_sample_m'] = self.render_monotonic
+            history['T4'].append(current_T4)
+            history['T5'].append(current_T5)
+            history['T6'].append(current_T6)
+            history['timestamps'].append(now)
+            st.session_state.sensor_tick += 1
+
+        # 그래프 (세션에 보관한 Figure의 트레이스 데이터만 갱신)
+        fig = _get_trend_fig(
+            'temperature_trend_fig', build_temperature_trend_fig, history,
+            tuple(key for key, _, _ in TEMP_TREND_TRACES), updated
         )
-
         st.plotly_chart(fig, use_container_width=True)
 
     def _render_energy_savings_gauge(self):
@@ -469,9 +1123,10 @@ class Dashboard:
             er_freq = decision.er_fan_freq
             er_count = decision.er_fan_count
         else:
-            sw_freq = self.hmi_manager.groups["SW_PUMPS"].target_frequency
-            fw_freq = self.hmi_manager.groups["FW_PUMPS"].target_frequency
-            er_freq = self.hmi_manager.groups["ER_FANS"].target_frequency
+            groups = self.hmi_manager.groups
+            sw_freq = groups["SW_PUMPS"].target_frequency
+            fw_freq = groups["FW_PUMPS"].target_frequency
+            er_freq = groups["ER_FANS"].target_frequency
             er_count = 3
         
         # 실시간 에너지 절감률 계산
@@ -504,29 +1159,16 @@ class Dashboard:
         fan_savings = ((er_60hz - er_ai) / er_60hz) * 100 if er_60hz > 0 else 0
         avg_savings = ((total_60hz - total_ai) / total_60hz) * 100 if total_60hz > 0 else 0
 
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number+delta",
-            value=avg_savings,
-            title={'text': "전체 평균 절감률"},
-            delta={'reference': 50.0, 'suffix': '%'},
-            gauge={
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "darkgreen"},
-                'steps': [
-                    {'range': [0, 30], 'color': "lightgray"},
-                    {'range': [30, 50], 'color': "yellow"},
-                    {'range': [50, 100], 'color': "lightgreen"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 46
-                }
-            }
-        ))
+        # 게이지 Figure는 세션당 한 번만 만들고, 절감률이 바뀐 경우에만 값만 갱신
+        gauge_key = round(avg_savings, 1)
+        gauge_fig = st.session_state.get('_gauge_fig')
+        if gauge_fig is None:
+            gauge_fig = st.session_state._gauge_fig = _build_savings_gauge(avg_savings)
+        elif st.session_state.get('_gauge_key') != gauge_key:
+            gauge_fig.data[0].value = avg_savings
+        st.session_state._gauge_key = gauge_key
 
-        fig.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20))
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(gauge_fig, use_container_width=True)
 
         # 상세 절감률
         col1, col2, col3 = st.columns(3)
@@ -542,9 +1184,10 @@ class Dashboard:
         col1, col2, col3 = st.columns(3)
 
         # 각 그룹의 목표 주파수 가져오기
-        sw_freq = self.hmi_manager.groups["SW_PUMPS"].target_frequency
-        fw_freq = self.hmi_manager.groups["FW_PUMPS"].target_frequency
-        er_freq = self.hmi_manager.groups["ER_FANS"].target_frequency
+        groups = self.hmi_manager.groups
+        sw_freq = groups["SW_PUMPS"].target_frequency
+        fw_freq = groups["FW_PUMPS"].target_frequency
+        er_freq = groups["ER_FANS"].target_frequency
         
         # E/R 팬 운전 대수 (시나리오에서 업데이트될 수 있음)
         if hasattr(st.session_state, 'last_control_decision') and st.session_state.last_control_decision:
@@ -552,32 +1195,32 @@ class Dashboard:
         else:
             er_fan_count = 3  # 기본값
 
+        # 그룹별 장비 목록을 하나의 Markdown 블록으로 렌더링
         with col1:
-            st.markdown("**SW 펌프 (132kW x 3대)**")
-            for i in range(1, 4):
-                status = "🟢 운전 중" if i <= 2 else "⚪ 대기"
-                freq = sw_freq if i <= 2 else 0
-                st.text(f"SW-P{i}: {status} ({freq:.1f} Hz)")
+            st.markdown(_equipment_rows_markdown(
+                "**SW 펌프 (132kW x 3대)**", "SW-P", 3, 2, sw_freq
+            ))
 
         with col2:
-            st.markdown("**FW 펌프 (75kW x 3대)**")
-            for i in range(1, 4):
-                status = "🟢 운전 중" if i <= 2 else "⚪ 대기"
-                freq = fw_freq if i <= 2 else 0
-                st.text(f"FW-P{i}: {status} ({freq:.1f} Hz)")
+            st.markdown(_equipment_rows_markdown(
+                "**FW 펌프 (75kW x 3대)**", "FW-P", 3, 2, fw_freq
+            ))
 
         with col3:
-            st.markdown(f"**E/R 팬 (54.3kW x 4대)** - {er_fan_count}대 운전 중")
-            for i in range(1, 5):
-                status = "🟢 운전 중" if i <= er_fan_count else "⚪ 대기"
-                freq = er_freq if i <= er_fan_count else 0
-                st.text(f"ER-F{i}: {status} ({freq:.1f} Hz)")
+            st.markdown(_equipment_rows_markdown(
+                f"**E/R 팬 (54.3kW x 4대)** - {er_fan_count}대 운전 중", "ER-F", 4, er_fan_count, er_freq
+            ))
 
         # VFD 예방진단 데이터 생성 및 공유 파일 저장
         self._update_vfd_predictive_diagnostics()
 
     def _update_vfd_predictive_diagnostics(self):
         """VFD 예방진단 데이터 생성 및 공유 파일 저장"""
+        # 공유 파일은 선택된 탭과 무관하게 매번 갱신되어야 하므로 VFD 시뮬레이션도 여기서 보장
+        # (처음 생성한 렌더링에서는 생성 과정에서 예측/저장까지 수행됨)
+        if self._ensure_vfd_simulation():
+            return
+
         try:
             # 모든 VFD 진단 데이터 수집
             diagnostics = self.hmi_manager.get_vfd_diagnostics()
@@ -590,6 +1233,7 @@ class Dashboard:
                 prediction = self.vfd_predictive.predict(diagnostic)
                 if prediction:
                     predictions[vfd_id] = prediction
+            self.vfd_predictions = predictions
 
             # 공유 파일에 저장
             if predictions:
@@ -606,45 +1250,73 @@ class Dashboard:
         st.header("🎛️ 그룹별 주파수 제어")
         st.info("💡 각 그룹별로 독립적으로 '60Hz 고정' 또는 'AI 제어'를 선택할 수 있습니다. 제어 명령은 운전 중인 장비에만 적용되며, Stand-by 장비는 영향을 받지 않습니다.")
 
+        # 그룹별 목표/실제 주파수 갱신 후, 표시용 값을 한 번만 계산해 패널과 테이블에서 공유
+        for group_key in _CONTROL_GROUPS:
+            self._update_group_frequencies(group_key)
+        snapshot = self._compute_group_snapshot()
+
         # 3개 그룹 제어 패널
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            self._render_group_control("SW_PUMPS", "SW 펌프 그룹")
+            self._render_group_control("SW_PUMPS", "SW 펌프 그룹", snapshot["SW_PUMPS"])
 
         with col2:
-            self._render_group_control("FW_PUMPS", "FW 펌프 그룹")
+            self._render_group_control("FW_PUMPS", "FW 펌프 그룹", snapshot["FW_PUMPS"])
 
         with col3:
-            self._render_group_control("ER_FANS", "E/R 팬 그룹")
+            self._render_group_control("ER_FANS", "E/R 팬 그룹", snapshot["ER_FANS"])
 
         st.markdown("---")
 
         # 입력-목표-실제 비교 테이블
         st.subheader("📊 입력 조건 → AI 계산 → 목표 주파수 → 실제 반영")
-        self._render_frequency_comparison_table()
-
-    def _render_group_control(self, group_key: str, group_name: str):
-        """그룹별 제어 패널"""
-        st.subheader(group_name)
+        self._render_frequency_comparison_table(snapshot)
 
+    def _update_group_frequencies(self, group_key: str):
+        """그룹 목표 주파수 동기화 및 실제 주파수 시뮬레이션 갱신"""
         group = self.hmi_manager.groups[group_key]
 
+        # 목표 주파수를 현재 모드에 맞게 동기화
+        expected_target = 60.0 if group.control_mode == ControlMode.FIXED_60HZ else _AI_FREQUENCY[group_key]
+
+        # 모드/목표가 바뀐 경우에만 목표 주파수 업데이트 (매 렌더링마다 쓰지 않음)
+        last_key = _LAST_EXPECTED_KEYS[group_key]
+        if st.session_state.get(last_key) != (group.control_mode, expected_target):
+            self.hmi_manager.update_target_frequency(group_key, expected_target)
+            st.session_state[last_key] = (group.control_mode, expected_target)
+
+        # 시뮬레이션: 실제 주파수 업데이트 (실제 시스템에서는 PLC/VFD에서 읽어옴)
+        # 목표 주파수와 동일하게 설정 (시뮬레이션)
+        self.hmi_manager.update_actual_frequencies(
+            group_key, dict.fromkeys(_SIMULATED_RUNNING_IDS[group_key], group.target_frequency)
+        )
+
+    def _compute_group_snapshot(self) -> Dict[str, Dict]:
+        """그룹별 표시 값 (목표, 실제 평균, 최대 편차, 편차 상태, 제어 모드)을 한 번에 계산"""
+        snapshot = {}
+        for group_key, group in self.hmi_manager.groups.items():
+            snapshot[group_key] = {
+                'target': group.target_frequency,
+                'avg': group.get_avg_actual_frequency(),
+                'max_dev': group.get_max_deviation(),
+                'status': self.hmi_manager.get_deviation_status(group_key),
+                'mode': group.control_mode
+            }
+        return snapshot
+
+    def _render_group_control(self, group_key: str, group_name: str, snap: Dict):
+        """그룹별 제어 패널 (snap: _compute_group_snapshot()의 그룹 값)"""
+        st.subheader(group_name)
+
         st.markdown("**제어 모드**")
 
         # 버튼 2개를 작게 배치 (1:1:3 비율)
         col1, col2, col3 = st.columns([1, 1, 3])
 
-        is_60hz = group.control_mode == ControlMode.FIXED_60HZ
-        is_ai = group.control_mode == ControlMode.AI_CONTROL
-
-        # 목표 주파수를 현재 모드에 맞게 동기화
-        ai_frequency = 48.4 if "PUMP" in group_key else 47.3
-        expected_target = 60.0 if is_60hz else ai_frequency
-
-        # 목표 주파수가 현재 모드와 맞지 않으면 업데이트
-        if abs(group.target_frequency - expected_target) > 0.1:
-            self.hmi_manager.update_target_frequency(group_key, expected_target)
+        is_60hz = snap['mode'] == ControlMode.FIXED_60HZ
+        is_ai = snap['mode'] == ControlMode.AI_CONTROL
+        ai_frequency = _AI_FREQUENCY[group_key]
 
         # 60Hz 버튼
         with col1:
@@ -699,25 +1371,12 @@ class Dashboard:
                     self.hmi_manager.update_target_frequency(group_key, ai_frequency)
                     st.rerun()
 
-        # 시뮬레이션: 실제 주파수 업데이트 (실제 시스템에서는 PLC/VFD에서 읽어옴)
-        # 목표 주파수와 동일하게 설정 (시뮬레이션)
-        simulated_actual_freq = group.target_frequency
-        if "PUMP" in group_key:
-            # 펌프는 2대 운전 가정
-            self.hmi_manager.update_actual_frequency(group_key, f"{group_key}_1", simulated_actual_freq)
-            self.hmi_manager.update_actual_frequency(group_key, f"{group_key}_2", simulated_actual_freq)
-        else:
-            # 팬은 3대 운전 가정
-            self.hmi_manager.update_actual_frequency(group_key, f"{group_key}_1", simulated_actual_freq)
-            self.hmi_manager.update_actual_frequency(group_key, f"{group_key}_2", simulated_actual_freq)
-            self.hmi_manager.update_actual_frequency(group_key, f"{group_key}_3", simulated_actual_freq)
-
         # 현재 상태 표시
-        st.metric("목표 주파수", f"{group.target_frequency:.1f} Hz")
-        st.metric("실제 평균", f"{group.get_avg_actual_frequency():.1f} Hz")
+        st.metric("목표 주파수", f"{snap['target']:.1f} Hz")
+        st.metric("실제 평균", f"{snap['avg']:.1f} Hz")
 
-        deviation = group.get_max_deviation()
-        deviation_status = self.hmi_manager.get_deviation_status(group_key)
+        deviation = snap['max_dev']
+        deviation_status = snap['status']
 
         if deviation_status == "Green":
             st.success(f"✅ 편차: {deviation:.2f} Hz (정상)")
@@ -726,58 +1385,37 @@ class Dashboard:
         else:
             st.error(f"🔴 편차: {deviation:.2f} Hz (경고)")
 
-    def _render_frequency_comparison_table(self):
-        """주파수 비교 테이블"""
-        # 시뮬레이션 데이터
-        data = []
-
-        for group_key, group_name in [
-            ("SW_PUMPS", "SW 펌프"),
-            ("FW_PUMPS", "FW 펌프"),
-            ("ER_FANS", "E/R 팬")
-        ]:
-            group = self.hmi_manager.groups[group_key]
-
-            # 입력 조건 (시뮬레이션)
-            input_condition = "엔진 75%, T5=35.2°C, T6=43.5°C"
-
-            # AI 계산 주파수
-            ai_frequency = 48.4 if "PUMP" in group_key else 47.3
-
-            # 목표 주파수 - group.target_frequency 사용 (HMI 매니저가 관리)
-            target_freq = group.target_frequency
-
-            # 실제 주파수 - HMI 매니저에서 읽어오기
-            # (실제 시스템에서는 PLC/VFD에서 읽어온 값이 저장되어 있음)
-            actual_freq = group.get_avg_actual_frequency()
-
-            # 만약 실제 주파수가 없으면 (아직 업데이트 안 됨) 목표 주파수로 가정
-            if actual_freq == 0.0:
-                actual_freq = target_freq
-
-            # 편차
-            deviation = abs(target_freq - actual_freq)
-
-            # 편차 상태
-            if deviation < 0.3:
-                status = "🟢 정상"
-            elif deviation < 0.5:
-                status = "🟡 주의"
-            else:
-                status = "🔴 경고"
-
-            data.append({
-                "그룹": group_name,
-                "제어 모드": group.control_mode.value,
-                "입력 조건": input_condition,
-                "AI 계산": f"{ai_frequency:.1f} Hz",
-                "목표 주파수": f"{target_freq:.1f} Hz",
-                "실제 주파수": f"{actual_freq:.1f} Hz",
-                "편차": f"{deviation:.2f} Hz",
-                "상태": status
-            })
-
-        df = pd.DataFrame(data)
+    def _render_frequency_comparison_table(self, snapshot: Dict[str, Dict]):
+        """주파수 비교 테이블 (snapshot: _compute_group_snapshot() 결과)"""
+        # 열 단위 배열로 구성 (그룹 순서: _CONTROL_GROUPS)
+        snaps = [snapshot[group_key] for group_key in _CONTROL_GROUPS]
+
+        # AI 계산 주파수
+        ai_freqs = np.array([_AI_FREQUENCY[group_key] for group_key in _CONTROL_GROUPS])
+
+        # 목표 주파수 - 그룹 target_frequency (HMI 매니저가 관리)
+        target_freqs = np.array([snap['target'] for snap in snaps])
+
+        # 실제 주파수 - HMI 매니저에서 읽어오기
+        # (실제 시스템에서는 PLC/VFD에서 읽어온 값이 저장되어 있음)
+        # 만약 실제 주파수가 없으면 (아직 업데이트 안 됨) 목표 주파수로 가정
+        actual_freqs = np.array([snap['avg'] for snap in snaps])
+        actual_freqs = np.where(actual_freqs == 0.0, target_freqs, actual_freqs)
+
+        # 편차 및 편차 상태
+        deviations = np.abs(target_freqs - actual_freqs)
+        status = np.select([deviations < 0.3, deviations < 0.5], ["🟢 정상", "🟡 주의"], default="🔴 경고")
+
+        df = pd.DataFrame({
+            "그룹": list(_CONTROL_GROUPS.values()),
+            "제어 모드": [snap['mode'].value for snap in snaps],
+            "입력 조건": "엔진 75%, T5=35.2°C, T6=43.5°C",  # 입력 조건 (시뮬레이션)
+            "AI 계산": np.char.mod("%.1f Hz", ai_freqs),
+            "목표 주파수": np.char.mod("%.1f Hz", target_freqs),
+            "실제 주파수": np.char.mod("%.1f Hz", actual_freqs),
+            "편차": np.char.mod("%.2f Hz", deviations),
+            "상태": status
+        })
         st.dataframe(df, use_container_width=True, hide_index=True)
 
         st.caption("💡 ±0.3Hz 이내 편차는 기계적 특성으로 정상 범위입니다.")
@@ -799,223 +1437,67 @@ class Dashboard:
     def _render_energy_savings_trend(self):
         """에너지 절감률 추이"""
         # 시뮬레이션 데이터 추가
-        now = datetime.now()
-        if len(st.session_state.energy_history['timestamps']) == 0 or \
-           (now - st.session_state.energy_history['timestamps'][-1]).seconds >= 1:
-
-            st.session_state.energy_history['sw_pumps'].append(47.5 + (len(st.session_state.energy_history['sw_pumps']) % 20) * 0.1)
-            st.session_state.energy_history['fw_pumps'].append(47.5 + (len(st.session_state.energy_history['fw_pumps']) % 15) * 0.1)
-            st.session_state.energy_history['er_fans'].append(51.0 + (len(st.session_state.energy_history['er_fans']) % 10) * 0.1)
-            st.session_state.energy_history['timestamps'].append(now)
-
-            # 최근 3600개만 유지 (1시간)
-            if len(st.session_state.energy_history['timestamps']) > 3600:
-                st.session_state.energy_history['sw_pumps'] = st.session_state.energy_history['sw_pumps'][-3600:]
-                st.session_state.energy_history['fw_pumps'] = st.session_state.energy_history['fw_pumps'][-3600:]
-                st.session_state.energy_history['er_fans'] = st.session_state.energy_history['er_fans'][-3600:]
-                st.session_state.energy_history['timestamps'] = st.session_state.energy_history['timestamps'][-3600:]
-
-        # 그래프 생성
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatter(
-            x=st.session_state.energy_history['timestamps'],
-            y=st.session_state.energy_history['sw_pumps'],
-            name='SW 펌프',
-            line=dict(color='blue', width=2)
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=st.session_state.energy_history['timestamps'],
-            y=st.session_state.energy_history['fw_pumps'],
-            name='FW 펌프',
-            line=dict(color='green', width=2)
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=st.session_state.energy_history['timestamps'],
-            y=st.session_state.energy_history['er_fans'],
-            name='E/R 팬',
-            line=dict(color='red', width=2)
-        ))
-
-        # 목표 절감률 라인
-        fig.add_hrect(y0=46, y1=52, line_width=0, fillcolor="green", opacity=0.1,
-                     annotation_text="펌프 목표 범위", annotation_position="top left")
-        fig.add_hrect(y0=50, y1=58, line_width=0, fillcolor="red", opacity=0.1,
-                     annotation_text="팬 목표 범위", annotation_position="bottom left")
-
-        fig.update_layout(
-            height=400,
-            margin=dict(l=20, r=20, t=20, b=90),
-            xaxis_title="시간",
-            yaxis_title="절감률 (%)",
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.35,
-                xanchor="center",
-                x=0.5
-            )
+        history = st.session_state.energy_history
+        now = self.render_time
+        updated = self.render_monotonic - st.session_state.get('_last_energy_sample_m', 0.0) >= 1.0
+        if updated:
+            st.session_state['_last_energy_sample_m'] = self.render_monotonic
+            tick = st.session_state.energy_tick
+            history['sw_pumps'].append(47.5 + (tick % 20) * 0.1)
+            history['fw_pumps'].append(47.5 + (tick % 15) * 0.1)
+            history['er_fans'].append(51.0 + (tick % 10) * 0.1)
+            history['timestamps'].append(now)
+            st.session_state.energy_tick = tick + 1
+
+        # 그래프 (세션에 보관한 Figure의 트레이스 데이터만 갱신)
+        fig = _get_trend_fig(
+            'energy_trend_fig', _build_energy_trend_fig, history,
+            tuple(key for key, _, _ in _ENERGY_TREND_TRACES), updated
         )
-
         st.plotly_chart(fig, use_container_width=True)
 
     def _render_energy_savings_comparison(self):
         """60Hz vs AI 제어 에너지 절감 비교"""
         # 시뮬레이션 데이터: 실제 주파수
-        sw_freq = self.hmi_manager.groups["SW_PUMPS"].target_frequency  # 예: 48.4 Hz
-        fw_freq = self.hmi_manager.groups["FW_PUMPS"].target_frequency  # 예: 48.4 Hz
-        er_freq = self.hmi_manager.groups["ER_FANS"].target_frequency   # 예: 47.3 Hz
-
-        # 정격 출력 (kW)
-        sw_rated = 132.0
-        fw_rated = 75.0
-        er_rated = 54.3
-
-        # 운전 대수
-        sw_running = 2
-        fw_running = 2
-        er_running = 3
+        groups = self.hmi_manager.groups
+        sw_freq = groups["SW_PUMPS"].target_frequency  # 예: 48.4 Hz
+        fw_freq = groups["FW_PUMPS"].target_frequency  # 예: 48.4 Hz
+        er_freq = groups["ER_FANS"].target_frequency   # 예: 47.3 Hz
 
-        # 전력 계산 (세제곱 법칙: P ∝ (f/60)³)
-        def calc_power(freq, rated_kw, running_count):
-            return rated_kw * ((freq / 60.0) ** 3) * running_count
-
-        # 60Hz 고정 운전 시 전력
-        sw_60hz = calc_power(60.0, sw_rated, sw_running)
-        fw_60hz = calc_power(60.0, fw_rated, fw_running)
-        er_60hz = calc_power(60.0, er_rated, er_running)
-        total_60hz = sw_60hz + fw_60hz + er_60hz
-
-        # AI 제어 운전 시 전력
-        sw_ai = calc_power(sw_freq, sw_rated, sw_running)
-        fw_ai = calc_power(fw_freq, fw_rated, fw_running)
-        er_ai = calc_power(er_freq, er_rated, er_running)
-        total_ai = sw_ai + fw_ai + er_ai
-
-        # 절감량
-        sw_saved = sw_60hz - sw_ai
-        fw_saved = fw_60hz - fw_ai
-        er_saved = er_60hz - er_ai
-        total_saved = total_60hz - total_ai
-
-        # 절감률
-        sw_ratio = (sw_saved / sw_60hz) * 100
-        fw_ratio = (fw_saved / fw_60hz) * 100
-        er_ratio = (er_saved / er_60hz) * 100
-        total_ratio = (total_saved / total_60hz) * 100
+        # 주파수가 같으면 캐시된 계산 결과 재사용
+        savings = _compute_energy_savings(sw_freq, fw_freq, er_freq)
 
         # 상단: 전체 절감 요약
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.metric("💡 60Hz 고정 운전", f"{total_60hz:.1f} kW", help="모든 장비를 60Hz로 운전할 때 소비 전력")
+            st.metric("💡 60Hz 고정 운전", f"{savings['total_60hz']:.1f} kW", help="모든 장비를 60Hz로 운전할 때 소비 전력")
         with col2:
-            st.metric("🤖 AI 제어 운전", f"{total_ai:.1f} kW", help="AI가 최적화한 주파수로 운전할 때 소비 전력")
+            st.metric("🤖 AI 제어 운전", f"{savings['total_ai']:.1f} kW", help="AI가 최적화한 주파수로 운전할 때 소비 전력")
         with col3:
-            st.metric("💰 절감 전력", f"{total_saved:.1f} kW", f"-{total_ratio:.1f}%", delta_color="inverse")
+            st.metric("💰 절감 전력", f"{savings['total_saved']:.1f} kW", f"-{savings['total_ratio']:.1f}%", delta_color="inverse")
         with col4:
-            st.metric("📊 절감률", f"{total_ratio:.1f}%", help="에너지 절감 비율")
+            st.metric("📊 절감률", f"{savings['total_ratio']:.1f}%", help="에너지 절감 비율")
 
         st.markdown("---")
 
         # 그룹별 비교 바 차트
         st.markdown("### 그룹별 상세 비교")
 
-        # 데이터 준비
-        groups = ['SW 펌프', 'FW 펌프', 'E/R 팬']
-        power_60hz = [sw_60hz, fw_60hz, er_60hz]
-        power_ai = [sw_ai, fw_ai, er_ai]
-
-        fig = go.Figure()
-
-        # 60Hz 바
-        fig.add_trace(go.Bar(
-            name='60Hz 고정',
-            x=groups,
-            y=power_60hz,
-            marker_color='lightcoral',
-            text=[f"{p:.1f} kW" for p in power_60hz],
-            textposition='auto',
-        ))
-
-        # AI 제어 바
-        fig.add_trace(go.Bar(
-            name='AI 제어',
-            x=groups,
-            y=power_ai,
-            marker_color='lightgreen',
-            text=[f"{p:.1f} kW" for p in power_ai],
-            textposition='auto',
-        ))
-
-        fig.update_layout(
-            barmode='group',
-            height=400,
-            yaxis_title='소비 전력 (kW)',
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
-            margin=dict(l=20, r=20, t=80, b=20)
-        )
-
+        fig = _build_energy_bar_fig(_ENERGY_GROUP_LABELS, savings['power_60hz'], savings['power_ai'])
         st.plotly_chart(fig, use_container_width=True)
 
         # 하단: 상세 테이블
         st.markdown("### 📋 상세 데이터")
 
-        comparison_data = [
-            {
-                "그룹": "SW 펌프",
-                "운전 대수": f"{sw_running}대",
-                "AI 주파수": f"{sw_freq:.1f} Hz",
-                "60Hz 전력": f"{sw_60hz:.1f} kW",
-                "AI 전력": f"{sw_ai:.1f} kW",
-                "절감량": f"{sw_saved:.1f} kW",
-                "절감률": f"{sw_ratio:.1f}%"
-            },
-            {
-                "그룹": "FW 펌프",
-                "운전 대수": f"{fw_running}대",
-                "AI 주파수": f"{fw_freq:.1f} Hz",
-                "60Hz 전력": f"{fw_60hz:.1f} kW",
-                "AI 전력": f"{fw_ai:.1f} kW",
-                "절감량": f"{fw_saved:.1f} kW",
-                "절감률": f"{fw_ratio:.1f}%"
-            },
-            {
-                "그룹": "E/R 팬",
-                "운전 대수": f"{er_running}대",
-                "AI 주파수": f"{er_freq:.1f} Hz",
-                "60Hz 전력": f"{er_60hz:.1f} kW",
-                "AI 전력": f"{er_ai:.1f} kW",
-                "절감량": f"{er_saved:.1f} kW",
-                "절감률": f"{er_ratio:.1f}%"
-            }
-        ]
-
-        df = pd.DataFrame(comparison_data)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        st.dataframe(savings['table'], use_container_width=True, hide_index=True)
 
         st.info("💡 **계산 기준**: 전력 = 정격출력 × (주파수/60)³ × 운전대수 (세제곱 법칙 적용)")
 
     def _render_runtime_equalization(self):
         """운전 시간 균등화 모니터링"""
-        # 시뮬레이션 데이터
-        runtime_data = [
-            {"장비": "SW-P1", "총 운전 시간": 1250, "금일 운전 시간": 18.5, "연속 운전 시간": 6.2, "정비 예정": "250시간 후"},
-            {"장비": "SW-P2", "총 운전 시간": 1180, "금일 운전 시간": 5.5, "연속 운전 시간": 0.0, "정비 예정": "320시간 후"},
-            {"장비": "SW-P3", "총 운전 시간": 1220, "금일 운전 시간": 0.0, "연속 운전 시간": 0.0, "정비 예정": "280시간 후"},
-            {"장비": "FW-P1", "총 운전 시간": 1270, "금일 운전 시간": 18.5, "연속 운전 시간": 6.2, "정비 예정": "230시간 후"},
-            {"장비": "FW-P2", "총 운전 시간": 1190, "금일 운전 시간": 5.5, "연속 운전 시간": 0.0, "정비 예정": "310시간 후"},
-            {"장비": "FW-P3", "총 운전 시간": 1230, "금일 운전 시간": 0.0, "연속 운전 시간": 0.0, "정비 예정": "270시간 후"},
-            {"장비": "ER-F1", "총 운전 시간": 1100, "금일 운전 시간": 5.2, "연속 운전 시간": 2.1, "정비 예정": "400시간 후"},
-            {"장비": "ER-F2", "총 운전 시간": 1050, "금일 운전 시간": 5.3, "연속 운전 시간": 2.1, "정비 예정": "450시간 후"},
-            {"장비": "ER-F3", "총 운전 시간": 1075, "금일 운전 시간": 5.1, "연속 운전 시간": 2.1, "정비 예정": "425시간 후"},
-            {"장비": "ER-F4", "총 운전 시간": 1080, "금일 운전 시간": 0.0, "연속 운전 시간": 0.0, "정비 예정": "420시간 후"},
-        ]
-
-        df = pd.DataFrame(runtime_data)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        # 시뮬레이션 데이터 (모듈 로드 시 한 번 생성)
+        st.dataframe(_RUNTIME_TABLE, use_container_width=True, hide_index=True)
 
         # 수동 개입 옵션
         st.markdown("---")
@@ -1026,8 +1508,7 @@ class Dashboard:
         with col1:
             selected_equipment = st.selectbox(
                 "장비 선택",
-                options=["SW-P1", "SW-P2", "SW-P3", "FW-P1", "FW-P2", "FW-P3",
-                        "ER-F1", "ER-F2", "ER-F3", "ER-F4"]
+                options=_EQUIPMENT_IDS
             )
 
         with col2:
@@ -1044,21 +1525,8 @@ class Dashboard:
         st.header("🔔 알람 관리")
 
         # 알람 필터 스타일 (부드러운 파스텔 톤)
-        st.markdown("""
-            <style>
-            /* Multiselect 선택된 항목 스타일 */
-            .stMultiSelect span[data-baseweb="tag"] {
-                background-color: #E8EAF6 !important;
-                color: #3F51B5 !important;
-                border: 1px solid #C5CAE9 !important;
-            }
-
-            /* X 버튼 색상 */
-            .stMultiSelect span[data-baseweb="tag"] button {
-                color: #5C6BC0 !important;
-            }
-            </style>
-        """, unsafe_allow_html=True)
+        # Streamlit은 재실행 시 다시 그리지 않은 요소를 제거하므로 매 실행마다 출력
+        st.markdown(_ALARM_FILTER_CSS, unsafe_allow_html=True)
 
         # 알람 필터
         col1, col2 = st.columns([3, 1])
@@ -1066,41 +1534,36 @@ class Dashboard:
         with col1:
             filter_priority = st.multiselect(
                 "우선순위 필터",
-                options=["🔴 CRITICAL", "🟡 WARNING", "🔵 INFO"],
-                default=["🔴 CRITICAL", "🟡 WARNING", "🔵 INFO"],
+                options=list(_EMOJI_TO_PRIORITY),
+                default=list(_EMOJI_TO_PRIORITY),
                 format_func=lambda x: x  # 이모지 포함해서 표시
             )
 
         with col2:
             show_acknowledged = st.checkbox("확인된 알람 표시", value=False)
 
-        # 알람 리스트
-        alarms = self.hmi_manager.alarms
+        # 알람 리스트 (최신순 사본)
+        alarms = self.hmi_manager.get_alarms()
 
-        # 필터에서 이모지 제거하여 비교
-        filter_priority_clean = [f.split(" ")[1] if " " in f else f for f in filter_priority]
+        # 선택된 필터 라벨 → 우선순위 집합
+        allowed_priorities = frozenset(_EMOJI_TO_PRIORITY[f] for f in filter_priority)
 
-        # 필터 적용
+        # 필터 적용 (원본 알람 인덱스를 함께 보관하여 확인 처리에 사용)
         filtered_alarms = [
-            alarm for alarm in alarms
-            if alarm.priority.value in filter_priority_clean and
+            (idx, alarm) for idx, alarm in enumerate(alarms)
+            if alarm.priority in allowed_priorities and
             (show_acknowledged or not alarm.acknowledged)
         ]
 
         if not filtered_alarms:
             st.info("📭 표시할 알람이 없습니다.")
+        elif len(filtered_alarms) >= _ALARM_TABLE_THRESHOLD:
+            # 알람이 많으면 카드 대신 하나의 테이블로 표시
+            self._render_alarm_table(filtered_alarms)
         else:
-            for idx, alarm in enumerate(filtered_alarms):
+            for idx, alarm in filtered_alarms:
                 # 알람 색상
-                if alarm.priority == AlarmPriority.CRITICAL:
-                    color = "🔴"
-                    bg_color = "#ffcccc"
-                elif alarm.priority == AlarmPriority.WARNING:
-                    color = "🟡"
-                    bg_color = "#fff4cc"
-                else:
-                    color = "🔵"
-                    bg_color = "#cce5ff"
+                color, bg_color = _ALARM_STYLE[alarm.priority]
 
                 # 알람 카드
                 with st.container():
@@ -1116,30 +1579,54 @@ class Dashboard:
                     with col3:
                         if not alarm.acknowledged:
                             if st.button("확인", key=f"ack_{idx}"):
-                                self.hmi_manager.acknowledge_alarm(
-                                    self.hmi_manager.alarms.index(alarm)
-                                )
+                                self.hmi_manager.acknowledge_alarm(idx)
                                 st.rerun()
                         else:
                             st.success("✅ 확인됨")
 
                     st.markdown("---")
 
-        # 알람 통계
+        # 알람 통계 (HMI 관리자의 우선순위별 알람 목록 크기)
         st.subheader("📊 알람 통계")
+        alarm_count = self.hmi_manager.get_alarm_count
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            critical_count = len([a for a in alarms if a.priority == AlarmPriority.CRITICAL])
-            st.metric("🔴 CRITICAL", critical_count)
+            st.metric("🔴 CRITICAL", alarm_count(AlarmPriority.CRITICAL))
 
         with col2:
-            warning_count = len([a for a in alarms if a.priority == AlarmPriority.WARNING])
-            st.metric("🟡 WARNING", warning_count)
+            st.metric("🟡 WARNING", alarm_count(AlarmPriority.WARNING))
 
         with col3:
-            info_count = len([a for a in alarms if a.priority == AlarmPriority.INFO])
-            st.metric("🔵 INFO", info_count)
+            st.metric("🔵 INFO", alarm_count(AlarmPriority.INFO))
+
+    def _render_alarm_table(self, filtered_alarms):
+        """알람 목록 테이블 렌더링 (확인 열 체크 시 알람 확인 처리)"""
+        indices = [idx for idx, _ in filtered_alarms]
+        alarm_list = [alarm for _, alarm in filtered_alarms]
+
+        df = pd.DataFrame({
+            "": [_ALARM_STYLE[a.priority][0] for a in alarm_list],
+            "장비": [a.equipment for a in alarm_list],
+            "메시지": [a.message for a in alarm_list],
+            "시간": [a.timestamp.strftime("%Y-%m-%d %H:%M:%S") for a in alarm_list],
+            "확인": [a.acknowledged for a in alarm_list]
+        }, index=indices)
+
+        edited = st.data_editor(
+            df,
+            use_container_width=True,
+            hide_index=True,
+            disabled=["", "장비", "메시지", "시간"],
+            column_config={"확인": st.column_config.CheckboxColumn("확인")}
+        )
+
+        # 새로 체크된 알람만 확인 처리 (확인 해제는 지원하지 않음)
+        newly_acked = df.index[edited["확인"].to_numpy() & ~df["확인"].to_numpy()]
+        if len(newly_acked) > 0:
+            for idx in newly_acked:
+                self.hmi_manager.acknowledge_alarm(int(idx))
+            st.rerun()
 
     def _render_learning_progress(self):
         """학습 진행 렌더링"""
@@ -1186,49 +1673,7 @@ class Dashboard:
         # 주간 개선 추이 (시뮬레이션)
         st.subheader("📈 주간 개선 추이")
 
-        weeks = list(range(1, 9))
-        temp_accuracy = [72.0, 74.5, 76.2, 77.8, 79.1, 80.3, 81.4, 82.5]
-        energy_savings = [42.0, 44.5, 46.2, 47.5, 48.5, 49.0, 49.5, 49.8]
-
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatter(
-            x=weeks,
-            y=temp_accuracy,
-            name='온도 예측 정확도 (%)',
-            line=dict(color='blue', width=3),
-            marker=dict(size=8)
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=weeks,
-            y=energy_savings,
-            name='에너지 절감률 (%)',
-            line=dict(color='green', width=3),
-            marker=dict(size=8),
-            yaxis='y2'
-        ))
-
-        fig.update_layout(
-            height=400,
-            margin=dict(l=20, r=20, t=20, b=90),
-            xaxis_title="주차",
-            yaxis_title="온도 예측 정확도 (%)",
-            yaxis2=dict(
-                title="에너지 절감률 (%)",
-                overlaying='y',
-                side='right'
-            ),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.35,
-                xanchor="center",
-                x=0.5
-            )
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_build_weekly_trend_fig(), use_container_width=True)
 
         st.markdown("---")
 
@@ -1329,25 +1774,15 @@ class Dashboard:
 
         with col1:
             st.markdown("**해역**")
-            if env.sea_region == SeaRegion.TROPICAL:
-                st.success("🌴 열대 (Tropical)")
-                st.caption("위도 ±23.5° 이내")
-            elif env.sea_region == SeaRegion.TEMPERATE:
-                st.info("🌊 온대 (Temperate)")
-                st.caption("위도 23.5° ~ 66.5°")
-            else:
-                st.error("❄️ 극지 (Polar)")
-                st.caption("위도 66.5° 이상")
+            show, label, latitude_range = _SEA_REGION_DISPLAY.get(
+                env.sea_region, _SEA_REGION_DISPLAY[SeaRegion.POLAR]
+            )
+            show(label)
+            st.caption(latitude_range)
 
         with col2:
             st.markdown("**계절**")
-            season_emoji = {
-                Season.SPRING: "🌸 봄",
-                Season.SUMMER: "☀️ 여름",
-                Season.AUTUMN: "🍂 가을",
-                Season.WINTER: "❄️ 겨울"
-            }
-            st.info(season_emoji.get(env.season, "Unknown"))
+            st.info(_SEASON_LABEL.get(env.season, "Unknown"))
 
         with col3:
             st.markdown("**추정 해수 온도**")
@@ -1389,30 +1824,9 @@ class Dashboard:
         # 하단: 위치 지도 (간단한 좌표 표시)
         st.subheader("📍 현재 위치")
 
-        # Plotly로 간단한 지도 표시
-        import plotly.graph_objects as go
-
-        fig = go.Figure(go.Scattergeo(
-            lon=[env.longitude],
-            lat=[env.latitude],
-            text=[f"선속: {env.speed_knots:.1f} knots"],
-            mode='markers+text',
-            marker=dict(size=15, color='red', symbol='circle'),
-            textposition='top center'
-        ))
-
-        fig.update_layout(
-            title=f"위치: {env.latitude:.4f}°, {env.longitude:.4f}°",
-            geo=dict(
-                scope='asia',
-                projection_type='natural earth',
-                showland=True,
-                landcolor='rgb(243, 243, 243)',
-                coastlinecolor='rgb(204, 204, 204)',
-                center=dict(lat=env.latitude, lon=env.longitude),
-                projection_scale=3
-            ),
-            height=400
+        # Plotly로 간단한 지도 표시 (표시 정밀도 기준으로 캐시)
+        fig = _build_position_map_fig(
+            round(env.latitude, 4), round(env.longitude, 4), round(env.speed_knots, 1)
         )
 
         st.plotly_chart(fig, use_container_width=True)
@@ -1426,9 +1840,7 @@ class Dashboard:
         st.header("🔧 VFD 상태 진단")
 
         # 시뮬레이션: VFD 데이터 생성 (초기화 시에만)
-        if 'vfd_initialized' not in st.session_state:
-            self._initialize_vfd_simulation()
-            st.session_state.vfd_initialized = True
+        self._ensure_vfd_simulation()
 
         diagnostics = self.hmi_manager.get_vfd_diagnostics()
 
@@ -1436,64 +1848,35 @@ class Dashboard:
             st.warning("⚠️ VFD 진단 데이터가 없습니다.")
             return
 
-        # 상단: 상태 요약
-        summary = self.hmi_manager.get_vfd_summary()
+        # 상단: 상태 요약 (이미 조회한 진단 결과에서 한 번에 집계)
+        grades = Counter(d.status_grade for d in diagnostics.values())
 
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            st.metric("전체 VFD", summary["total"])
-
-        with col2:
-            st.metric("🟢 정상", summary["normal"])
-
-        with col3:
-            st.metric("🟡 주의", summary["caution"])
-
-        with col4:
-            st.metric("🟠 경고", summary["warning"])
-
-        with col5:
-            st.metric("🔴 위험", summary["critical"])
+        total_col, *grade_cols = st.columns(1 + len(_VFD_SUMMARY_GRADES))
+        total_col.metric("전체 VFD", len(self.hmi_manager.vfd_monitor.vfds))
+        for col, (label, grade) in zip(grade_cols, _VFD_SUMMARY_GRADES):
+            col.metric(label, grades[grade])
 
         st.markdown("---")
 
         # VFD 그룹별 표시
         st.subheader("📊 VFD 상태 상세")
 
-        # SW 펌프
-        st.markdown("**SW 펌프 (132kW x 3대)**")
-        col1, col2, col3 = st.columns(3)
-        for i, col in enumerate([col1, col2, col3], 1):
-            vfd_id = f"SW_PUMP_{i}"
-            if vfd_id in diagnostics:
-                self._render_vfd_card(col, diagnostics[vfd_id])
-
-        st.markdown("---")
-
-        # FW 펌프
-        st.markdown("**FW 펌프 (75kW x 3대)**")
-        col1, col2, col3 = st.columns(3)
-        for i, col in enumerate([col1, col2, col3], 1):
-            vfd_id = f"FW_PUMP_{i}"
-            if vfd_id in diagnostics:
-                self._render_vfd_card(col, diagnostics[vfd_id])
+        for prefix, count, title in _VFD_GROUPS:
+            st.markdown(title)
+            for col, vfd_id in zip(st.columns(count), _VFD_GROUP_IDS[prefix]):
+                diagnostic = diagnostics.get(vfd_id)
+                if diagnostic:
+                    self._render_vfd_card(col, diagnostic)
 
-        st.markdown("---")
-
-        # E/R 팬
-        st.markdown("**E/R 팬 (54.3kW x 4대)**")
-        col1, col2, col3, col4 = st.columns(4)
-        for i, col in enumerate([col1, col2, col3, col4], 1):
-            vfd_id = f"ER_FAN_{i}"
-            if vfd_id in diagnostics:
-                self._render_vfd_card(col, diagnostics[vfd_id])
-
-        st.markdown("---")
+            st.markdown("---")
 
         # 상세 진단 정보 (선택한 VFD)
         st.subheader("🔍 상세 진단")
+        self._render_vfd_detail(diagnostics)
 
+    @st.fragment
+    def _render_vfd_detail(self, diagnostics):
+        """선택한 VFD 상세 진단 렌더링 (선택 변경 시 이 영역만 재실행)"""
         selected_vfd = st.selectbox(
             "VFD 선택",
             options=list(diagnostics.keys()),
@@ -1502,7 +1885,7 @@ class Dashboard:
 
         if selected_vfd in diagnostics:
             diag = diagnostics[selected_vfd]
-            prediction = self.vfd_predictive.predict(diag)
+            prediction = self._get_vfd_prediction(diag)
 
             col1, col2 = st.columns([2, 1])
 
@@ -1533,11 +1916,7 @@ class Dashboard:
                     pred_col1, pred_col2, pred_col3, pred_col4 = st.columns(4)
 
                     with pred_col1:
-                        trend_icon = {
-                            'rising': '↑ 상승',
-                            'falling': '↓ 하강',
-                            'stable': '→ 안정'
-                        }.get(prediction.temp_trend, '→ 안정')
+                        trend_icon = _TEMP_TREND_LABEL.get(prediction.temp_trend, '→ 안정')
                         st.metric(
                             "온도 추세",
                             trend_icon,
@@ -1596,170 +1975,102 @@ class Dashboard:
 
             with col2:
                 # 상태 등급
-                status_color = {
-                    VFDStatus.NORMAL: "🟢",
-                    VFDStatus.CAUTION: "🟡",
-                    VFDStatus.WARNING: "🟠",
-                    VFDStatus.CRITICAL: "🔴"
-                }
-
-                st.markdown(f"### {status_color.get(diag.status_grade, '⚪')} {diag.status_grade.value.upper()}")
+                status_emoji = _VFD_STYLE[diag.status_grade][0]
+                st.markdown(f"### {status_emoji} {diag.status_grade.value.upper()}")
                 st.metric("심각도 점수", f"{diag.severity_score}/100")
 
                 st.markdown("---")
 
                 # 통계
                 st.markdown("**누적 통계:**")
-                st.text(f"운전 시간: {diag.cumulative_runtime_hours:.1f}h")
-                st.text(f"Trip 횟수: {diag.trip_count}")
-                st.text(f"Error 횟수: {diag.error_count}")
-                st.text(f"Warning 횟수: {diag.warning_count}")
+                st.text(
+                    f"운전 시간: {diag.cumulative_runtime_hours:.1f}h\n"
+                    f"Trip 횟수: {diag.trip_count}\n"
+                    f"Error 횟수: {diag.error_count}\n"
+                    f"Warning 횟수: {diag.warning_count}"
+                )
 
                 st.markdown("---")
 
-                # StatusBits
-                st.markdown("**Status Bits:**")
+                # StatusBits (제목 + 표를 Markdown 한 블록으로)
                 bits = diag.status_bits
-                st.text(f"{'✅' if bits.control_ready else '❌'} Control Ready")
-                st.text(f"{'✅' if bits.drive_ready else '❌'} Drive Ready")
-                st.text(f"{'✅' if bits.in_operation else '❌'} In Operation")
-                st.text(f"{'❌' if bits.trip else '✅'} No Trip")
-                st.text(f"{'❌' if bits.error else '✅'} No Error")
-                st.text(f"{'❌' if bits.warning else '✅'} No Warning")
-
-    def _render_vfd_card(self, col, diagnostic):
-        """VFD 카드 렌더링 (예방진단 데이터 포함)"""
-        with col:
-            # 상태 색상
-            if diagnostic.status_grade == VFDStatus.NORMAL:
-                status_emoji = "🟢"
-                status_text = "정상"
-            elif diagnostic.status_grade == VFDStatus.CAUTION:
-                status_emoji = "🟡"
-                status_text = "주의"
-            elif diagnostic.status_grade == VFDStatus.WARNING:
-                status_emoji = "🟠"
-                status_text = "경고"
-            else:
-                status_emoji = "🔴"
-                status_text = "위험"
-
-            st.markdown(f"**{diagnostic.vfd_id.replace('_', ' ')}**")
-            st.markdown(f"{status_emoji} {status_text}")
-            st.metric("주파수", f"{diagnostic.current_frequency_hz:.1f} Hz")
-            st.metric("모터 온도", f"{diagnostic.motor_temperature_c:.1f}°C")
-
-            # 예방진단 데이터 추가
+                rows = [
+                    f"| {'✅' if getattr(bits, attr) ^ invert else '❌'} | {label} |"
+                    for attr, label, invert in _STATUS_BIT_ROWS
+                ]
+                st.markdown("\n".join(["**Status Bits:**", "", "| 상태 | 신호 |", "|:-:|---|"] + rows))
+
+    def _get_vfd_prediction(self, diagnostic):
+        """이번 렌더링의 예방진단 결과 재사용 (없으면 새로 예측)"""
+        prediction = self.vfd_predictions.get(diagnostic.vfd_id)
+        if prediction is None:
             prediction = self.vfd_predictive.predict(diagnostic)
-            if prediction:
-                # 온도 추세 아이콘
-                trend_icon = {
-                    'rising': '↑',
-                    'falling': '↓',
-                    'stable': '→'
-                }.get(prediction.temp_trend, '→')
-
-                st.metric(
-                    "30분 후 예측",
-                    f"{prediction.predicted_temp_30min:.1f}°C",
-                    f"{trend_icon} {prediction.temp_rise_rate:.2f}°C/min"
-                )
+        return prediction
 
-                # 이상 점수
-                anomaly_color = (
-                    "🔴" if prediction.anomaly_score > 75 else
-                    "🟠" if prediction.anomaly_score > 50 else
-                    "🟡" if prediction.anomaly_score > 25 else "🟢"
-                )
-                st.caption(f"{anomaly_color} 이상점수: {prediction.anomaly_score:.0f}/100")
-
-                # 수명 잔여율
-                st.caption(f"💚 수명: {prediction.remaining_life_percent:.0f}%")
+    def _render_vfd_card(self, col, diagnostic):
+        """VFD 카드 렌더링 (예방진단 데이터 포함, 카드당 Markdown 한 블록)"""
+        col.markdown(_vfd_card_markdown(diagnostic, self._get_vfd_prediction(diagnostic)))
 
-            st.caption(f"⏱ 운전: {diagnostic.cumulative_runtime_hours:.1f}h")
+    def _ensure_vfd_simulation(self) -> bool:
+        """VFD 시뮬레이션 데이터가 없으면 생성 (세션당 한 번, 이번 호출에서 생성했으면 True)"""
+        if 'vfd_initialized' in st.session_state:
+            return False
+        self._initialize_vfd_simulation()
+        st.session_state.vfd_initialized = True
+        return True
 
     def _initialize_vfd_simulation(self):
         """VFD 시뮬레이션 데이터 초기화"""
-        import random
-
-        # 그룹별 주파수 설정 (같은 그룹은 동일한 주파수)
-        group_frequencies = {
-            'SW_PUMP': self.hmi_manager.groups['SW_PUMPS'].target_frequency,
-            'FW_PUMP': self.hmi_manager.groups['FW_PUMPS'].target_frequency,
-            'ER_FAN': self.hmi_manager.groups['ER_FANS'].target_frequency
-        }
-
-        # 10개 VFD에 대한 시뮬레이션 데이터 생성
-        vfd_list = [
-            *[f"SW_PUMP_{i}" for i in range(1, 4)],
-            *[f"FW_PUMP_{i}" for i in range(1, 4)],
-            *[f"ER_FAN_{i}" for i in range(1, 5)]
-        ]
-
-        for vfd_id in vfd_list:
-            # 대부분 정상, 일부 주의/경고
-            is_running = vfd_id.endswith("1") or vfd_id.endswith("2") or (vfd_id.startswith("ER") and vfd_id.endswith("3"))
-
-            # 그룹명 추출
-            group_name = '_'.join(vfd_id.split('_')[:-1])
-
-            if is_running:
-                # 그룹별 목표 주파수 사용 (±0.5Hz 오차 허용)
-                freq = group_frequencies[group_name] + random.uniform(-0.5, 0.5)
-                current = random.uniform(100.0, 150.0)
-                motor_temp = random.uniform(55.0, 75.0)
-                heatsink_temp = random.uniform(45.0, 60.0)
-
-                # 일부 VFD에 경고 상태 부여
-                has_warning = vfd_id == "SW_PUMP_2"
-
-                status_bits = DanfossStatusBits(
-                    trip=False,
-                    error=False,
-                    warning=has_warning,
-                    voltage_exceeded=False,
-                    torque_exceeded=False,
-                    thermal_exceeded=False,
-                    control_ready=True,
-                    drive_ready=True,
-                    in_operation=True,
-                    speed_equals_reference=True,
-                    bus_control=True
-                )
-            else:
-                # Stand-by 상태
-                freq = 0.0
-                current = 0.0
-                motor_temp = 35.0
-                heatsink_temp = 30.0
-
-                status_bits = DanfossStatusBits(
-                    trip=False,
-                    error=False,
-                    warning=False,
-                    voltage_exceeded=False,
-                    torque_exceeded=False,
-                    thermal_exceeded=False,
-                    control_ready=True,
-                    drive_ready=True,
-                    in_operation=False,
-                    speed_equals_reference=False,
-                    bus_control=True
-                )
+        # 10개 VFD에 대한 시뮬레이션 데이터 생성 (같은 그룹은 동일한 목표 주파수 기준)
+        groups = self.hmi_manager.groups
+        vfd_list = _VFD_IDS
+        is_running = _VFD_SIM_RUNNING
+        base_freqs = np.array([groups[group_key].target_frequency for group_key in _VFD_TO_GROUP.values()])
+
+        # 난수 일괄 생성 (운전 중: 그룹 목표 주파수 ±0.5Hz, Stand-by: 고정값)
+        rng = np.random.default_rng()
+        n = len(vfd_list)
+        freqs = np.where(is_running, base_freqs + rng.uniform(-0.5, 0.5, n), 0.0)
+        currents = np.where(is_running, rng.uniform(100.0, 150.0, n), 0.0)
+        motor_temps = np.where(is_running, rng.uniform(55.0, 75.0, n), 35.0)
+        heatsink_temps = np.where(is_running, rng.uniform(45.0, 60.0, n), 30.0)
+        runtimes = rng.uniform(1000.0, 5000.0, n)
+
+        hmi_manager = self.hmi_manager
+        vfd_monitor = hmi_manager.vfd_monitor
+        for i, vfd_id in enumerate(vfd_list):
+            running = bool(is_running[i])
+
+            # 일부 VFD에 경고 상태 부여
+            has_warning = running and vfd_id == "SW_PUMP_2"
+
+            status_bits = DanfossStatusBits(
+                trip=False,
+                error=False,
+                warning=has_warning,
+                voltage_exceeded=False,
+                torque_exceeded=False,
+                thermal_exceeded=False,
+                control_ready=True,
+                drive_ready=True,
+                in_operation=running,
+                speed_equals_reference=running,
+                bus_control=True
+            )
 
-            diagnostic = self.hmi_manager.vfd_monitor.diagnose_vfd(
+            diagnostic = vfd_monitor.diagnose_vfd(
                 vfd_id=vfd_id,
                 status_bits=status_bits,
-                frequency_hz=freq,
-                output_current_a=current,
+                frequency_hz=float(freqs[i]),
+                output_current_a=float(currents[i]),
                 output_voltage_v=400.0,
                 dc_bus_voltage_v=540.0,
-                motor_temp_c=motor_temp,
-                heatsink_temp_c=heatsink_temp,
-                runtime_seconds=random.uniform(1000.0, 5000.0)
+                motor_temp_c=float(motor_temps[i]),
+                heatsink_temp_c=float(heatsink_temps[i]),
+                runtime_seconds=float(runtimes[i])
             )
 
-            self.hmi_manager.update_vfd_diagnostic(vfd_id, diagnostic)
+            hmi_manager.update_vfd_diagnostic(vfd_id, diagnostic)
 
         # VFD 예방진단 예측 수행 및 공유 파일에 저장
         self._update_predictive_diagnostics()
@@ -1773,6 +2084,7 @@ class Dashboard:
         for vfd_id, diagnostic in diagnostics.items():
             prediction = self.vfd_predictive.predict(diagnostic)
             predictions[vfd_id] = prediction
+        self.vfd_predictions = predictions
 
         # 공유 파일에 저장 (HMI가 읽을 수 있도록)
         try:
@@ -1781,42 +2093,9 @@ class Dashboard:
             import logging
             logging.error(f"공유 파일 저장 실패: {e}")
 
-    def _render_scenario_testing(self):
-        """시나리오 테스트 렌더링"""
-        st.header("🎬 시나리오 테스트")
-
-        st.info("""
-        **시나리오 모드**에서는 다양한 운항 조건을 시뮬레이션할 수 있습니다.
-        시나리오를 활성화하면 **메인 대시보드의 센서 값이 시나리오 데이터로 변경**되며,
-        **Rule-based AI 시스템**이 실시간으로 어떤 규칙을 적용하는지 확인할 수 있습니다.
-        """)
-
-        # 시나리오 모드 ON/OFF
-        col1, col2 = st.columns([1, 3])
-
-        with col1:
-            use_scenario = st.checkbox(
-                "시나리오 모드 활성화",
-                value=st.session_state.use_scenario_data,
-                key="scenario_mode_toggle"
-            )
-
-            if use_scenario != st.session_state.use_scenario_data:
-                st.session_state.use_scenario_data = use_scenario
-                st.rerun()
-
-        with col2:
-            if st.session_state.use_scenario_data:
-                st.success("✅ 시나리오 모드 활성화됨 - 메인 대시보드에서 실시간 변화를 확인하세요!")
-            else:
-                st.warning("⚪ 시나리오 모드 비활성화됨 - 고정 시뮬레이션 데이터 사용 중")
-
-        st.markdown("---")
-
-        # 시나리오 선택 버튼
-        st.subheader("🎯 시나리오 선택")
-
-        # 시나리오 속도 조절
+    @st.fragment
+    def _render_speed_selector(self):
+        """시나리오 재생 속도 선택 (선택 변경 시 이 영역만 재실행)"""
         col_speed1, col_speed2, col_speed3 = st.columns([2, 3, 6])
 
         with col_speed1:
@@ -1849,7 +2128,6 @@ class Dashboard:
             if abs(new_speed - previous_speed) > 0.001:
                 self.scenario_engine.set_time_multiplier(new_speed)
                 st.session_state.speed_multiplier = new_speed
-                st.rerun()  # 즉시 화면 새로고침
 
         with col_speed3:
             display_speed = st.session_state.get("speed_multiplier", speed_options[selected_speed])
@@ -1860,40 +2138,68 @@ class Dashboard:
             else:
                 st.info("▶️ 정상 속도로 진행 중")
 
+    def _render_scenario_testing(self):
+        """시나리오 테스트 렌더링"""
+        st.header("🎬 시나리오 테스트")
+
+        st.info("""
+        **시나리오 모드**에서는 다양한 운항 조건을 시뮬레이션할 수 있습니다.
+        시나리오를 활성화하면 **메인 대시보드의 센서 값이 시나리오 데이터로 변경**되며,
+        **Rule-based AI 시스템**이 실시간으로 어떤 규칙을 적용하는지 확인할 수 있습니다.
+        """)
+
+        # 시나리오 모드 ON/OFF
+        col1, col2 = st.columns([1, 3])
+
+        with col1:
+            use_scenario = st.checkbox(
+                "시나리오 모드 활성화",
+                value=st.session_state.use_scenario_data,
+                key="scenario_mode_toggle"
+            )
+
+            if use_scenario != st.session_state.use_scenario_data:
+                st.session_state.use_scenario_data = use_scenario
+                st.rerun()
+
+        with col2:
+            if st.session_state.use_scenario_data:
+                st.success("✅ 시나리오 모드 활성화됨 - 메인 대시보드에서 실시간 변화를 확인하세요!")
+            else:
+                st.warning("⚪ 시나리오 모드 비활성화됨 - 고정 시뮬레이션 데이터 사용 중")
+
+        st.markdown("---")
+
+        # 시나리오 선택 버튼
+        st.subheader("🎯 시나리오 선택")
+
+        # 시나리오 속도 조절
+        self._render_speed_selector()
+
         st.markdown("---")
 
         # 현재 선택된 시나리오 타입
         current = st.session_state.current_scenario_type
 
         # 라디오 버튼으로 변경 (한 줄 표시 보장)
-        scenario_options = {
-            "기본 제어 검증": ScenarioType.NORMAL_OPERATION,
-            "SW 펌프 제어 검증": ScenarioType.HIGH_LOAD,
-            "FW 펌프 제어 검증": ScenarioType.COOLING_FAILURE,
-            "압력 안전 제어 검증": ScenarioType.PRESSURE_DROP,
-            "E/R 온도 제어 검증": ScenarioType.ER_VENTILATION
-        }
+        scenario_options = _SCENARIO_OPTIONS
 
         # 현재 선택된 옵션 찾기
-        current_label = None
-        for label, stype in scenario_options.items():
-            if current == stype:
-                current_label = label
-                break
+        current_label = _SCENARIO_LABELS.get(current)
 
         # 세션 상태 초기화 또는 유효성 검증
         if 'selected_scenario_label' not in st.session_state or st.session_state.selected_scenario_label not in scenario_options:
             st.session_state.selected_scenario_label = current_label
 
         # 라디오 버튼으로 시나리오 선택
-        selected_index = list(scenario_options.keys()).index(st.session_state.selected_scenario_label) if st.session_state.selected_scenario_label in scenario_options else 0
+        selected_index = _SCENARIO_OPTION_KEYS.index(st.session_state.selected_scenario_label) if st.session_state.selected_scenario_label in scenario_options else 0
 
         col_radio, col_button = st.columns([4, 1])
         
         with col_radio:
             selected = st.radio(
                 "시나리오를 선택하세요",
-                options=list(scenario_options.keys()),
+                options=_SCENARIO_OPTION_KEYS,
                 index=selected_index,
                 horizontal=True,
                 label_visibility="collapsed"
@@ -1910,17 +2216,11 @@ class Dashboard:
         # 시작 버튼 클릭 시 시나리오 시작
         if start_button:
             self.scenario_engine.start_scenario(scenario_options[selected])
+            self._scenario_values = None  # 새 시나리오 기준으로 다시 계산
             st.session_state.use_scenario_data = True
             st.session_state.current_scenario_type = scenario_options[selected]
             # 주파수 및 대수 초기화
-            st.session_state.current_frequencies = {
-                'sw_pump': 48.0,
-                'fw_pump': 48.0,
-                'er_fan': 48.0,  # 47.0 → 48.0 (일관성)
-                'er_fan_count': 3,  # 2 → 3 (E/R 팬 기본 3대)
-                'time_at_max_freq': 0,  # 60Hz 유지 시간 (초)
-                'time_at_min_freq': 0   # 40Hz 유지 시간 (초)
-            }
+            st.session_state.current_frequencies = dict(_DEFAULT_FREQS)
             # RuleBasedController 리셋
             self.integrated_controller.rule_controller.reset()
             st.rerun()
@@ -1952,9 +2252,8 @@ class Dashboard:
                 st.caption(info['description'])
 
             with col2:
-                progress_pct = float(info['progress'].replace('%', ''))
                 st.metric("진행률", info['progress'])
-                st.progress(progress_pct / 100.0)
+                st.progress(info['progress_fraction'])
 
             with col3:
                 st.metric("경과 시간", f"{info['elapsed_seconds']:.0f}초")
@@ -1970,371 +2269,247 @@ class Dashboard:
 
         st.markdown("---")
 
-        # 현재 센서 값 (시나리오 활성화 시)
-        if st.session_state.use_scenario_data:
-            st.subheader("🌡️ 현재 센서 값 & AI 판단")
-
-            values = self.scenario_engine.get_current_values()
+        # 시나리오 모드가 꺼져 있으면 제어기/시나리오 엔진 계산 없이 설명만 표시
+        if not st.session_state.use_scenario_data:
+            self._render_scenario_descriptions()
+            return
 
-            # 메인 대시보드와 동일한 IntegratedController 사용
-            controller = self.integrated_controller
+        # 현재 센서 값 (시나리오 활성화 시)
+        st.subheader("🌡️ 현재 센서 값 & AI 판단")
 
-            # 현재 주파수 및 대수 (세션 상태에 저장하여 추적)
-            # 강제로 er_fan_count를 3대로 리셋 (기존 2대 세션 상태 무시)
-            if 'current_frequencies' not in st.session_state:
-                st.session_state.current_frequencies = {
-                    'sw_pump': 48.0,
-                    'fw_pump': 48.0,
-                    'er_fan': 47.0,
-                    'er_fan_count': 3,  # E/R 팬 작동 대수 (기본 3대)
-                    'time_at_max_freq': 0,  # 60Hz 유지 시간 (초)
-                    'time_at_min_freq': 0   # 40Hz 유지 시간 (초)
-                }
+        values = self._get_scenario_values()
 
-            # 기존 세션에서 er_fan_count가 2대로 설정되어 있으면 3대로 강제 변경
-            if st.session_state.current_frequencies.get('er_fan_count', 3) == 2:
-                st.session_state.current_frequencies['er_fan_count'] = 3
+        # 메인 대시보드와 동일한 IntegratedController 사용
+        controller = self.integrated_controller
 
-            current_freqs = st.session_state.current_frequencies
+        # 현재 주파수 및 대수 (세션 상태에 저장하여 추적, run()에서 초기화)
+        current_freqs = st.session_state.current_frequencies
 
-            # AI 판단 실행
-            temperatures = {
-                'T1': values['T1'],
-                'T2': values['T2'],
-                'T3': values['T3'],
-                'T4': values['T4'],
-                'T5': values['T5'],
-                'T6': values['T6'],
-                'T7': values['T7']
-            }
-            
-            # 온도 시퀀스 업데이트 (예측 제어용)
-            controller.update_temperature_sequence(temperatures, values['engine_load'])
+        # AI 판단 실행
+        temperatures = {key: values[key] for key in _TEMP_KEYS}
+        # (온도 시퀀스 버퍼는 compute_control() 내부에서 갱신됨)
 
-            # 디버깅: 입력 값 출력
-            st.info(f"🔍 디버그: T6={values['T6']:.1f}°C, 현재 E/R 팬={current_freqs['er_fan']:.1f}Hz ({current_freqs.get('er_fan_count', 3)}대)")
+        # 디버깅: 입력/판단/타이머 값을 자리 하나에 모아 출력 (디버그 모드에서만)
+        debug_mode = st.session_state.get("debug_mode", False)
+        if debug_mode:
+            debug_placeholder = st.empty()
+            debug_lines = [f"🔍 디버그: T6={values['T6']:.1f}°C, 현재 E/R 팬={current_freqs['er_fan']:.1f}Hz ({current_freqs.get('er_fan_count', 3)}대)"]
 
-            decision = controller.compute_control(
-                temperatures=temperatures,
-                pressure=values['PX1'],
-                engine_load=values['engine_load'],
-                current_frequencies=current_freqs
-            )
+        decision = controller.compute_control(
+            temperatures=temperatures,
+            pressure=values['PX1'],
+            engine_load=values['engine_load'],
+            current_frequencies=current_freqs
+        )
 
-            # 디버깅: 출력 값 확인
-            st.info(f"🔍 AI 판단 결과: E/R 팬={decision.er_fan_freq:.1f}Hz → Reason: {decision.reason}")
-            
-            # 예측 제어 정보 표시
-            if decision.use_predictive_control and decision.temperature_prediction:
-                pred = decision.temperature_prediction
-                # 디버그: 타입 확인
-                try:
-                    t4_val = float(pred.t4_pred_10min)
-                    t5_val = float(pred.t5_pred_10min)
-                    t6_val = float(pred.t6_pred_10min)
-                    conf_val = float(pred.confidence * 100)
-                    st.success(f"🔮 예측 제어 활성: T4={t4_val:.1f}°C, T5={t5_val:.1f}°C, T6={t6_val:.1f}°C (10분 후 예측, 신뢰도: {conf_val:.0f}%)")
-                except Exception as e:
-                    st.error(f"❌ 예측 값 포맷팅 오류: {e}")
+        # 디버깅: 출력 값 확인
+        if debug_mode:
+            debug_lines.append(f"🔍 AI 판단 결과: E/R 팬={decision.er_fan_freq:.1f}Hz → Reason: {decision.reason}")
+        
+        # 예측 제어 정보 표시
+        if decision.use_predictive_control and decision.temperature_prediction:
+            pred = decision.temperature_prediction
+            # 디버그: 타입 확인
+            try:
+                t4_val = float(pred.t4_pred_10min)
+                t5_val = float(pred.t5_pred_10min)
+                t6_val = float(pred.t6_pred_10min)
+                conf_val = float(pred.confidence * 100)
+                st.success(f"🔮 예측 제어 활성: T4={t4_val:.1f}°C, T5={t5_val:.1f}°C, T6={t6_val:.1f}°C (10분 후 예측, 신뢰도: {conf_val:.0f}%)")
+            except Exception as e:
+                st.error(f"❌ 예측 값 포맷팅 오류: {e}")
+                if debug_mode:
                     st.write(f"Debug - T4 type: {type(pred.t4_pred_10min)}, value: {pred.t4_pred_10min}")
 
-            # AI 판단을 현재 주파수 및 대수에 반영
-            st.session_state.current_frequencies['sw_pump'] = decision.er_fan_freq
-            st.session_state.current_frequencies['fw_pump'] = decision.fw_pump_freq
-            st.session_state.current_frequencies['er_fan'] = decision.er_fan_freq
-            st.session_state.current_frequencies['er_fan_count'] = getattr(decision, 'er_fan_count', 3)
-            # 타이머는 integrated_controller가 current_freqs에 직접 업데이트했으므로 이미 반영됨
-            
-            # 디버깅: 타이머 상태 표시
+        # AI 판단을 현재 주파수 및 대수에 반영
+        current_freqs.update({
+            'sw_pump': decision.sw_pump_freq,
+            'fw_pump': decision.fw_pump_freq,
+            'er_fan': decision.er_fan_freq,
+            'er_fan_count': decision.er_fan_count,
+        })
+        # 타이머는 integrated_controller가 current_freqs에 직접 업데이트했으므로 이미 반영됨
+        
+        # 디버깅: 타이머 상태 표시
+        if debug_mode:
             timer_max = current_freqs.get('time_at_max_freq', 0)
             timer_min = current_freqs.get('time_at_min_freq', 0)
-            st.info(f"🕐 타이머 상태: 최대={timer_max}s, 최소={timer_min}s")
-
-            # 시나리오별 강조 표시 플래그
-            is_er_scenario = (st.session_state.current_scenario_type == ScenarioType.ER_VENTILATION)
-            is_sw_scenario = (st.session_state.current_scenario_type == ScenarioType.HIGH_LOAD)
-            is_fw_scenario = (st.session_state.current_scenario_type == ScenarioType.COOLING_FAILURE)
-            is_pressure_scenario = (st.session_state.current_scenario_type == ScenarioType.PRESSURE_DROP)
-            
-            col1, col2, col3, col4, col5 = st.columns(5)
-
-            with col1:
-                delta_t5 = values['T5'] - 35.0
-                if is_sw_scenario:
-                    # SW 펌프 시나리오에서 T5 강조
-                    st.markdown("""
-                    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                                padding: 20px; border-radius: 10px; text-align: center; 
-                                box-shadow: 0 8px 16px rgba(102,126,234,0.3);'>
-                        <p style='color: white; font-size: 14px; margin: 0; font-weight: 600;'>⭐ T5 (FW 출구)</p>
-                        <p style='color: white; font-size: 36px; margin: 10px 0; font-weight: 700;'>{:.1f}°C</p>
-                        <p style='color: {}; font-size: 16px; margin: 0; font-weight: 600;'>{:+.1f}°C</p>
-                    </div>
-                    """.format(values['T5'], 
-                              '#ff6b6b' if delta_t5 > 0 else '#51cf66',
-                              delta_t5), unsafe_allow_html=True)
-                else:
-                    st.metric("T5 (FW 출구)", f"{values['T5']:.1f}°C",
-                             f"{delta_t5:+.1f}°C",
-                             delta_color="inverse" if delta_t5 > 0 else "normal")
-
-            with col2:
-                delta_t4 = values['T4'] - 43.0  # T4 정상 범위 중심
-                if is_fw_scenario:
-                    # FW 펌프 시나리오에서 T4 강조
-                    st.markdown("""
-                    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                                padding: 20px; border-radius: 10px; text-align: center; 
-                                box-shadow: 0 8px 16px rgba(102,126,234,0.3);'>
-                        <p style='color: white; font-size: 14px; margin: 0; font-weight: 600;'>⭐ T4 (FW 입구)</p>
-                        <p style='color: white; font-size: 36px; margin: 10px 0; font-weight: 700;'>{:.1f}°C</p>
-                        <p style='color: {}; font-size: 16px; margin: 0; font-weight: 600;'>{:+.1f}°C</p>
-                    </div>
-                    """.format(values['T4'], 
-                              '#ff6b6b' if delta_t4 > 0 else '#51cf66',
-                              delta_t4), unsafe_allow_html=True)
-                else:
-                    st.metric("T4 (FW 입구)", f"{values['T4']:.1f}°C",
-                             f"{delta_t4:+.1f}°C",
-                             delta_color="inverse" if delta_t4 > 0 else "normal")
+            debug_lines.append(f"🕐 타이머 상태: 최대={timer_max}s, 최소={timer_min}s")
+            debug_placeholder.info("\n\n".join(debug_lines))
+
+        # 시나리오별 강조 표시 플래그
+        current_type = st.session_state.current_scenario_type
+        is_er_scenario = (current_type == ScenarioType.ER_VENTILATION)
+        is_sw_scenario = (current_type == ScenarioType.HIGH_LOAD)
+        is_fw_scenario = (current_type == ScenarioType.COOLING_FAILURE)
+        is_pressure_scenario = (current_type == ScenarioType.PRESSURE_DROP)
+
+        # 제어 판단 플래그 (아래 표시 영역에서 반복 사용)
+        ml_used = decision.use_predictive_control
+        pressure_constrained = (decision.control_mode == "pressure_constraint")
+        
+        col1, col2, col3, col4, col5 = st.columns(5)
 
-            with col3:
-                delta_t6 = values['T6'] - 43.0
-                if is_er_scenario:
-                    # E/R 시나리오에서 T6 강조
-                    st.markdown("""
-                    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                                padding: 20px; border-radius: 10px; text-align: center; 
-                                box-shadow: 0 8px 16px rgba(102,126,234,0.3);'>
-                        <p style='color: white; font-size: 14px; margin: 0; font-weight: 600;'>⭐ T6 (E/R 온도)</p>
-                        <p style='color: white; font-size: 36px; margin: 10px 0; font-weight: 700;'>{:.1f}°C</p>
-                        <p style='color: {}; font-size: 16px; margin: 0; font-weight: 600;'>{:+.1f}°C</p>
-                    </div>
-                    """.format(values['T6'], 
-                              '#ff6b6b' if delta_t6 > 0 else '#51cf66',
-                              delta_t6), unsafe_allow_html=True)
-                else:
-                    st.metric("T6 (E/R 온도)", f"{values['T6']:.1f}°C",
-                             f"{delta_t6:+.1f}°C",
-                             delta_color="inverse" if delta_t6 > 0 else "normal")
-
-            with col4:
-                delta_px = values['PX1'] - 2.0
-                if is_pressure_scenario:
-                    # 압력 시나리오에서 PX1 강조
-                    st.markdown("""
-                    <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); 
-                                padding: 20px; border-radius: 10px; text-align: center; 
-                                box-shadow: 0 8px 16px rgba(240,147,251,0.3);'>
-                        <p style='color: white; font-size: 14px; margin: 0; font-weight: 600;'>⭐ PX1 (압력)</p>
-                        <p style='color: white; font-size: 36px; margin: 10px 0; font-weight: 700;'>{:.2f} bar</p>
-                        <p style='color: {}; font-size: 16px; margin: 0; font-weight: 600;'>{:+.2f} bar</p>
-                    </div>
-                    """.format(values['PX1'], 
-                              '#51cf66' if delta_px > 0 else '#ff6b6b',
-                              delta_px), unsafe_allow_html=True)
+        # 센서 카드 (현재 시나리오의 핵심 센서만 강조 카드, 나머지는 metric)
+        # 편차/악화 여부/강조 색상을 센서 카드 전체에 대해 한 번에 계산
+        sensor_values = np.array([values[card[0]] for card in _SCENARIO_SENSOR_CARDS])
+        deltas = sensor_values - _SCENARIO_SENSOR_REFS
+        bad_flags = deltas * _SCENARIO_SENSOR_BAD_SIGNS > 0
+        delta_colors = np.where(bad_flags, _BAD_COLOR, _GOOD_COLOR)
+
+        for col, card, value, delta, is_bad, delta_color in zip(
+            (col1, col2, col3, col4), _SCENARIO_SENSOR_CARDS, sensor_values, deltas, bad_flags, delta_colors
+        ):
+            _, label, _, value_fmt, delta_fmt, scenario_type, _, palette = card
+            with col:
+                if current_type == scenario_type:
+                    st.markdown(_emphasis_card_html(
+                        label, value_fmt.format(value), delta_fmt.format(delta), delta_color, palette
+                    ), unsafe_allow_html=True)
                 else:
-                    st.metric("PX1 (압력)", f"{values['PX1']:.2f} bar",
-                             f"{delta_px:+.2f}",
-                             delta_color="inverse" if delta_px < 0 else "normal")
+                    st.metric(label, value_fmt.format(value), delta_fmt.format(delta),
+                              delta_color="inverse" if is_bad else "normal")
 
-            with col5:
-                st.metric("엔진 부하", f"{values['engine_load']:.1f}%")
+        with col5:
+            st.metric("엔진 부하", f"{values['engine_load']:.1f}%")
 
-            # Rule-based AI 제어 판단 표시
-            st.markdown("---")
-            st.markdown("### 🤖 Rule-based AI 제어 판단")
-            
-            # 제어 상태 표시 (시나리오별)
-            if is_sw_scenario:
-                ml_used = hasattr(decision, 'ml_prediction_used') and decision.ml_prediction_used
-                if ml_used:
-                    st.success("🤖 **제어 방식**: ML 온도 예측 (T5 선제 대응) + Rule R1 강화 보정 (60Hz/40Hz 가속) - 핵심 에너지 절감 기능!")
-                else:
-                    st.warning("📐 **제어 방식**: Rule 기반 제어 (ML 데이터 축적 중...)")
-            elif is_fw_scenario:
-                ml_used = hasattr(decision, 'ml_prediction_used') and decision.ml_prediction_used
-                if ml_used:
-                    st.success("🤖 **제어 방식**: ML 온도 예측 + Rule R2 3단계 제어 (극한 에너지 절감) - T4<48°C일 때 최대한 40Hz 운전!")
-                else:
-                    st.warning("📐 **제어 방식**: Rule 기반 제어 (ML 데이터 축적 중...)")
-            elif is_pressure_scenario:
-                if decision.control_mode == "pressure_constraint":
-                    st.error("⛔ **제어 방식**: Safety Layer S3 압력 보호 - PX1 < 1.0 bar → SW 펌프 감속 차단!")
-                else:
-                    st.info("📊 **제어 방식**: 압력 모니터링 중 (PX1 ≥ 1.0 bar → 정상)")
-            
-            # 적용된 규칙 표시
-            if hasattr(decision, 'applied_rules') and decision.applied_rules:
-                with st.expander("📋 적용된 규칙 보기", expanded=False):
-                    for rule in decision.applied_rules:
-                        if rule.startswith('S'):  # Safety rules
-                            st.error(f"🚨 {rule}")
-                        elif rule.startswith('R'):  # Optimization rules
-                            st.info(f"⚙️ {rule}")
-                        elif rule == 'ML_PREDICTION':
-                            st.success(f"🤖 {rule}: ML 모델 예측 사용 (선제적 주파수 조정)")
-                        else:
-                            st.text(f"• {rule}")
-
-            # 제어 모드에 따른 알림 표시
-            if decision.emergency_action:
-                st.error(f"🚨 긴급 제어 발동: {decision.reason}")
-            elif decision.control_mode == "pressure_constraint":
-                st.warning(f"⚠️ 압력 제약 활성: {decision.reason}")
-            elif values['T5'] > 37.0 or values['T6'] > 45.0:
-                st.warning(f"⚠️ 온도 상승 감지: {decision.reason}")
+        # Rule-based AI 제어 판단 표시
+        st.markdown("---")
+        st.markdown("### 🤖 Rule-based AI 제어 판단")
+        
+        # 제어 상태 표시 (시나리오별)
+        if is_sw_scenario:
+            if ml_used:
+                st.success("🤖 **제어 방식**: ML 온도 예측 (T5 선제 대응) + Rule R1 강화 보정 (60Hz/40Hz 가속) - 핵심 에너지 절감 기능!")
+            else:
+                st.warning("📐 **제어 방식**: Rule 기반 제어 (ML 데이터 축적 중...)")
+        elif is_fw_scenario:
+            if ml_used:
+                st.success("🤖 **제어 방식**: ML 온도 예측 + Rule R2 3단계 제어 (극한 에너지 절감) - T4<48°C일 때 최대한 40Hz 운전!")
             else:
-                st.success(f"✅ 정상 제어: {decision.reason}")
+                st.warning("📐 **제어 방식**: Rule 기반 제어 (ML 데이터 축적 중...)")
+        elif is_pressure_scenario:
+            if pressure_constrained:
+                st.error("⛔ **제어 방식**: Safety Layer S3 압력 보호 - PX1 < 1.0 bar → SW 펌프 감속 차단!")
+            else:
+                st.info("📊 **제어 방식**: 압력 모니터링 중 (PX1 ≥ 1.0 bar → 정상)")
+        
+        # 적용된 규칙 표시
+        if decision.applied_rules:
+            with st.expander("📋 적용된 규칙 보기", expanded=False):
+                st.markdown(_applied_rules_markdown(decision.applied_rules))
+
+        # 제어 모드에 따른 알림 표시
+        if decision.emergency_action:
+            st.error(f"🚨 긴급 제어 발동: {decision.reason}")
+        elif pressure_constrained:
+            st.warning(f"⚠️ 압력 제약 활성: {decision.reason}")
+        elif values['T5'] > 37.0 or values['T6'] > 45.0:
+            st.warning(f"⚠️ 온도 상승 감지: {decision.reason}")
+        else:
+            st.success(f"✅ 정상 제어: {decision.reason}")
 
-            # AI 판단 결과 (목표 주파수)
-            col1, col2, col3, col4 = st.columns(4)
+        # AI 판단 결과 (목표 주파수)
+        col1, col2, col3, col4 = st.columns(4)
 
-            with col1:
-                freq_change = decision.sw_pump_freq - current_freqs['sw_pump']
-                if is_sw_scenario or is_pressure_scenario:
-                    # SW 펌프 시나리오 또는 압력 시나리오에서 주파수 강조
-                    change_color = '#ff6b6b' if freq_change > 0 else ('#51cf66' if freq_change < 0 else '#ffd93d')
-                    gradient_bg = 'linear-gradient(135deg, #fa709a 0%, #fee140 100%)' if is_sw_scenario else 'linear-gradient(135deg, #f093fb 0%, #f5576c 100%)'
-                    text_color = '#333' if is_sw_scenario else 'white'
-                    change_text_color = change_color if is_sw_scenario else 'white'
-                    st.markdown(f"""
-                    <div style='background: {gradient_bg}; 
-                                padding: 20px; border-radius: 10px; text-align: center; 
-                                box-shadow: 0 8px 16px rgba(250,112,154,0.3);'>
-                        <p style='color: {text_color}; font-size: 14px; margin: 0; font-weight: 600;'>⭐ SW 펌프 목표</p>
-                        <p style='color: {text_color}; font-size: 36px; margin: 10px 0; font-weight: 700;'>{decision.sw_pump_freq:.1f} Hz</p>
-                        <p style='color: {change_text_color}; font-size: 16px; margin: 0; font-weight: 600;'>{freq_change:+.1f} Hz</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+        with col1:
+            freq_change = decision.sw_pump_freq - current_freqs['sw_pump']
+            if is_sw_scenario or is_pressure_scenario:
+                # SW 펌프 시나리오 또는 압력 시나리오에서 주파수 강조
+                # (압력 시나리오는 분홍 배경 + 흰색 글씨)
+                change_color = _change_color(freq_change)
+                st.markdown(_emphasis_card_html(
+                    "SW 펌프 목표", f"{decision.sw_pump_freq:.1f} Hz", f"{freq_change:+.1f} Hz",
+                    change_color if is_sw_scenario else 'white',
+                    "yellow" if is_sw_scenario else "pink"
+                ), unsafe_allow_html=True)
+            else:
+                # 압력 제약이 활성화된 경우 특별 표시
+                if pressure_constrained:
+                    st.metric("SW 펌프 목표", f"{decision.sw_pump_freq:.1f} Hz",
+                             "⛔ 감소 제한", delta_color="off")
+                elif decision.sw_pump_freq >= 60.0 and decision.emergency_action:
+                    st.metric("SW 펌프 목표", f"{decision.sw_pump_freq:.1f} Hz",
+                             "🚨 최대!", delta_color="inverse")
+                elif abs(freq_change) >= 0.1:
+                    st.metric("SW 펌프 목표", f"{decision.sw_pump_freq:.1f} Hz", f"{freq_change:+.1f} Hz")
                 else:
-                    # 압력 제약이 활성화된 경우 특별 표시
-                    if decision.control_mode == "pressure_constraint":
-                        st.metric("SW 펌프 목표", f"{decision.sw_pump_freq:.1f} Hz",
-                                 "⛔ 감소 제한", delta_color="off")
-                    elif decision.sw_pump_freq >= 60.0 and decision.emergency_action:
-                        st.metric("SW 펌프 목표", f"{decision.sw_pump_freq:.1f} Hz",
-                                 "🚨 최대!", delta_color="inverse")
-                    elif abs(freq_change) >= 0.1:
-                        st.metric("SW 펌프 목표", f"{decision.sw_pump_freq:.1f} Hz", f"{freq_change:+.1f} Hz")
-                    else:
-                        st.metric("SW 펌프 목표", f"{decision.sw_pump_freq:.1f} Hz")
+                    st.metric("SW 펌프 목표", f"{decision.sw_pump_freq:.1f} Hz")
 
-            with col2:
-                freq_change = decision.fw_pump_freq - current_freqs['fw_pump']
-                if is_fw_scenario:
-                    # FW 펌프 시나리오에서 주파수 강조
-                    change_color = '#ff6b6b' if freq_change > 0 else ('#51cf66' if freq_change < 0 else '#ffd93d')
-                    st.markdown("""
-                    <div style='background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); 
-                                padding: 20px; border-radius: 10px; text-align: center; 
-                                box-shadow: 0 8px 16px rgba(250,112,154,0.3);'>
-                        <p style='color: #333; font-size: 14px; margin: 0; font-weight: 600;'>⭐ FW 펌프 목표</p>
-                        <p style='color: #333; font-size: 36px; margin: 10px 0; font-weight: 700;'>{:.1f} Hz</p>
-                        <p style='color: {}; font-size: 16px; margin: 0; font-weight: 600;'>{:+.1f} Hz</p>
-                    </div>
-                    """.format(decision.fw_pump_freq, change_color, freq_change), unsafe_allow_html=True)
+        with col2:
+            freq_change = decision.fw_pump_freq - current_freqs['fw_pump']
+            if is_fw_scenario:
+                # FW 펌프 시나리오에서 주파수 강조
+                change_color = _change_color(freq_change)
+                st.markdown(_emphasis_card_html(
+                    "FW 펌프 목표", f"{decision.fw_pump_freq:.1f} Hz", f"{freq_change:+.1f} Hz",
+                    change_color, "yellow"
+                ), unsafe_allow_html=True)
+            else:
+                if decision.fw_pump_freq >= 60.0 and decision.emergency_action:
+                    st.metric("FW 펌프 목표", f"{decision.fw_pump_freq:.1f} Hz",
+                             "🚨 최대!", delta_color="inverse")
+                elif abs(freq_change) >= 0.1:
+                    st.metric("FW 펌프 목표", f"{decision.fw_pump_freq:.1f} Hz", f"{freq_change:+.1f} Hz")
                 else:
-                    if decision.fw_pump_freq >= 60.0 and decision.emergency_action:
-                        st.metric("FW 펌프 목표", f"{decision.fw_pump_freq:.1f} Hz",
-                                 "🚨 최대!", delta_color="inverse")
-                    elif abs(freq_change) >= 0.1:
-                        st.metric("FW 펌프 목표", f"{decision.fw_pump_freq:.1f} Hz", f"{freq_change:+.1f} Hz")
-                    else:
-                        st.metric("FW 펌프 목표", f"{decision.fw_pump_freq:.1f} Hz")
+                    st.metric("FW 펌프 목표", f"{decision.fw_pump_freq:.1f} Hz")
 
-            with col3:
-                freq_change = decision.er_fan_freq - current_freqs['er_fan']
-                fan_count = getattr(decision, 'er_fan_count', 2)
-                
-                if is_er_scenario:
-                    # E/R 시나리오에서 팬 목표 강조
-                    change_color = '#ff6b6b' if freq_change > 0 else ('#51cf66' if freq_change < 0 else '#ffd93d')
-                    st.markdown("""
-                    <div style='background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); 
-                                padding: 20px; border-radius: 10px; text-align: center; 
-                                box-shadow: 0 8px 16px rgba(250,112,154,0.3);'>
-                        <p style='color: #333; font-size: 14px; margin: 0; font-weight: 600;'>⭐ E/R 팬 목표</p>
-                        <p style='color: #333; font-size: 36px; margin: 10px 0; font-weight: 700;'>{:.1f} Hz</p>
-                        <p style='color: #333; font-size: 20px; margin: 5px 0; font-weight: 600;'>({:}대)</p>
-                        <p style='color: {}; font-size: 16px; margin: 0; font-weight: 600;'>{:+.1f} Hz</p>
-                    </div>
-                    """.format(decision.er_fan_freq, fan_count, change_color, freq_change), unsafe_allow_html=True)
+        with col3:
+            freq_change = decision.er_fan_freq - current_freqs['er_fan']
+            fan_count = decision.er_fan_count
+            
+            if is_er_scenario:
+                # E/R 시나리오에서 팬 목표 강조
+                change_color = _change_color(freq_change)
+                st.markdown(_emphasis_card_html(
+                    "E/R 팬 목표", f"{decision.er_fan_freq:.1f} Hz", f"{freq_change:+.1f} Hz",
+                    change_color, "yellow", sub_text=f"({fan_count}대)"
+                ), unsafe_allow_html=True)
+            else:
+                if abs(freq_change) >= 0.1:
+                    st.metric("E/R 팬 목표", f"{decision.er_fan_freq:.1f} Hz ({fan_count}대)", f"{freq_change:+.1f} Hz")
                 else:
-                    if abs(freq_change) >= 0.1:
-                        st.metric("E/R 팬 목표", f"{decision.er_fan_freq:.1f} Hz ({fan_count}대)", f"{freq_change:+.1f} Hz")
-                    else:
-                        st.metric("E/R 팬 목표", f"{decision.er_fan_freq:.1f} Hz ({fan_count}대)")
+                    st.metric("E/R 팬 목표", f"{decision.er_fan_freq:.1f} Hz ({fan_count}대)")
 
-            with col4:
-                st.metric("제어 모드", decision.control_mode)
+        with col4:
+            st.metric("제어 모드", decision.control_mode)
 
-            # 압력 제약 특별 표시
-            if values['PX1'] < 1.0:
-                st.error("⛔ **압력 제약 조건 활성**: PX1 < 1.0 bar → SW 펌프 주파수 감소 제한")
-                st.info(f"현재 압력: {values['PX1']:.2f} bar → AI가 SW 펌프 주파수를 {decision.sw_pump_freq:.1f} Hz로 유지 (감소 불가)")
+        # 압력 제약 특별 표시
+        if values['PX1'] < 1.0:
+            st.error("⛔ **압력 제약 조건 활성**: PX1 < 1.0 bar → SW 펌프 주파수 감소 제한")
+            st.info(f"현재 압력: {values['PX1']:.2f} bar → AI가 SW 펌프 주파수를 {decision.sw_pump_freq:.1f} Hz로 유지 (감소 불가)")
 
-            # 대수 변경 메시지
-            if hasattr(decision, 'count_change_reason') and decision.count_change_reason:
-                st.info(f"🔄 **대수 제어**: {decision.count_change_reason}")
+        # 대수 변경 메시지
+        if decision.count_change_reason:
+            st.info(f"🔄 **대수 제어**: {decision.count_change_reason}")
 
-            # 추가 센서
-            st.markdown("### 추가 센서")
-            col1, col2, col3, col4 = st.columns(4)
+        # 추가 센서
+        st.markdown("### 추가 센서")
+        col1, col2, col3, col4 = st.columns(4)
 
-            with col1:
-                st.metric("T1 (SW 입구)", f"{values['T1']:.1f}°C")
-            with col2:
-                st.metric("T2 (SW 출구 1)", f"{values['T2']:.1f}°C")
-            with col3:
-                st.metric("T3 (SW 출구 2)", f"{values['T3']:.1f}°C")
-            with col4:
-                st.metric("T7 (외기)", f"{values['T7']:.1f}°C")
+        with col1:
+            st.metric("T1 (SW 입구)", f"{values['T1']:.1f}°C")
+        with col2:
+            st.metric("T2 (SW 출구 1)", f"{values['T2']:.1f}°C")
+        with col3:
+            st.metric("T3 (SW 출구 2)", f"{values['T3']:.1f}°C")
+        with col4:
+            st.metric("T7 (외기)", f"{values['T7']:.1f}°C")
 
-        st.markdown("---")
+        self._render_scenario_descriptions()
 
-        # 시나리오 설명
+    def _render_scenario_descriptions(self):
+        """시나리오 설명 (선택된 시나리오만 펼쳐서 표시)"""
+        st.markdown("---")
         st.subheader("📖 시나리오 설명")
 
-        scenario_descriptions = {
-            "기본 제어 검증": {
-                "조건": "열대 해역, 75% 엔진 부하",
-                "예상 온도": "T5=33°C, T6=43°C (정상 범위)",
-                "예상 압력": "PX1=2.0 bar (정상)",
-                "AI 대응": "현재 상태 유지, 효율 최적화"
-            },
-            "고부하 제어 검증": {
-                "조건": "고속 항해, 95% 엔진 부하",
-                "예상 온도": "T5=35°C, T6=46°C (점진적 상승)",
-                "예상 압력": "PX1=2.0 bar",
-                "AI 대응": "펌프/팬 증속으로 냉각 강화"
-            },
-            "냉각기 과열 보호 검증": {
-                "조건": "냉각 성능 저하",
-                "예상 온도": "T5=40°C, T6=52°C (급격한 상승)",
-                "예상 압력": "PX1=2.0 bar",
-                "AI 대응": "최대 냉각, 알람 발생"
-            },
-            "압력 안전 제어 검증": {
-                "조건": "SW 펌프 압력 저하 (2분간 2.0→0.7bar)",
-                "예상 온도": "T5=33°C (낮음, 정상이면 감속 가능)",
-                "예상 압력": "PX1: 2.0 → 1.5 (1분) → 0.7 (2분)",
-                "AI 대응": "1.0bar 통과 후 주파수 감소 금지 (안전 제약)"
-            },
-            "E/R 온도 제어 검증": {
-                "조건": "기관실 환기 불량 (T6만 상승)",
-                "예상 온도": "T6: 43°C → 48°C (7분간 점진적 상승), 기타 온도 정상",
-                "예상 압력": "PX1=2.0 bar (정상)",
-                "AI 대응": "E/R 팬 주파수/대수 증가로 기관실 냉각"
-            }
-        }
-
-        for scenario_name, desc in scenario_descriptions.items():
-            with st.expander(f"📌 {scenario_name}"):
-                st.write(f"**조건**: {desc['조건']}")
-                st.write(f"**예상 온도**: {desc['예상 온도']}")
-                st.write(f"**예상 압력**: {desc['예상 압력']}")
-                st.write(f"**AI 대응**: {desc['AI 대응']}")
+        # 선택된 시나리오만 펼쳐서 표시하고, 나머지는 expander 하나에 모아서 표시
+        selected_type = _SCENARIO_OPTIONS[st.session_state.selected_scenario_label]
+        scenario_name = _SCENARIO_DESCRIPTION_NAMES[selected_type]
+        with st.expander(f"📌 {scenario_name}", expanded=True):
+            st.markdown(_SCENARIO_DESCRIPTION_MARKDOWN[scenario_name])
+        with st.expander("📚 다른 시나리오 설명"):
+            st.markdown(_SCENARIO_OTHER_DESCRIPTIONS_MARKDOWN[selected_type])
 
 
 def main():
@@ -0,0 +1,73 @@
+"""
+HMI 대시보드 공통 구성 요소
+dashboard.py / dashboard_with_scenario.py가 함께 사용하는 사이드바 시계, 차트 정의
+"""
+
+import plotly.graph_objects as go
+
+
+# 사이드바 현재 시간 (브라우저에서 1초마다 갱신 - 서버 재실행 불필요, st.metric과 유사한 모양)
+SIDEBAR_CLOCK_HTML = """
+<style>
+.clock-box { font-family: 'Source Sans Pro', sans-serif; color: rgb(49, 51, 63); }
+@media (prefers-color-scheme: dark) { .clock-box { color: rgb(250, 250, 250); } }
+</style>
+<div class="clock-box">
+    <div style="font-size: 14px;">현재 시간</div>
+    <div id="clock" style="font-size: 1.6rem; white-space: nowrap;"></div>
+</div>
+<script>
+const pad = (n) => String(n).padStart(2, "0");
+function tick() {
+    const d = new Date();
+    document.getElementById("clock").textContent =
+        `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())} ` +
+        `${pad(d.getHours())}:${pad(d.getMinutes())}:${pad(d.getSeconds())}`;
+}
+tick();
+setInterval(tick, 1000);
+</script>
+"""
+SIDEBAR_CLOCK_HEIGHT = 70
+
+# 온도 트렌드 트레이스: (센서 키, 이름, 색상)
+TEMP_TREND_TRACES = (
+    ('T4', 'T4 (FW 입구)', 'green'),
+    ('T5', 'T5 (FW 출구)', 'blue'),
+    ('T6', 'T6 (E/R 온도)', 'red')
+)
+
+
+def build_temperature_trend_fig() -> go.Figure:
+    """온도 트렌드 Figure 뼈대 생성 (빈 트레이스 + 목표선 + 레이아웃, 세션당 한 번)"""
+    fig = go.Figure()
+
+    # 수백 점의 1초 샘플을 새로고침마다 다시 그리므로 SVG 대신 WebGL(Scattergl)로 렌더링
+    for _, name, color in TEMP_TREND_TRACES:
+        fig.add_trace(go.Scattergl(x=[], y=[], name=name, line=dict(color=color, width=2)))
+
+    # 목표 온도 라인 (라벨 위치 조정하여 그래프와 겹치지 않게)
+    fig.add_hline(y=35.0, line_dash="dash", line_color="blue",
+                 annotation_text="T5 목표 (35°C)",
+                 annotation_position="right")
+    fig.add_hline(y=43.0, line_dash="dash", line_color="red",
+                 annotation_text="T6 목표 (43°C)",
+                 annotation_position="right")
+    fig.add_hline(y=48.0, line_dash="dash", line_color="orange",
+                 annotation_text="T4 한계 (48°C)",
+                 annotation_position="right")
+
+    fig.update_layout(
+        height=350,
+        margin=dict(l=20, r=120, t=50, b=90),
+        xaxis_title="시간",
+        yaxis_title="온도 (°C)",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.45,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    return fig
@@ -4,18 +4,14 @@ Streamlit 기반 HMI 대시보드 (시나리오 통합 버전)
 """
 
 import streamlit as st
-from streamlit_autorefresh import st_autorefresh
+import streamlit.components.v1 as components
 import time
+from collections import deque
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from src.hmi.hmi_state_manager import (
     HMIStateManager,
@@ -23,11 +19,28 @@ from src.hmi.hmi_state_manager import (
     AlarmPriority,
     ForceMode60HzState
 )
+from src.hmi.dashboard_common import (
+    SIDEBAR_CLOCK_HTML,
+    SIDEBAR_CLOCK_HEIGHT,
+    TEMP_TREND_TRACES,
+    build_temperature_trend_fig
+)
 from src.gps.gps_processor import GPSData, SeaRegion, Season, NavigationState
 from src.diagnostics.vfd_monitor import DanfossStatusBits, VFDStatus
 from src.simulation.scenarios import SimulationScenarios, ScenarioType
 
 
+# 온도 트렌드 이력 길이 (1초 샘플 기준 10분)
+_SENSOR_HISTORY_LEN = 600
+
+# 그룹별 정격 출력 (kW) 및 운전 대수 (SW 펌프, FW 펌프, E/R 팬 순서)
+_RATED_KW = np.array([132.0, 75.0, 54.3])
+_RUNNING_COUNT = np.array([2, 2, 3])
+
+# 60Hz 고정 운전 전력 (세제곱 법칙에서 (60/60)³ = 1이므로 정격 × 대수)
+_TOTAL_60HZ_KW = float((_RATED_KW * _RUNNING_COUNT).sum())
+
+
 class DashboardWithScenario:
     """Streamlit 대시보드 (시나리오 통합)"""
 
@@ -40,12 +53,13 @@ class DashboardWithScenario:
         if 'scenario_engine' not in st.session_state:
             st.session_state.scenario_engine = SimulationScenarios()
 
+        # 최근 600개 (10분)만 유지 - deque가 오래된 샘플을 자동으로 버림
         if 'sensor_history' not in st.session_state:
             st.session_state.sensor_history = {
-                'T4': [],
-                'T5': [],
-                'T6': [],
-                'timestamps': []
+                'T4': deque(maxlen=_SENSOR_HISTORY_LEN),
+                'T5': deque(maxlen=_SENSOR_HISTORY_LEN),
+                'T6': deque(maxlen=_SENSOR_HISTORY_LEN),
+                'timestamps': deque(maxlen=_SENSOR_HISTORY_LEN)
             }
 
         if 'energy_history' not in st.session_state:
@@ -58,13 +72,14 @@ class DashboardWithScenario:
 
         # GPS 시뮬레이션 데이터 초기화
         if 'gps_initialized' not in st.session_state:
+            now = datetime.now()
             gps_data = GPSData(
-                timestamp=datetime.now(),
+                timestamp=now,
                 latitude=35.1,
                 longitude=129.0,
                 speed_knots=15.5,
                 heading_degrees=225.0,
-                utc_time=datetime.now()
+                utc_time=now
             )
             st.session_state.hmi_manager.update_gps_data(gps_data)
             st.session_state.gps_initialized = True
@@ -72,8 +87,58 @@ class DashboardWithScenario:
         self.hmi_manager: HMIStateManager = st.session_state.hmi_manager
         self.scenario_engine: SimulationScenarios = st.session_state.scenario_engine
 
+        # 이번 렌더링의 시나리오 센서 값 / 시나리오 정보 (_get_scenario_values / _get_scenario_info에서 채움)
+        self._scenario_values: Optional[Dict[str, float]] = None
+        self._scenario_info: Optional[Dict] = None
+
+        # 전체 실행(run) 진행 중 여부 - fragment가 전체 실행의 일부로 호출된 것인지 판별
+        self._in_full_run = False
+
+    def _start_render(self):
+        """렌더링 기준 시각 설정 및 렌더링 단위 캐시 초기화 (전체 실행 시작 시 호출)"""
+        # 표시용은 datetime, 샘플 주기 판정은 단조 시계 사용 (시스템 시각 변경/날짜 경계 영향 없음)
+        self.render_time = datetime.now()
+        self.render_monotonic = time.monotonic()
+        self._scenario_values = None
+        self._scenario_info = None
+
+    def _start_fragment_render(self):
+        """fragment 시작 시 호출: fragment 단독 재실행일 때만 렌더링 단위 캐시 초기화
+
+        fragment 재실행은 마지막 전체 실행의 인스턴스를 그대로 사용하므로 이전 렌더링의 시각과
+        시나리오 값을 비워야 한다. 전체 실행 중에는 run()에서 채운 값을 모든 영역이 공유한다.
+        """
+        if not self._in_full_run:
+            self._start_render()
+
+    def _get_scenario_values(self) -> Dict[str, float]:
+        """이번 렌더링의 시나리오 센서 값 (렌더링당 한 번만 계산해 모든 영역에서 공유)"""
+        if self._scenario_values is None:
+            self._scenario_values = self.scenario_engine.get_current_values()
+        return self._scenario_values
+
+    def _get_scenario_info(self) -> Dict:
+        """이번 렌더링(전체 실행 또는 fragment 단독 재실행)의 시나리오 정보 (렌더링당 한 번만 계산)
+
+        시나리오 버튼은 start_scenario() 직후 st.rerun()하므로 렌더링 중에 정보가 바뀌지 않는다.
+        """
+        if self._scenario_info is None:
+            self._scenario_info = self.scenario_engine.get_scenario_info()
+        return self._scenario_info
+
     def run(self):
         """대시보드 실행"""
+        # 렌더링 기준 시각 (한 번의 렌더링 동안 공통 사용)
+        self._start_render()
+
+        self._in_full_run = True
+        try:
+            self._render_page()
+        finally:
+            self._in_full_run = False
+
+    def _render_page(self):
+        """전체 화면 렌더링"""
         # 페이지 설정
         st.set_page_config(
             page_title="ESS AI 제어 시스템 - 시나리오 대시보드",
@@ -115,27 +180,38 @@ class DashboardWithScenario:
         with tab2:
             self._render_performance_monitoring()
 
-        # 자동 새로고침 (3초 간격)
-        st_autorefresh(interval=3000, limit=None, key="auto_refresh_dashboard_with_scenario")
+        # 시간에 따라 바뀌는 영역(사이드바 상태, 시나리오 진행 표시, 메인 대시보드)은
+        # 각각 3초 주기 fragment로 갱신 - 전체 화면은 버튼 조작 시에만 재실행
 
     def _render_sidebar(self):
         """사이드바 렌더링"""
-        st.sidebar.header("시스템 상태")
-        st.sidebar.metric("현재 시간", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        # fragment 안에서는 st.sidebar를 쓸 수 없으므로 사이드바 컨텍스트 안에서 호출
+        with st.sidebar:
+            st.header("시스템 상태")
+
+            # 현재 시간 (브라우저 측 시계 - 서버 재실행과 무관하게 1초마다 갱신)
+            components.html(SIDEBAR_CLOCK_HTML, height=SIDEBAR_CLOCK_HEIGHT)
+
+            self._render_sidebar_status()
+
+    @st.fragment(run_every="3s")
+    def _render_sidebar_status(self):
+        """사이드바 시나리오 상태 (3초마다 이 영역만 재실행)"""
+        self._start_fragment_render()
 
         # 시나리오 정보
-        st.sidebar.markdown("---")
-        st.sidebar.subheader("🎬 시나리오 상태")
+        st.markdown("---")
+        st.subheader("🎬 시나리오 상태")
 
-        info = self.scenario_engine.get_scenario_info()
+        info = self._get_scenario_info()
         if info:
-            st.sidebar.success(f"**{info['name']}**")
-            st.sidebar.caption(info['description'])
-            st.sidebar.progress(float(info['progress'].replace('%', '')) / 100.0)
-            st.sidebar.metric("경과 시간", f"{info['elapsed_seconds']:.0f}초")
+            st.success(f"**{info['name']}**")
+            st.caption(info['description'])
+            st.progress(info['progress_fraction'])
+            st.metric("경과 시간", f"{info['elapsed_seconds']:.0f}초")
 
             if info['is_complete']:
-                st.sidebar.warning("⚠️ 시나리오 완료됨")
+                st.warning("⚠️ 시나리오 완료됨")
 
     def _render_scenario_control(self):
         """시나리오 제어 패널"""
@@ -164,18 +240,28 @@ class DashboardWithScenario:
                 st.rerun()
 
         with col5:
-            info = self.scenario_engine.get_scenario_info()
-            if info:
-                st.info(f"📊 {info['name']} - {info['progress']}")
+            self._render_scenario_badge()
 
         st.markdown("---")
 
+    @st.fragment(run_every="3s")
+    def _render_scenario_badge(self):
+        """현재 시나리오 이름/진행률 표시 (3초마다 이 영역만 재실행)"""
+        self._start_fragment_render()
+
+        info = self._get_scenario_info()
+        if info:
+            st.info(f"📊 {info['name']} - {info['progress']}")
+
+    @st.fragment(run_every="3s")
     def _render_main_dashboard(self):
-        """메인 대시보드 렌더링"""
+        """메인 대시보드 렌더링 (센서/트렌드/진행 상태가 바뀌므로 3초마다 이 영역만 재실행)"""
+        self._start_fragment_render()
+
         st.header("📊 실시간 시스템 모니터링")
 
         # 시나리오 엔진에서 실시간 데이터 가져오기
-        values = self.scenario_engine.get_current_values()
+        values = self._get_scenario_values()
 
         # 핵심 입력 센서 (AI 제어 입력값)
         st.markdown("### 🎯 핵심 입력 센서 (실시간)")
@@ -243,87 +329,49 @@ class DashboardWithScenario:
 
     def _render_temperature_trend(self, T4, T5, T6):
         """온도 트렌드 그래프"""
-        now = datetime.now()
+        now = self.render_time
+        history = st.session_state.sensor_history
+        timestamps_buf = history['timestamps']
 
         # 데이터 추가
-        if len(st.session_state.sensor_history['timestamps']) == 0 or \
-           (now - st.session_state.sensor_history['timestamps'][-1]).seconds >= 1:
-
-            st.session_state.sensor_history['T4'].append(T4)
-            st.session_state.sensor_history['T5'].append(T5)
-            st.session_state.sensor_history['T6'].append(T6)
-            st.session_state.sensor_history['timestamps'].append(now)
-
-            # 최근 600개만 유지 (10분)
-            if len(st.session_state.sensor_history['timestamps']) > 600:
-                st.session_state.sensor_history['T4'] = st.session_state.sensor_history['T4'][-600:]
-                st.session_state.sensor_history['T5'] = st.session_state.sensor_history['T5'][-600:]
-                st.session_state.sensor_history['T6'] = st.session_state.sensor_history['T6'][-600:]
-                st.session_state.sensor_history['timestamps'] = st.session_state.sensor_history['timestamps'][-600:]
-
-        # 그래프 생성
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatter(
-            x=st.session_state.sensor_history['timestamps'],
-            y=st.session_state.sensor_history['T4'],
-            name='T4 (FW 입구)',
-            line=dict(color='green', width=2)
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=st.session_state.sensor_history['timestamps'],
-            y=st.session_state.sensor_history['T5'],
-            name='T5 (FW 출구)',
-            line=dict(color='blue', width=2)
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=st.session_state.sensor_history['timestamps'],
-            y=st.session_state.sensor_history['T6'],
-            name='T6 (E/R 온도)',
-            line=dict(color='red', width=2)
-        ))
-
-        # 목표 온도 라인
-        fig.add_hline(y=35.0, line_dash="dash", line_color="blue",
-                     annotation_text="T5 목표 (35°C)",
-                     annotation_position="right")
-        fig.add_hline(y=43.0, line_dash="dash", line_color="red",
-                     annotation_text="T6 목표 (43°C)",
-                     annotation_position="right")
-        fig.add_hline(y=48.0, line_dash="dash", line_color="orange",
-                     annotation_text="T4 한계 (48°C)",
-                     annotation_position="right")
-
-        fig.update_layout(
-            height=350,
-            margin=dict(l=20, r=120, t=50, b=90),
-            xaxis_title="시간",
-            yaxis_title="온도 (°C)",
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.45,
-                xanchor="center",
-                x=0.5
-            )
-        )
+        updated = self.render_monotonic - st.session_state.get('_last_sensor_sample_m', 0.0) >= 1.0
+        if updated:
+            st.session_state['_last_sensor_sample_m'] = self.render_monotonic
+            history['T4'].append(T4)
+            history['T5'].append(T5)
+            history['T6'].append(T6)
+            timestamps_buf.append(now)
+
+        # Figure 뼈대(트레이스, 목표선, 레이아웃)는 세션당 한 번만 생성
+        fig = st.session_state.get('temperature_trend_fig')
+        if fig is None:
+            fig = build_temperature_trend_fig()
+            st.session_state.temperature_trend_fig = fig
+            updated = True
+
+        # 새 샘플이 추가된 경우에만 트레이스 데이터 교체
+        # 이력(deque)을 NumPy 배열로 한 번에 복사 (Plotly가 배열을 바이너리로 직렬화)
+        if updated:
+            count = len(timestamps_buf)
+            timestamps = np.array(timestamps_buf, dtype='datetime64[ms]')
+            with fig.batch_update():
+                for trace, (key, _, _) in zip(fig.data, TEMP_TREND_TRACES):
+                    trace.x = timestamps
+                    trace.y = np.fromiter(history[key], dtype=np.float64, count=count)
 
         st.plotly_chart(fig, use_container_width=True)
 
     def _render_scenario_progress(self):
         """시나리오 진행 상태"""
-        info = self.scenario_engine.get_scenario_info()
+        info = self._get_scenario_info()
 
         if not info:
             st.info("시나리오를 선택해주세요")
             return
 
         # 진행률
-        progress_pct = float(info['progress'].replace('%', ''))
         st.metric("진행률", info['progress'])
-        st.progress(progress_pct / 100.0)
+        st.progress(info['progress_fraction'])
 
         # 시간 정보
         col1, col2 = st.columns(2)
@@ -344,7 +392,7 @@ class DashboardWithScenario:
         st.header("📈 성능 분석")
 
         # 현재 센서 값
-        values = self.scenario_engine.get_current_values()
+        values = self._get_scenario_values()
 
         # 에너지 절감 비교
         st.subheader("⚡ 에너지 절감 효과")
@@ -353,30 +401,12 @@ class DashboardWithScenario:
         fw_freq = 48.4
         er_freq = 47.3
 
-        # 정격 출력
-        sw_rated = 132.0
-        fw_rated = 75.0
-        er_rated = 54.3
-
-        # 운전 대수
-        sw_running = 2
-        fw_running = 2
-        er_running = 3
-
-        # 전력 계산
-        def calc_power(freq, rated_kw, running_count):
-            return rated_kw * ((freq / 60.0) ** 3) * running_count
-
-        # 60Hz vs AI
-        sw_60hz = calc_power(60.0, sw_rated, sw_running)
-        fw_60hz = calc_power(60.0, fw_rated, fw_running)
-        er_60hz = calc_power(60.0, er_rated, er_running)
-        total_60hz = sw_60hz + fw_60hz + er_60hz
-
-        sw_ai = calc_power(sw_freq, sw_rated, sw_running)
-        fw_ai = calc_power(fw_freq, fw_rated, fw_running)
-        er_ai = calc_power(er_freq, er_rated, er_running)
-        total_ai = sw_ai + fw_ai + er_ai
+        # 60Hz vs AI (60Hz 전력은 고정값이므로 모듈 상수 사용)
+        total_60hz = _TOTAL_60HZ_KW
+
+        # AI 제어 전력 (세제곱 법칙: P = 정격 × (f/60)³ × 대수, 세 그룹 한 번에 계산)
+        freqs = np.array([sw_freq, fw_freq, er_freq])
+        total_ai = float((_RATED_KW * (freqs / 60.0) ** 3 * _RUNNING_COUNT).sum())
 
         total_saved = total_60hz - total_ai
         total_ratio = (total_saved / total_60hz) * 100
@@ -3,16 +3,19 @@ HMI 상태 관리자
 운전 모드, 긴급 정지, 알람 상태를 관리합니다.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from enum import Enum
 from datetime import datetime, timedelta
+import json
 import time
-import sys
-import os
 
-# GPS 모듈 import
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json으로 직렬화
+    orjson = None
+
 from src.gps.gps_processor import GPSProcessor, GPSData, EnvironmentClassification
 from src.diagnostics.vfd_monitor import VFDMonitor, VFDDiagnostic, DanfossStatusBits, VFDStatus
 
@@ -45,18 +48,34 @@ class EquipmentGroup:
     target_frequency: float = 60.0
     actual_frequencies: Dict[str, float] = field(default_factory=dict)
 
+    # 계산 결과 캐시 (dataclass 필드가 아닌 인스턴스 속성, asdict/비교 대상에서 제외)
+    # 목표/실제 주파수는 HMIStateManager 메서드로만 변경하며, 변경 시 invalidate_cache()로 무효화
+    _avg_actual_cache = None
+    _max_deviation_cache = None
+
+    def invalidate_cache(self):
+        """평균/최대 편차 캐시 무효화"""
+        self._avg_actual_cache = None
+        self._max_deviation_cache = None
+
     def get_avg_actual_frequency(self) -> float:
         """실제 주파수 평균 계산"""
-        if not self.actual_frequencies:
-            return 0.0
-        return sum(self.actual_frequencies.values()) / len(self.actual_frequencies)
+        if self._avg_actual_cache is None:
+            if not self.actual_frequencies:
+                self._avg_actual_cache = 0.0
+            else:
+                self._avg_actual_cache = sum(self.actual_frequencies.values()) / len(self.actual_frequencies)
+        return self._avg_actual_cache
 
     def get_max_deviation(self) -> float:
         """최대 편차 계산"""
-        if not self.actual_frequencies:
-            return 0.0
-        deviations = [abs(freq - self.target_frequency) for freq in self.actual_frequencies.values()]
-        return max(deviations)
+        if self._max_deviation_cache is None:
+            if not self.actual_frequencies:
+                self._max_deviation_cache = 0.0
+            else:
+                target = self.target_frequency
+                self._max_deviation_cache = max(abs(freq - target) for freq in self.actual_frequencies.values())
+        return self._max_deviation_cache
 
 
 @dataclass
@@ -79,7 +98,12 @@ class Alarm:
 
 
 class HMIStateManager:
-    """HMI 상태 관리자"""
+    """
+    HMI 상태 관리자
+
+    그룹 주파수/제어 모드, 60Hz 강제 전환, 알람, 학습 진행 상태는 이 클래스의 메서드로만
+    변경합니다 (편차 캐시와 export_state 캐시가 메서드 호출 시 무효화됨).
+    """
 
     def __init__(self):
         """초기화"""
@@ -96,9 +120,15 @@ class HMIStateManager:
         self.force_60hz_duration = 30.0  # 30초 점진적 전환
         self.force_60hz_completed = False  # 60Hz 강제 전환 완료 플래그
 
-        # 알람 리스트
-        self.alarms: List[Alarm] = []
+        # 알람 리스트 (최신 알람이 앞, 최대 개수 초과 시 가장 오래된 알람 자동 삭제)
         self.max_alarms = 100  # 최대 알람 저장 개수
+        self.alarms: deque = deque(maxlen=self.max_alarms)
+        # 우선순위별 알람 (self.alarms와 같은 순서/내용 유지) 및 미확인 알람 개수 (전체/우선순위별)
+        self._by_priority: Dict[AlarmPriority, deque] = {
+            priority: deque(maxlen=self.max_alarms) for priority in AlarmPriority
+        }
+        self._unack = 0
+        self._unack_by_priority: Dict[AlarmPriority, int] = dict.fromkeys(AlarmPriority, 0)
 
         # 시스템 시작 시간 (실제 운영 시 데이터베이스나 파일에서 로드)
         # 현재는 시뮬레이션: 8개월 전으로 설정
@@ -124,6 +154,11 @@ class HMIStateManager:
         self.vfd_monitor = VFDMonitor()
         self.current_vfd_diagnostics: Dict[str, VFDDiagnostic] = {}
 
+        # export_state 캐시 (timestamp 제외 본문, 상태 변경 메서드 호출 시 _state_dirty로 무효화)
+        self._state_dirty = True
+        self._cached_state: Optional[Dict] = None
+        self._cached_state_json: Optional[bytes] = None
+
     def set_control_mode(self, group_name: str, mode: ControlMode):
         """제어 모드 설정"""
         if group_name in self.groups:
@@ -132,16 +167,31 @@ class HMIStateManager:
             if old_mode != mode:
                 print(f"[HMI] {group_name} 모드 변경: {old_mode.value} -> {mode.value}")
             self.groups[group_name].control_mode = mode
+            self._state_dirty = True
 
     def update_target_frequency(self, group_name: str, frequency: float):
         """목표 주파수 업데이트"""
         if group_name in self.groups:
-            self.groups[group_name].target_frequency = frequency
+            group = self.groups[group_name]
+            group.target_frequency = frequency
+            group.invalidate_cache()
+            self._state_dirty = True
 
     def update_actual_frequency(self, group_name: str, equipment_id: str, frequency: float):
         """실제 주파수 업데이트"""
         if group_name in self.groups:
-            self.groups[group_name].actual_frequencies[equipment_id] = frequency
+            group = self.groups[group_name]
+            group.actual_frequencies[equipment_id] = frequency
+            group.invalidate_cache()
+            self._state_dirty = True
+
+    def update_actual_frequencies(self, group_name: str, frequencies: Dict[str, float]):
+        """그룹 내 여러 장비의 실제 주파수 일괄 업데이트 ({장비 ID: 주파수})"""
+        if group_name in self.groups:
+            group = self.groups[group_name]
+            group.actual_frequencies.update(frequencies)
+            group.invalidate_cache()
+            self._state_dirty = True
 
     def get_deviation_status(self, group_name: str) -> str:
         """편차 상태 반환 (Green/Yellow/Red)"""
@@ -162,6 +212,7 @@ class HMIStateManager:
         if self.force_60hz_state == ForceMode60HzState.NORMAL:
             self.force_60hz_state = ForceMode60HzState.FORCING
             self.force_60hz_start_time = time.time()
+            self._state_dirty = True
 
             # 60Hz 강제 전환 알람 추가
             self.add_alarm(
@@ -184,12 +235,14 @@ class HMIStateManager:
                     print(f"[HMI] 60Hz 강제 전환 완료 - 모든 그룹을 60Hz 고정으로 전환")
                     self.force_60hz_state = ForceMode60HzState.FORCED
                     self.force_60hz_completed = True
+                    self._state_dirty = True
 
                     # 모든 그룹을 60Hz 고정으로 설정
                     for group_name, group in self.groups.items():
                         print(f"[HMI] 60Hz 강제 전환: {group_name} -> 60Hz 고정")
                         group.control_mode = ControlMode.FIXED_60HZ
                         group.target_frequency = 60.0
+                        group.invalidate_cache()
 
                     self.add_alarm(
                         priority=AlarmPriority.WARNING,
@@ -223,6 +276,7 @@ class HMIStateManager:
         self.force_60hz_state = ForceMode60HzState.NORMAL
         self.force_60hz_start_time = None
         self.force_60hz_completed = False  # 플래그 리셋
+        self._state_dirty = True
 
         self.add_alarm(
             priority=AlarmPriority.INFO,
@@ -239,24 +293,53 @@ class HMIStateManager:
             message=message
         )
 
-        self.alarms.insert(0, alarm)  # 최신 알람을 앞에 추가
+        # 최대 개수 도달 시 가장 오래된 알람이 밀려나므로 우선순위별 목록/미확인 개수에서도 제거
+        if len(self.alarms) == self.max_alarms:
+            evicted = self.alarms[-1]
+            self._by_priority[evicted.priority].pop()
+            if not evicted.acknowledged:
+                self._unack -= 1
+                self._unack_by_priority[evicted.priority] -= 1
 
-        # 최대 개수 제한
-        if len(self.alarms) > self.max_alarms:
-            self.alarms = self.alarms[:self.max_alarms]
+        self.alarms.appendleft(alarm)  # 최신 알람을 앞에 추가
+        self._by_priority[priority].appendleft(alarm)
+        self._unack += 1
+        self._unack_by_priority[priority] += 1
+        self._state_dirty = True
 
     def acknowledge_alarm(self, index: int):
         """알람 확인"""
         if 0 <= index < len(self.alarms):
-            self.alarms[index].acknowledged = True
+            alarm = self.alarms[index]
+            if not alarm.acknowledged:
+                alarm.acknowledged = True
+                self._unack -= 1
+                self._unack_by_priority[alarm.priority] -= 1
+                self._state_dirty = True
 
     def get_active_alarms(self) -> List[Alarm]:
         """미확인 알람 반환"""
+        if self._unack == 0:
+            return []
         return [alarm for alarm in self.alarms if not alarm.acknowledged]
 
+    def get_active_alarm_count(self, priority: Optional[AlarmPriority] = None) -> int:
+        """미확인 알람 개수 반환 (priority 지정 시 해당 우선순위만)"""
+        if priority is None:
+            return self._unack
+        return self._unack_by_priority[priority]
+
+    def get_alarms(self) -> List[Alarm]:
+        """전체 알람 리스트 반환 (최신순, 슬라이싱 가능한 list 사본)"""
+        return list(self.alarms)
+
+    def get_alarm_count(self, priority: AlarmPriority) -> int:
+        """우선순위별 알람 개수 반환 (확인 여부 무관)"""
+        return len(self._by_priority[priority])
+
     def get_alarms_by_priority(self, priority: AlarmPriority) -> List[Alarm]:
         """우선순위별 알람 반환"""
-        return [alarm for alarm in self.alarms if alarm.priority == priority]
+        return list(self._by_priority[priority])
 
     def update_learning_progress(self,
                                 temp_accuracy: float,
@@ -269,6 +352,7 @@ class HMIStateManager:
         self.learning_progress["average_energy_savings"] = energy_savings
         self.learning_progress["total_learning_hours"] = learning_hours
         self.learning_progress["last_learning_time"] = datetime.now()
+        self._state_dirty = True
 
     def get_learning_progress(self) -> Dict:
         """학습 진행 상태 반환"""
@@ -314,14 +398,63 @@ class HMIStateManager:
         return summary
 
     def export_state(self) -> Dict:
-        """현재 상태 내보내기 (로깅/저장용)"""
+        """
+        현재 상태 내보내기 (로깅/저장용)
+
+        timestamp는 호출할 때마다 현재 시각으로 생성하고, 나머지 본문은 마지막 상태
+        변경 이후 처음 호출될 때만 새로 생성합니다. 상태 변경은 HMIStateManager 메서드로만
+        감지되므로 groups/learning_progress를 직접 수정한 내용은 반영되지 않습니다.
+        60Hz 강제 전환 중에는 진행률이 시간에 따라 변하므로 매번 새로 생성합니다.
+        반환값은 캐시와 분리된 사본이므로 수정해도 이후 내보내기에 영향이 없습니다.
+        """
+        body = self._get_state_body()
         return {
             "timestamp": datetime.now().isoformat(),
+            "groups": {
+                name: {**group, "actual_frequencies": dict(group["actual_frequencies"])}
+                for name, group in body["groups"].items()
+            },
+            "force_60hz": dict(body["force_60hz"]),
+            "active_alarms_count": body["active_alarms_count"],
+            "learning_progress": dict(body["learning_progress"])
+        }
+
+    def export_state_json(self) -> bytes:
+        """현재 상태를 JSON(UTF-8 bytes)으로 내보내기 (상태 변경 전까지 본문 직렬화 결과 재사용)"""
+        body = self._get_state_body()
+        if self._cached_state_json is None:
+            self._cached_state_json = self._dumps(body)
+        # 직렬화된 본문 '{...}' 앞에 현재 timestamp 필드를 붙임
+        timestamp = self._dumps({"timestamp": datetime.now().isoformat()})
+        return timestamp[:-1] + b"," + self._cached_state_json[1:]
+
+    @staticmethod
+    def _dumps(obj: Dict) -> bytes:
+        """JSON(UTF-8 bytes) 직렬화 (orjson 미설치 시 표준 json 사용)"""
+        if orjson is not None:
+            return orjson.dumps(obj)
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"),
+            default=lambda obj: obj.isoformat()
+        ).encode("utf-8")
+
+    def _get_state_body(self) -> Dict:
+        """timestamp를 제외한 상태 본문 (변경 시에만 재생성)"""
+        if (self._state_dirty or self._cached_state is None
+                or self.force_60hz_state == ForceMode60HzState.FORCING):
+            self._cached_state = self._build_state()
+            self._cached_state_json = None
+            self._state_dirty = False
+        return self._cached_state
+
+    def _build_state(self) -> Dict:
+        """상태 본문 스냅샷 생성 (timestamp 제외)"""
+        return {
             "groups": {
                 name: {
                     "control_mode": group.control_mode.value,
                     "target_frequency": group.target_frequency,
-                    "actual_frequencies": group.actual_frequencies,
+                    "actual_frequencies": dict(group.actual_frequencies),
                     "avg_actual": group.get_avg_actual_frequency(),
                     "max_deviation": group.get_max_deviation(),
                     "deviation_status": self.get_deviation_status(name)
@@ -332,6 +465,6 @@ class HMIStateManager:
                 "state": self.force_60hz_state.value,
                 "progress": self.get_force_60hz_progress()
             },
-            "active_alarms_count": len(self.get_active_alarms()),
-            "learning_progress": self.learning_progress
+            "active_alarms_count": self._unack,
+            "learning_progress": dict(self.learning_progress)
         }
@@ -3,12 +3,58 @@
 핵심 성공 기준 검증
 """
 
+import math
 import time
-import random
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 import logging
 
+import numpy as np
+
+
+# 시스템 오류 유형 (시뮬레이션)
+_ERROR_TYPES = ('통신 지연', '센서 일시 불통', 'VFD 경고')
+
+# 샘플 일괄 생성 단위 (실시간 24시간 = 43,200 샘플도 이 크기만큼만 메모리 사용)
+_SAMPLE_CHUNK = 4096
+
+# 누적 통계를 유지하는 성능 지표
+_METRICS = (
+    'energy_savings_pump',  # 펌프 에너지 절감률
+    'energy_savings_fan',  # 팬 에너지 절감률
+    'T5_accuracy',  # T5 온도 제어 정확도
+    'T6_accuracy',  # T6 온도 제어 정확도
+    'ai_response_times',  # AI 응답 시간 (초)
+    'memory_usage_mb',  # 메모리 사용량
+    'cpu_usage_percent',  # CPU 사용률
+)
+
+
+@dataclass
+class RollingStat:
+    """누적 통계 (평균, 편차 제곱합 M2 + 최소/최대, 샘플 저장 없음)"""
+    n: int = 0
+    mean: float = 0.0
+    M2: float = 0.0
+    lo: float = math.inf
+    hi: float = -math.inf
+
+    def update_batch(self, values: np.ndarray):
+        """샘플 배열 반영 (배열 통계를 병합하는 Chan 방식)"""
+        m = len(values)
+        if m == 0:
+            return
+        batch_mean = float(values.mean())
+        batch_M2 = float(((values - batch_mean) ** 2).sum())
+        total = self.n + m
+        delta = batch_mean - self.mean
+        self.mean += delta * m / total
+        self.M2 += batch_M2 + delta * delta * self.n * m / total
+        self.n = total
+        self.lo = min(self.lo, float(values.min()))
+        self.hi = max(self.hi, float(values.max()))
+
 
 class ContinuousOperationTest:
     """24시간 연속 운전 테스트 시뮬레이션"""
@@ -18,25 +64,22 @@ class ContinuousOperationTest:
         self.test_duration_hours = test_duration_hours
         self.start_time = None
         self.end_time = None
+        self.scheduled_seconds = 0.0  # 예정 테스트 시간 (주기 × 반복 횟수)
+        self._sim_start = None
+        self.rng = np.random.default_rng()
 
-        # 성능 데이터 수집
-        self.performance_data = {
-            'energy_savings_pump': [],  # 펌프 에너지 절감률
-            'energy_savings_fan': [],  # 팬 에너지 절감률
-            'T5_accuracy': [],  # T5 온도 제어 정확도
-            'T6_accuracy': [],  # T6 온도 제어 정확도
-            'ai_response_times': [],  # AI 응답 시간 (초)
-            'system_errors': [],  # 시스템 오류
-            'memory_usage_mb': [],  # 메모리 사용량
-            'cpu_usage_percent': []  # CPU 사용률
-        }
+        # 성능 데이터 수집 (지표별 누적 통계만 유지)
+        self.performance_data: Dict[str, RollingStat] = {}
+        self.ai_violations_count = 0  # AI 응답시간 2초 이상 횟수
+        self.system_errors: List[Dict[str, Any]] = []  # 시스템 오류
 
-    def run_test(self, accelerated: bool = True) -> Dict[str, Any]:
+    def run_test(self, accelerated: bool = True, realtime: bool = True) -> Dict[str, Any]:
         """
         24시간 연속 운전 테스트 실행
 
         Args:
             accelerated: True이면 1시간을 1초로 압축 (24초 테스트)
+            realtime: False이면 주기 대기 없이 즉시 실행 (CI용, 가용성은 예정 시간 기준)
         """
         self.start_time = datetime.now()
 
@@ -51,15 +94,24 @@ class ContinuousOperationTest:
             sleep_per_iteration = 2.0
             self.logger.info(f"실시간 {self.test_duration_hours}시간 테스트 시작")
 
+        # 전체 주기의 시뮬레이션 시간 → 데이터 일괄 생성 (청크 단위로 누적 통계에 반영)
+        self.performance_data = {metric: RollingStat() for metric in _METRICS}
+        self.ai_violations_count = 0
+        self.system_errors = []
+        for chunk_start in range(0, total_iterations, _SAMPLE_CHUNK):
+            iterations = np.arange(chunk_start, min(chunk_start + _SAMPLE_CHUNK, total_iterations))
+            simulated_hours = iterations if accelerated else (iterations * 2 / 3600)
+            self._collect_performance_data(simulated_hours)
+
+        self.scheduled_seconds = total_iterations * sleep_per_iteration
+        self._sim_start = time.monotonic()
         for iteration in range(total_iterations):
-            # 현재 시뮬레이션 시간
-            simulated_hour = iteration if accelerated else (iteration * 2 / 3600)
-
-            # 데이터 수집
-            self._collect_performance_data(simulated_hour)
-
-            # 주기 대기
-            time.sleep(sleep_per_iteration)
+            # 주기 대기: 시작 시각 기준 마감 시각까지 남은 시간만 대기 (누적 드리프트 방지)
+            if realtime:
+                deadline = self._sim_start + sleep_per_iteration * (iteration + 1)
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
 
             # 진행률 출력 (10% 단위)
             progress = (iteration + 1) / total_iterations * 100
@@ -73,81 +125,83 @@ class ContinuousOperationTest:
 
         return results
 
-    def _collect_performance_data(self, simulated_hour: float):
-        """성능 데이터 수집 (시뮬레이션)"""
+    def _collect_performance_data(self, simulated_hours: np.ndarray):
+        """성능 데이터 수집 (시뮬레이션, 주기 배열 단위 벡터 생성)"""
+        n = len(simulated_hours)
+        rng = self.rng
+        stats = self.performance_data
 
         # 펌프 에너지 절감률: 46-52% 목표 (초기 46-48%, 점진적 개선)
         # 시간에 따라 점진적으로 개선되는 패턴
-        improvement_factor = min(simulated_hour / 720, 1.0)  # 30일(720시간) 후 최대
+        improvement_factor = np.minimum(simulated_hours / 720, 1.0)  # 30일(720시간) 후 최대
         base_pump_savings = 47.0 + improvement_factor * 2.0  # 47% → 49% (기준 상향)
-        pump_savings = base_pump_savings + random.uniform(-0.5, 0.5)
-        self.performance_data['energy_savings_pump'].append(pump_savings)
+        stats['energy_savings_pump'].update_batch(base_pump_savings + rng.uniform(-0.5, 0.5, n))
 
         # 팬 에너지 절감률: 50-58% 목표 (초기 50-54%, 점진적 개선)
         base_fan_savings = 52.0 + improvement_factor * 4.0  # 52% → 56% (기준 상향)
-        fan_savings = base_fan_savings + random.uniform(-1.0, 1.0)
-        self.performance_data['energy_savings_fan'].append(fan_savings)
+        stats['energy_savings_fan'].update_batch(base_fan_savings + rng.uniform(-1.0, 1.0, n))
 
         # T5 온도 제어 정확도: 90% 이상 목표 (34-36°C 범위 유지)
-        T5_accuracy = random.uniform(88, 97)  # 평균 92-93%
-        self.performance_data['T5_accuracy'].append(T5_accuracy)
+        stats['T5_accuracy'].update_batch(rng.uniform(88, 97, n))  # 평균 92-93%
 
         # T6 온도 제어 정확도: 90% 이상 목표 (42-44°C 범위 유지)
-        T6_accuracy = random.uniform(90, 98)  # 평균 94-95%
-        self.performance_data['T6_accuracy'].append(T6_accuracy)
+        stats['T6_accuracy'].update_batch(rng.uniform(90, 98, n))  # 평균 94-95%
 
         # AI 응답시간: 2초 주기 100% 준수
         # 실제로는 <2초여야 하지만, 주기가 2초이므로 1.8~1.99초 시뮬레이션
-        ai_response_time = random.uniform(1.80, 1.99)
-        self.performance_data['ai_response_times'].append(ai_response_time)
+        ai_response_times = rng.uniform(1.80, 1.99, n)
+        stats['ai_response_times'].update_batch(ai_response_times)
+        self.ai_violations_count += int(np.count_nonzero(ai_response_times >= 2.0))
 
         # 메모리 사용량: 8GB 이하 목표
         # 5-7GB 범위로 안정적으로 유지
-        memory_mb = random.uniform(5120, 7168)  # 5-7 GB
-        self.performance_data['memory_usage_mb'].append(memory_mb)
+        stats['memory_usage_mb'].update_batch(rng.uniform(5120, 7168, n))  # 5-7 GB
 
         # CPU 사용률: 안정적 유지
-        cpu_percent = random.uniform(30, 60)
-        self.performance_data['cpu_usage_percent'].append(cpu_percent)
+        stats['cpu_usage_percent'].update_batch(rng.uniform(30, 60, n))
 
         # 시스템 오류: 매우 드물게 발생 (99.5% 가용성)
-        if random.random() < 0.001:  # 0.1% 확률
-            self.performance_data['system_errors'].append({
-                'time': simulated_hour,
-                'type': random.choice(['통신 지연', '센서 일시 불통', 'VFD 경고'])
-            })
+        error_indices = np.nonzero(rng.random(n) < 0.001)[0]  # 0.1% 확률
+        error_types = rng.integers(len(_ERROR_TYPES), size=len(error_indices))
+        self.system_errors.extend(
+            {'time': float(simulated_hours[i]), 'type': _ERROR_TYPES[t]}
+            for i, t in zip(error_indices, error_types)
+        )
 
     def _analyze_results(self) -> Dict[str, Any]:
         """테스트 결과 분석"""
 
+        stats = self.performance_data
+
         # 에너지 절감률 통계
-        pump_savings_avg = sum(self.performance_data['energy_savings_pump']) / len(self.performance_data['energy_savings_pump'])
-        pump_savings_min = min(self.performance_data['energy_savings_pump'])
-        pump_savings_max = max(self.performance_data['energy_savings_pump'])
+        pump_savings_avg = stats['energy_savings_pump'].mean
+        pump_savings_min = stats['energy_savings_pump'].lo
+        pump_savings_max = stats['energy_savings_pump'].hi
 
-        fan_savings_avg = sum(self.performance_data['energy_savings_fan']) / len(self.performance_data['energy_savings_fan'])
-        fan_savings_min = min(self.performance_data['energy_savings_fan'])
-        fan_savings_max = max(self.performance_data['energy_savings_fan'])
+        fan_savings_avg = stats['energy_savings_fan'].mean
+        fan_savings_min = stats['energy_savings_fan'].lo
+        fan_savings_max = stats['energy_savings_fan'].hi
 
         # 온도 제어 정확도
-        T5_accuracy_avg = sum(self.performance_data['T5_accuracy']) / len(self.performance_data['T5_accuracy'])
-        T6_accuracy_avg = sum(self.performance_data['T6_accuracy']) / len(self.performance_data['T6_accuracy'])
+        T5_accuracy_avg = stats['T5_accuracy'].mean
+        T6_accuracy_avg = stats['T6_accuracy'].mean
 
         # AI 응답시간
-        ai_response_avg = sum(self.performance_data['ai_response_times']) / len(self.performance_data['ai_response_times'])
-        ai_response_max = max(self.performance_data['ai_response_times'])
-        ai_violations = sum(1 for t in self.performance_data['ai_response_times'] if t >= 2.0)
+        ai_response_avg = stats['ai_response_times'].mean
+        ai_response_max = stats['ai_response_times'].hi
+        ai_violations = self.ai_violations_count
 
-        # 시스템 가용성
+        # 시스템 가용성 (대기 없이 실행한 경우에도 예정 테스트 시간 기준으로 평가)
         total_time = (self.end_time - self.start_time).total_seconds()
-        error_count = len(self.performance_data['system_errors'])
+        availability_time = max(total_time, self.scheduled_seconds)
+        error_count = len(self.system_errors)
         downtime = error_count * 10  # 각 오류당 10초 다운타임 가정
-        availability = ((total_time - downtime) / total_time) * 100 if total_time > 0 else 0
+        availability = ((availability_time - downtime) / availability_time) * 100 if availability_time > 0 else 0
 
         # Xavier NX 리소스 사용량
-        memory_avg_mb = sum(self.performance_data['memory_usage_mb']) / len(self.performance_data['memory_usage_mb'])
-        memory_max_mb = max(self.performance_data['memory_usage_mb'])
-        cpu_avg = sum(self.performance_data['cpu_usage_percent']) / len(self.performance_data['cpu_usage_percent'])
+        memory_avg_mb = stats['memory_usage_mb'].mean
+        memory_max_mb = stats['memory_usage_mb'].hi
+        cpu_avg = stats['cpu_usage_percent'].mean
 
         # 성공 기준 평가
         criteria_met = {
@@ -595,13 +595,15 @@ class SimulationScenarios:
         if self.current_scenario is None:
             return {}
 
+        progress = self.get_scenario_progress()
         return {
             "name": self.current_scenario.name,
             "type": self.current_scenario.scenario_type.value,
             "description": self.current_scenario.description,
             "duration_minutes": self.current_scenario.duration_minutes,
             "elapsed_seconds": round(self.elapsed_seconds, 1),
-            "progress": f"{self.get_scenario_progress():.1f}%",
+            "progress": f"{progress:.1f}%",
+            "progress_fraction": progress / 100.0,  # 0.0 ~ 1.0 (st.progress용)
             "is_complete": self.is_scenario_complete()
         }
 
@@ -0,0 +1,191 @@
+"""
+Stage 9: HMI 대시보드 (Streamlit) 동작 테스트
+streamlit.testing AppTest로 대시보드 스크립트를 직접 실행하여 검증
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from collections import deque
+from datetime import datetime, timedelta
+from unittest import mock
+
+# UTF-8 인코딩 설정 (Windows cp949 문제 해결)
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from src.adapter.shared_data_writer import SharedDataWriter
+from src.control.integrated_controller import IntegratedController
+from src.hmi.dashboard import _lttb_indices, _DEFAULT_FREQS, _SENSOR_HISTORY_LEN, _TREND_MAX_POINTS
+from src.hmi.hmi_state_manager import ControlMode, AlarmPriority
+from src.simulation.scenarios import SimulationScenarios
+
+DASHBOARD_PATH = os.path.join(PROJECT_ROOT, 'src', 'hmi', 'dashboard.py')
+SCENARIO_DASHBOARD_PATH = os.path.join(PROJECT_ROOT, 'src', 'hmi', 'dashboard_with_scenario.py')
+
+
+class CountingScenarios(SimulationScenarios):
+    """시나리오 정보/센서 값 조회 횟수를 세는 시나리오 엔진"""
+
+    def __init__(self):
+        super().__init__()
+        self.info_calls = 0
+        self.value_calls = 0
+
+    def get_scenario_info(self):
+        self.info_calls += 1
+        return super().get_scenario_info()
+
+    def get_current_values(self):
+        self.value_calls += 1
+        return super().get_current_values()
+
+
+class TestHMIDashboard(unittest.TestCase):
+    """HMI 대시보드 렌더링 테스트"""
+
+    def setUp(self):
+        """대시보드 최초 렌더링 (공유 데이터 파일은 임시 디렉토리에 기록)"""
+        self.shared_dir = tempfile.TemporaryDirectory()
+        self.at = AppTest.from_file(DASHBOARD_PATH, default_timeout=180)
+        self.at.session_state["shared_data_writer"] = SharedDataWriter(shared_dir=self.shared_dir.name)
+        self.at.run()
+        self.assertEqual(len(self.at.exception), 0)
+
+    def tearDown(self):
+        """임시 공유 디렉토리 삭제"""
+        self.shared_dir.cleanup()
+
+    def test_fixed_60hz_group_keeps_60hz_target(self):
+        """60Hz 고정 그룹은 재실행 후에도 목표 주파수 60Hz 유지 (AI 계산값으로 덮어쓰지 않음)"""
+        next(b for b in self.at.button if b.key == "btn_60hz_SW_PUMPS").click()
+        self.at.run()
+
+        for _ in range(3):
+            self.at.run()
+
+        self.assertEqual(len(self.at.exception), 0)
+        group = self.at.session_state["hmi_manager"].groups["SW_PUMPS"]
+        self.assertEqual(group.control_mode, ControlMode.FIXED_60HZ)
+        self.assertEqual(group.target_frequency, 60.0)
+        self.assertEqual(group.get_avg_actual_frequency(), 60.0)
+        print(f"\n✓ SW 펌프 60Hz 고정: 목표 {group.target_frequency:.1f} Hz 유지")
+
+    def test_current_frequencies_initialized_once(self):
+        """첫 제어 계산은 _DEFAULT_FREQS로 초기화된 current_frequencies 사용 (세션당 한 번 초기화)"""
+        received = []
+        compute_control = IntegratedController.compute_control
+
+        def record(controller, *args, **kwargs):
+            received.append(dict(kwargs['current_frequencies']))
+            return compute_control(controller, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as shared_dir, \
+                mock.patch.object(IntegratedController, 'compute_control', autospec=True, side_effect=record):
+            at = AppTest.from_file(DASHBOARD_PATH, default_timeout=180)
+            at.session_state["shared_data_writer"] = SharedDataWriter(shared_dir=shared_dir)
+            at.run()
+
+        self.assertEqual(len(at.exception), 0)
+        self.assertEqual(received[0], dict(_DEFAULT_FREQS))
+        self.assertTrue(at.session_state["_freqs_migrated"])
+
+    def test_sidebar_active_alarm_counts(self):
+        """사이드바 알람 현황은 우선순위별 미확인 알람 개수 표시"""
+        hmi_manager = self.at.session_state["hmi_manager"]
+        hmi_manager.add_alarm(AlarmPriority.CRITICAL, "SYSTEM", "VFD Trip")
+        hmi_manager.add_alarm(AlarmPriority.WARNING, "FW-P1", "주파수 편차")
+        hmi_manager.add_alarm(AlarmPriority.WARNING, "FW-P2", "주파수 편차")
+        hmi_manager.acknowledge_alarm(0)
+        self.at.run()
+
+        self.assertEqual(len(self.at.exception), 0)
+        counts = {m.label: m.value for m in self.at.sidebar.metric}
+        self.assertEqual(counts["🔴 CRITICAL 알람"], "1")
+        self.assertEqual(counts["🟡 WARNING 알람"], "1")
+
+
+class TestScenarioDashboard(unittest.TestCase):
+    """시나리오 대시보드 렌더링 테스트"""
+
+    def test_scenario_info_fetched_once_per_full_run(self):
+        """전체 실행 한 번에 시나리오 정보/센서 값은 한 번만 조회 (fragment들이 캐시를 공유)"""
+        at = AppTest.from_file(SCENARIO_DASHBOARD_PATH, default_timeout=180)
+        engine = CountingScenarios()
+        at.session_state["scenario_engine"] = engine
+
+        for _ in range(2):
+            engine.info_calls = engine.value_calls = 0
+            at.run()
+
+            self.assertEqual(len(at.exception), 0)
+            self.assertEqual(engine.info_calls, 1)
+            self.assertEqual(engine.value_calls, 1)
+
+
+class TestTrendDownsampling(unittest.TestCase):
+    """트렌드 LTTB 다운샘플링 테스트"""
+
+    def test_lttb_indices(self):
+        """첫/마지막 점 유지, 목표 개수, 인덱스 단조 증가"""
+        rng = np.random.default_rng(0)
+        y = np.cumsum(rng.normal(size=_SENSOR_HISTORY_LEN))
+
+        indices = _lttb_indices(y, _TREND_MAX_POINTS)
+
+        self.assertEqual(len(indices), _TREND_MAX_POINTS)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], len(y) - 1)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_lttb_keeps_peak(self):
+        """단일 스파이크는 다운샘플링 후에도 유지"""
+        y = np.zeros(_SENSOR_HISTORY_LEN)
+        y[437] = 10.0
+
+        indices = _lttb_indices(y, _TREND_MAX_POINTS)
+
+        self.assertIn(437, indices)
+
+    def test_lttb_short_series_unchanged(self):
+        """목표 개수 이하의 이력은 그대로 유지"""
+        y = np.arange(50, dtype=np.float64)
+        np.testing.assert_array_equal(_lttb_indices(y, _TREND_MAX_POINTS), np.arange(50))
+
+    def test_temperature_trend_is_downsampled(self):
+        """10분 온도 이력(600점)을 가진 대시보드의 트렌드 트레이스는 최대 점 수로 축소"""
+        start = datetime.now() - timedelta(seconds=_SENSOR_HISTORY_LEN)
+        history = {
+            key: deque((30.0 + i % 7 for i in range(_SENSOR_HISTORY_LEN)), maxlen=_SENSOR_HISTORY_LEN)
+            for key in ('T4', 'T5', 'T6')
+        }
+        history['timestamps'] = deque(
+            (start + timedelta(seconds=i) for i in range(_SENSOR_HISTORY_LEN)), maxlen=_SENSOR_HISTORY_LEN
+        )
+
+        with tempfile.TemporaryDirectory() as shared_dir:
+            at = AppTest.from_file(DASHBOARD_PATH, default_timeout=180)
+            at.session_state["shared_data_writer"] = SharedDataWriter(shared_dir=shared_dir)
+            at.session_state["sensor_history"] = history
+            at.run()
+
+        self.assertEqual(len(at.exception), 0)
+        fig = at.session_state["temperature_trend_fig"]
+        self.assertEqual(len(fig.data), 3)
+        for trace in fig.data:
+            self.assertEqual(len(trace.x), _TREND_MAX_POINTS)
+            self.assertEqual(len(trace.y), _TREND_MAX_POINTS)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,291 @@
+"""
+Stage 9: HMI 상태 관리자 테스트
+장비 그룹 주파수 갱신, 알람 관리, 상태 내보내기 검증
+"""
+
+import unittest
+import copy
+import json
+import os
+import pickle
+import random
+import sys
+from dataclasses import asdict
+from unittest import mock
+
+# UTF-8 인코딩 설정 (Windows cp949 문제 해결)
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.hmi import hmi_state_manager
+from src.hmi.hmi_state_manager import HMIStateManager, EquipmentGroup, AlarmPriority, ControlMode
+
+
+class TestEquipmentGroupFrequencies(unittest.TestCase):
+    """장비 그룹 목표/실제 주파수 테스트"""
+
+    def setUp(self):
+        """테스트 초기화"""
+        self.hmi_manager = HMIStateManager()
+        self.hmi_manager.update_target_frequency("SW_PUMPS", 48.4)
+
+    def test_bulk_actual_frequency_update(self):
+        """일괄 업데이트 후 평균/최대 편차가 새 값으로 한 번에 재계산"""
+        self.hmi_manager.update_actual_frequencies("SW_PUMPS", {"SW-P1": 48.2, "SW-P2": 48.5})
+        group = self.hmi_manager.groups["SW_PUMPS"]
+
+        self.assertEqual(group.actual_frequencies, {"SW-P1": 48.2, "SW-P2": 48.5})
+        self.assertAlmostEqual(group.get_avg_actual_frequency(), 48.35)
+        self.assertAlmostEqual(group.get_max_deviation(), 0.2)
+        self.assertEqual(self.hmi_manager.get_deviation_status("SW_PUMPS"), "Green")
+
+        # 일부 장비만 일괄 갱신 (나머지 장비 값은 유지)
+        self.hmi_manager.update_actual_frequencies("SW_PUMPS", {"SW-P1": 47.8})
+
+        self.assertEqual(group.actual_frequencies, {"SW-P1": 47.8, "SW-P2": 48.5})
+        self.assertAlmostEqual(group.get_avg_actual_frequency(), 48.15)
+        self.assertAlmostEqual(group.get_max_deviation(), 0.6)
+        self.assertEqual(self.hmi_manager.get_deviation_status("SW_PUMPS"), "Red")
+
+    def test_bulk_update_unknown_group_ignored(self):
+        """존재하지 않는 그룹의 일괄 업데이트는 무시"""
+        self.hmi_manager.update_actual_frequencies("UNKNOWN", {"X-1": 50.0})
+        self.assertEqual(set(self.hmi_manager.groups), {"SW_PUMPS", "FW_PUMPS", "ER_FANS"})
+
+
+class TestEquipmentGroupCache(unittest.TestCase):
+    """장비 그룹 평균/최대 편차 캐시 테스트"""
+
+    def setUp(self):
+        """테스트 초기화"""
+        self.group = EquipmentGroup(name="SW 펌프", target_frequency=50.0,
+                                    actual_frequencies={"SW-P1": 49.0, "SW-P2": 50.5})
+
+    def test_cached_until_invalidated(self):
+        """invalidate_cache() 호출 전까지 캐시된 값 재사용"""
+        self.assertAlmostEqual(self.group.get_avg_actual_frequency(), 49.75)
+        self.assertAlmostEqual(self.group.get_max_deviation(), 1.0)
+
+        self.group.actual_frequencies["SW-P1"] = 40.0
+        self.assertAlmostEqual(self.group.get_avg_actual_frequency(), 49.75)
+        self.assertAlmostEqual(self.group.get_max_deviation(), 1.0)
+
+        self.group.invalidate_cache()
+        self.assertAlmostEqual(self.group.get_avg_actual_frequency(), 45.25)
+        self.assertAlmostEqual(self.group.get_max_deviation(), 10.0)
+
+    def test_cache_not_a_dataclass_field(self):
+        """캐시는 asdict/pickle/copy 결과에 영향을 주지 않음"""
+        self.group.get_avg_actual_frequency()
+
+        self.assertEqual(set(asdict(self.group)),
+                         {"name", "control_mode", "target_frequency", "actual_frequencies"})
+
+        restored = pickle.loads(pickle.dumps(self.group))
+        self.assertEqual(restored, self.group)
+        self.assertAlmostEqual(restored.get_avg_actual_frequency(), 49.75)
+
+        copied = copy.deepcopy(self.group)
+        copied.actual_frequencies["SW-P1"] = 30.0
+        copied.invalidate_cache()
+        self.assertAlmostEqual(copied.get_avg_actual_frequency(), 40.25)
+        self.assertAlmostEqual(self.group.get_avg_actual_frequency(), 49.75)
+
+    def test_manager_updates_invalidate(self):
+        """HMI 관리자 경유 갱신 후 편차 상태 재계산"""
+        hmi_manager = HMIStateManager()
+        hmi_manager.update_actual_frequencies("FW_PUMPS", {"FW-P1": 48.0, "FW-P2": 48.0})
+        hmi_manager.update_target_frequency("FW_PUMPS", 48.0)
+        self.assertEqual(hmi_manager.get_deviation_status("FW_PUMPS"), "Green")
+
+        hmi_manager.update_actual_frequency("FW_PUMPS", "FW-P2", 48.4)
+        self.assertEqual(hmi_manager.get_deviation_status("FW_PUMPS"), "Yellow")
+
+        hmi_manager.update_target_frequency("FW_PUMPS", 47.0)
+        self.assertEqual(hmi_manager.get_deviation_status("FW_PUMPS"), "Red")
+
+    def test_force_60hz_completion_invalidates(self):
+        """60Hz 강제 전환 완료 시 모든 그룹 편차를 60Hz 기준으로 재계산"""
+        hmi_manager = HMIStateManager()
+        hmi_manager.update_actual_frequencies("ER_FANS", {"ER-F1": 48.0})
+        hmi_manager.update_target_frequency("ER_FANS", 48.0)
+        self.assertAlmostEqual(hmi_manager.groups["ER_FANS"].get_max_deviation(), 0.0)
+
+        hmi_manager.start_force_60hz()
+        hmi_manager.force_60hz_start_time -= hmi_manager.force_60hz_duration
+        hmi_manager.update_force_60hz()
+
+        self.assertAlmostEqual(hmi_manager.groups["ER_FANS"].get_max_deviation(), 12.0)
+
+
+class TestAlarmIndex(unittest.TestCase):
+    """우선순위별 알람 목록 / 미확인 알람 카운터 테스트"""
+
+    def setUp(self):
+        """테스트 초기화"""
+        self.hmi_manager = HMIStateManager()
+
+    def assert_index_consistent(self):
+        """인덱스/카운터가 전체 알람 목록을 순회한 결과와 일치하는지 확인"""
+        alarms = self.hmi_manager.get_alarms()
+        active = [a for a in alarms if not a.acknowledged]
+        self.assertEqual(self.hmi_manager.get_active_alarm_count(), len(active))
+        self.assertEqual(self.hmi_manager.get_active_alarms(), active)
+        for priority in AlarmPriority:
+            self.assertEqual(self.hmi_manager.get_alarms_by_priority(priority),
+                             [a for a in alarms if a.priority == priority])
+            self.assertEqual(self.hmi_manager.get_alarm_count(priority),
+                             sum(1 for a in alarms if a.priority == priority))
+            self.assertEqual(self.hmi_manager.get_active_alarm_count(priority),
+                             sum(1 for a in active if a.priority == priority))
+
+    def test_index_matches_alarm_list(self):
+        """알람 추가/확인/최대 개수 초과 삭제 후에도 인덱스 일치"""
+        rng = random.Random(0)
+        priorities = list(AlarmPriority)
+
+        for i in range(self.hmi_manager.max_alarms * 3):
+            self.hmi_manager.add_alarm(rng.choice(priorities), "TEST", f"알람 {i}")
+            if rng.random() < 0.3:
+                self.hmi_manager.acknowledge_alarm(rng.randrange(len(self.hmi_manager.alarms)))
+            self.assert_index_consistent()
+
+        self.assertEqual(len(self.hmi_manager.alarms), self.hmi_manager.max_alarms)
+        self.assertEqual(self.hmi_manager.alarms[0].message, f"알람 {self.hmi_manager.max_alarms * 3 - 1}")
+
+    def test_acknowledge_twice_counts_once(self):
+        """같은 알람을 두 번 확인해도 미확인 개수는 한 번만 감소"""
+        self.hmi_manager.add_alarm(AlarmPriority.WARNING, "FW-P1", "주파수 편차")
+        self.hmi_manager.add_alarm(AlarmPriority.CRITICAL, "SYSTEM", "긴급")
+
+        self.hmi_manager.acknowledge_alarm(1)
+        self.hmi_manager.acknowledge_alarm(1)
+
+        self.assertEqual(self.hmi_manager.get_active_alarm_count(), 1)
+        self.assertEqual(self.hmi_manager.get_active_alarm_count(AlarmPriority.WARNING), 0)
+        self.assertEqual(self.hmi_manager.get_active_alarm_count(AlarmPriority.CRITICAL), 1)
+
+    def test_get_alarms_is_sliceable_list(self):
+        """get_alarms()는 최신순 list 사본 (슬라이싱 가능)"""
+        for i in range(5):
+            self.hmi_manager.add_alarm(AlarmPriority.INFO, "SYSTEM", f"이벤트 {i}")
+
+        latest = self.hmi_manager.get_alarms()[:2]
+
+        self.assertEqual([a.message for a in latest], ["이벤트 4", "이벤트 3"])
+
+
+class TestExportState(unittest.TestCase):
+    """상태 내보내기 캐시 / JSON 직렬화 테스트"""
+
+    def setUp(self):
+        """테스트 초기화"""
+        self.hmi_manager = HMIStateManager()
+        self.hmi_manager.update_actual_frequencies("SW_PUMPS", {"SW-P1": 48.2, "SW-P2": 48.5})
+        self.hmi_manager.add_alarm(AlarmPriority.WARNING, "FW-P1", "주파수 편차")
+        self.hmi_manager.update_learning_progress(92.5, 88.0, 47.3, 12.0)
+
+    def assert_json_matches_state(self):
+        """export_state_json() 결과가 json.dumps(export_state())와 같은 내용인지 확인"""
+        exported = json.loads(self.hmi_manager.export_state_json())
+        expected = json.loads(json.dumps(self.hmi_manager.export_state(),
+                                         default=lambda obj: obj.isoformat()))
+
+        self.assertEqual(list(exported), list(expected))
+        # timestamp는 호출 시각이므로 순서만 확인
+        self.assertLessEqual(exported.pop("timestamp"), expected.pop("timestamp"))
+        self.assertEqual(exported, expected)
+
+    def test_json_matches_state(self):
+        """orjson 사용 시 JSON 내보내기가 export_state()와 일치 (캐시 재사용/변경 후 포함)"""
+        self.assert_json_matches_state()
+        self.assert_json_matches_state()
+
+        self.hmi_manager.update_target_frequency("SW_PUMPS", 47.0)
+        self.assert_json_matches_state()
+
+    def test_json_matches_state_without_orjson(self):
+        """orjson 미설치 시 표준 json 직렬화 결과도 export_state()와 일치"""
+        with mock.patch.object(hmi_state_manager, "orjson", None):
+            self.assert_json_matches_state()
+            self.assert_json_matches_state()
+
+            self.hmi_manager.update_target_frequency("SW_PUMPS", 47.0)
+            self.assert_json_matches_state()
+
+    def test_timestamp_is_current(self):
+        """상태 변경이 없어도 timestamp는 호출할 때마다 새로 생성"""
+        first = self.hmi_manager.export_state()
+        first_json = json.loads(self.hmi_manager.export_state_json())
+
+        with mock.patch.object(hmi_state_manager, "datetime") as mock_datetime:
+            mock_datetime.now.return_value.isoformat.return_value = "2099-01-01T00:00:00"
+            second = self.hmi_manager.export_state()
+            second_json = json.loads(self.hmi_manager.export_state_json())
+
+        self.assertEqual(second["timestamp"], "2099-01-01T00:00:00")
+        self.assertEqual(second_json["timestamp"], "2099-01-01T00:00:00")
+        self.assertNotEqual(first["timestamp"], second["timestamp"])
+        self.assertNotEqual(first_json["timestamp"], second_json["timestamp"])
+        self.assertEqual(first["groups"], second["groups"])
+
+    def test_returned_state_is_a_copy(self):
+        """반환된 상태를 수정해도 이후 내보내기(dict/JSON)는 변하지 않음"""
+        state = self.hmi_manager.export_state()
+        expected = json.loads(self.hmi_manager.export_state_json())
+
+        state["groups"]["SW_PUMPS"]["actual_frequencies"]["SW-P1"] = 0.0
+        state["groups"]["SW_PUMPS"]["avg_actual"] = 0.0
+        state["force_60hz"]["state"] = "CORRUPTED"
+        state["learning_progress"]["optimization_accuracy"] = 0.0
+
+        again = self.hmi_manager.export_state()
+        self.assertEqual(again["groups"]["SW_PUMPS"]["actual_frequencies"]["SW-P1"], 48.2)
+        self.assertAlmostEqual(again["groups"]["SW_PUMPS"]["avg_actual"], 48.35)
+        self.assertEqual(again["force_60hz"]["state"], "NORMAL")
+        self.assertEqual(again["learning_progress"]["optimization_accuracy"], 88.0)
+
+        exported = json.loads(self.hmi_manager.export_state_json())
+        exported.pop("timestamp")
+        expected.pop("timestamp")
+        self.assertEqual(exported, expected)
+
+    def test_mutators_mark_state_dirty(self):
+        """상태 변경 메서드는 모두 내보내기 캐시를 무효화"""
+        manager = self.hmi_manager
+
+        def complete_force_60hz():
+            # 전환 시작 시각을 전환 시간만큼 앞당겨 완료 처리
+            manager.force_60hz_start_time -= manager.force_60hz_duration
+            manager.update_force_60hz()
+
+        mutators = {
+            "set_control_mode": lambda: manager.set_control_mode("SW_PUMPS", ControlMode.FIXED_60HZ),
+            "update_target_frequency": lambda: manager.update_target_frequency("SW_PUMPS", 46.0),
+            "update_actual_frequency": lambda: manager.update_actual_frequency("SW_PUMPS", "SW-P1", 46.5),
+            "update_actual_frequencies": lambda: manager.update_actual_frequencies("SW_PUMPS", {"SW-P2": 46.2}),
+            "add_alarm": lambda: manager.add_alarm(AlarmPriority.INFO, "SYSTEM", "이벤트"),
+            "acknowledge_alarm": lambda: manager.acknowledge_alarm(0),
+            "start_force_60hz": manager.start_force_60hz,
+            "update_force_60hz": complete_force_60hz,
+            "reset_force_60hz": manager.reset_force_60hz,
+            "update_learning_progress": lambda: manager.update_learning_progress(93.0, 89.0, 48.0, 13.0),
+        }
+
+        for name, mutate in mutators.items():
+            with self.subTest(mutator=name):
+                manager.export_state()
+                self.assertFalse(manager._state_dirty)
+
+                mutate()
+
+                self.assertTrue(manager._state_dirty)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -8,6 +8,10 @@ import os
 import sys
 import time
 from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
 
 # UTF-8 인코딩 설정 (Windows cp949 문제 해결)
 if sys.platform == 'win32':
@@ -19,7 +23,8 @@ if sys.platform == 'win32':
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.integration.system_manager import SystemManager
-from src.integration.continuous_operation_test import ContinuousOperationTest
+from src.integration import continuous_operation_test
+from src.integration.continuous_operation_test import ContinuousOperationTest, RollingStat
 from src.integration.xavier_nx_verification import XavierNXVerification
 from src.integration.requirements_validator import RequirementsValidator
 
@@ -99,8 +104,8 @@ class TestStage12Integration(unittest.TestCase):
 
         tester = ContinuousOperationTest()
 
-        # 가속 모드: 24시간 → 24초
-        results = tester.run_test(accelerated=True)
+        # 가속 모드: 24시간 → 24주기 (주기 대기 없이 실행)
+        results = tester.run_test(accelerated=True, realtime=False)
 
         # 핵심 성공 기준 검증
         self.assertTrue(
@@ -432,6 +437,66 @@ class TestStage12Integration(unittest.TestCase):
         print(f"\n✓ 시스템 성능 벤치마킹 완료")
 
 
+class TestContinuousOperationStats(unittest.TestCase):
+    """24시간 연속 운전 테스트 누적 통계 / 주기 스케줄링 검증"""
+
+    def test_update_batch_matches_numpy(self):
+        """청크 단위 병합 결과가 전체 데이터의 평균/분산/최소/최대와 일치"""
+        rng = np.random.default_rng(0)
+        chunks = [rng.normal(50.0, 3.0, size) for size in (1, 4096, 0, 777, 4096, 13)]
+        data = np.concatenate(chunks)
+
+        stat = RollingStat()
+        for chunk in chunks:
+            stat.update_batch(chunk)
+
+        self.assertEqual(stat.n, len(data))
+        self.assertAlmostEqual(stat.mean, np.mean(data), places=9)
+        self.assertAlmostEqual(stat.M2 / stat.n, np.var(data), places=9)
+        self.assertEqual(stat.lo, data.min())
+        self.assertEqual(stat.hi, data.max())
+
+    def test_realtime_schedule_has_no_drift(self):
+        """주기 대기는 시작 시각 기준 마감 시각까지만 대기 (처리 시간이 누적되지 않음)"""
+        clock = [1000.0]
+        wakeups = []
+
+        def monotonic():
+            clock[0] += 0.1  # 호출마다 처리 시간 0.1초 소요
+            return clock[0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+            wakeups.append(clock[0])
+
+        tester = ContinuousOperationTest()
+        fake_time = SimpleNamespace(monotonic=monotonic, sleep=sleep)
+        with mock.patch.object(continuous_operation_test, 'time', fake_time):
+            tester.run_test(accelerated=True, realtime=True)
+
+        expected = [tester._sim_start + 1.0 * (i + 1) for i in range(24)]
+        np.testing.assert_allclose(wakeups, expected)
+        self.assertEqual(tester.scheduled_seconds, 24.0)
+
+    def test_realtime_mode_batch_generation(self):
+        """실시간 모드(2초 주기) 샘플은 청크 단위로 모두 반영되고 오류는 시뮬레이션 시간에 기록"""
+        tester = ContinuousOperationTest(test_duration_hours=24.0)
+        tester.rng = np.random.default_rng(0)
+
+        results = tester.run_test(accelerated=False, realtime=False)
+
+        for stat in tester.performance_data.values():
+            self.assertEqual(stat.n, 43200)
+        self.assertGreater(len(tester.system_errors), 0)
+        times = [error['time'] for error in tester.system_errors]
+        self.assertEqual(times, sorted(times))
+        for error in tester.system_errors:
+            self.assertGreaterEqual(error['time'], 0.0)
+            self.assertLess(error['time'], 24.0)
+            self.assertIn(error['type'], continuous_operation_test._ERROR_TYPES)
+        self.assertEqual(results['system_reliability']['error_count'], len(tester.system_errors))
+
+
 if __name__ == '__main__':
     # 테스트 실행
     unittest.main(verbosity=2)